@@ -32,6 +32,7 @@ from src.core.onchain_data_analyzer import OnchainDataAnalyzer
 from src.core.scenario_response_system import ScenarioResponseSystem
 from src.core.behavioral_bias_prevention import BehavioralBiasPrevention
 from src.core.advanced_performance_analytics import AdvancedPerformanceAnalytics
+from src.core.async_client import install_uvloop
 
 from src.trading.coinone_client import CoinoneClient
 from src.trading.rate_limited_client import create_rate_limited_client
@@ -2052,4 +2053,5 @@ def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     main() 
\ No newline at end of file
@@ -22,6 +22,7 @@ from src.core.multi_account_manager import (
 from src.core.multi_account_feature_manager import get_multi_account_feature_manager
 from src.core.multi_account_coordinator import get_multi_account_coordinator, TaskPriority
 from src.core.types import AccountID, AccountName, RiskLevel, KRWAmount
+from src.core.async_client import install_uvloop
 
 
 class EnhancedMultiAccountCLI:
@@ -529,4 +530,5 @@ def health():
 
 
 if __name__ == '__main__':
+    install_uvloop()
     enhanced_multi_account()
\ No newline at end of file
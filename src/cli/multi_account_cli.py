@@ -26,6 +26,7 @@ from src.core.multi_rebalancing_engine import (
 from src.core.multi_account_feature_manager import get_multi_account_feature_manager
 from src.core.multi_account_coordinator import get_multi_account_coordinator, TaskPriority
 from src.core.types import AccountID, AccountName, RiskLevel, KRWAmount
+from src.core.async_client import install_uvloop
 
 
 class MultiAccountCLI:
@@ -424,4 +425,5 @@ def health():
 
 
 if __name__ == '__main__':
+    install_uvloop()
     multi_account()
\ No newline at end of file
@@ -6,16 +6,103 @@ Asynchronous HTTP Client for KAIROS-1 System
 
 import asyncio
 import aiohttp
+import heapq
+from array import array
+import itertools
+import random
+import sys
 import time
-from typing import Dict, Any, Optional, List, Callable, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Callable, Tuple, Set, Hashable
 from enum import Enum
-import hashlib
-import json
 from loguru import logger
 
-from .exceptions import APIException, APITimeoutException, APIRateLimitException, APIClientException, APIServerException
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+try:
+    import brotli  # noqa: F401  (aiohttp/httpx의 br 응답 해제에 필요)
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    import aiodns  # noqa: F401  (aiohttp.AsyncResolver에 필요)
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx HTTP/2 지원에 필요)
+    HTTPX_AVAILABLE = True
+    _HTTPX_NETWORK_ERRORS: Tuple[type, ...] = (httpx.TransportError,)
+    _HTTPX_TIMEOUT_ERRORS: Tuple[type, ...] = (httpx.TimeoutException,)
+except ImportError:
+    HTTPX_AVAILABLE = False
+    _HTTPX_NETWORK_ERRORS = ()
+    _HTTPX_TIMEOUT_ERRORS = ()
+
+from .exceptions import (
+    APIException, APITimeoutException, APIRateLimitException, APIClientException, APIServerException,
+    APIInvalidResponseException
+)
+
+
+# 세션 기본 헤더 - 압축 응답 요청 (br은 해제 가능한 경우에만)
+SESSION_HEADERS = {
+    'User-Agent': 'KAIROS-1/1.0',
+    'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
+}
+
+
+# 재시도 간 대기 시간(초) - 시도 횟수별 지수 백오프, 실제 대기 시 ±25% 지터 적용
+_RETRY_BACKOFF = (0.1, 0.2, 0.4)
+
+# 성능 메트릭 누적 배열(array('d')) 인덱스
+_M_REQUESTS, _M_TIME, _M_HITS, _M_MISSES, _M_ERRORS = range(5)
+
+# 재시도 대상 네트워크 오류 / 타임아웃 오류
+_NETWORK_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, *_HTTPX_NETWORK_ERRORS)
+_RETRYABLE_ERRORS = (*_NETWORK_ERRORS, APIInvalidResponseException)
+_TIMEOUT_ERRORS = (asyncio.TimeoutError, *_HTTPX_TIMEOUT_ERRORS)
+
+
+@lru_cache(maxsize=256)
+def _join_url(base_url: str, url: str) -> str:
+    """base URL과 상대 경로 결합 (폴링 엔드포인트가 반복되므로 결과 캐시)"""
+    if url.startswith(('http://', 'https://')):
+        return url
+    return f"{base_url.rstrip('/')}/{url.lstrip('/')}"
+
+
+def install_uvloop() -> bool:
+    """
+    uvloop 이벤트 루프 정책 설치
+    
+    AsyncHTTPClient를 사용하는 프로세스의 진입점에서 이벤트 루프를 만들기 전
+    (asyncio.run 호출 전) 한 번 호출한다. uvloop이 없거나 Windows인 경우
+    기본 asyncio 루프를 그대로 사용한다.
+    
+    Returns:
+        uvloop 정책 설치 여부
+    """
+    if sys.platform == 'win32':
+        return False
+    
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("uvloop 이벤트 루프 정책 설치")
+    return True
 
 
 class CacheStrategy(Enum):
@@ -26,142 +113,227 @@ class CacheStrategy(Enum):
     MEMORY_AND_DISK = "memory_and_disk"
 
 
-@dataclass
-class CacheEntry:
-    """캐시 엔트리"""
-    data: Any
-    timestamp: datetime
-    ttl: int  # Time to live in seconds
-    
-    def is_expired(self) -> bool:
-        """만료 여부 확인"""
-        return datetime.now() > self.timestamp + timedelta(seconds=self.ttl)
-
-
 class AsyncCache:
     """
     비동기 캐시 시스템
     
     메모리와 디스크 기반 캐싱 지원
+    
+    엔트리는 (만료 시각(time.monotonic 기준), 데이터) 튜플로 저장된다.
+    삭제 정책은 hot/warm/cold 3단 FIFO 세그먼트(TU-Q):
+    - 새 엔트리는 hot에 들어가고, hot이 넘치면 조회된 적 있는 엔트리는
+      warm으로, 아니면 cold로 이동
+    - warm이 넘치면 조회된 엔트리는 warm에 남고, 아니면 cold로 이동
+    - 전체 한도를 넘으면 cold 앞쪽부터 삭제 (조회된 엔트리는 warm 여유가
+      있을 때 warm으로 승격)
+    조회는 touched 표시만 남기고 세그먼트를 건드리지 않으므로, 유지 비용은
+    모두 쓰기 경로에서 처리된다. 한 번만 조회되는 스캔성 요청이 자주 쓰는
+    엔트리를 밀어내지 못한다.
+    
+    모든 연산은 await 없이 끝나므로 단일 이벤트 루프 안에서 원자적이다.
+    따라서 별도의 asyncio.Lock 없이 동작한다.
     """
     
+    HOT, WARM, COLD = 0, 1, 2
+    
+    __slots__ = (
+        'max_memory_items', 'memory_cache', '_segments', '_segment_of',
+        '_segment_counts', '_capacities', '_touched', '_expiry_heap',
+        '_expiry_seq', 'hits', 'misses'
+    )
+    
     def __init__(self, max_memory_items: int = 1000):
         self.max_memory_items = max_memory_items
-        self.memory_cache: Dict[str, CacheEntry] = {}
-        self.access_times: Dict[str, datetime] = {}
-        self._lock = None  # 이벤트 루프에서 초기화됨
-        self._initialized = False
+        self.memory_cache: Dict[Hashable, Tuple[float, Any]] = {}
+        
+        # 세그먼트별 FIFO: (key, entry). entry가 memory_cache의 현재 값과
+        # 다르면 삭제/갱신된 항목이므로 꺼낼 때 건너뛴다.
+        self._segments: Tuple[deque, deque, deque] = (deque(), deque(), deque())
+        self._segment_of: Dict[Hashable, int] = {}
+        self._segment_counts = [0, 0, 0]
+        hot_capacity = max(1, max_memory_items // 3)
+        warm_capacity = max(1, max_memory_items - 2 * hot_capacity)
+        self._capacities = (hot_capacity, warm_capacity, hot_capacity)
+        self._touched: Set[Hashable] = set()
+        
+        # 만료 시각 최소 힙: (expires_at, 순번, key). 삭제/갱신된 키는 꺼낼 때 건너뜀
+        self._expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self._expiry_seq = itertools.count()
         
         # Statistics
         self.hits = 0
         self.misses = 0
     
-    async def _ensure_initialized(self):
-        """이벤트 루프에서 초기화"""
-        if not self._initialized:
-            self._lock = asyncio.Lock()
-            self._initialized = True
-    
-    async def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: Hashable) -> Optional[Any]:
         """캐시에서 데이터 조회"""
-        await self._ensure_initialized()
-        async with self._lock:
-            # 메모리 캐시 확인
-            if key in self.memory_cache:
-                entry = self.memory_cache[key]
-                
-                if entry.is_expired():
-                    # 만료된 엔트리 삭제
-                    del self.memory_cache[key]
-                    if key in self.access_times:
-                        del self.access_times[key]
-                    return None
-                
-                # 접근 시간 업데이트 (LRU)
-                self.access_times[key] = datetime.now()
-                self.hits += 1
-                return entry.data
+        # 메모리 캐시 확인
+        entry = self.memory_cache.get(key)
+        if entry is not None:
+            expires_at, data = entry
             
-            self.misses += 1
-            return None
+            if expires_at <= time.monotonic():
+                # 만료된 엔트리 삭제
+                self._remove(key)
+                return None
+            
+            # 조회 표시만 남김 (세그먼트 이동은 쓰기 시 처리)
+            self._touched.add(key)
+            self.hits += 1
+            return data
+        
+        self.misses += 1
+        return None
     
-    async def set(self, key: str, data: Any, ttl: int = 300):
+    async def set(self, key: Hashable, data: Any, ttl: int = 300):
         """캐시에 데이터 저장"""
-        await self._ensure_initialized()
-        async with self._lock:
-            # 메모리 한도 확인 및 LRU 삭제
-            if len(self.memory_cache) >= self.max_memory_items:
-                await self._evict_lru()
-            
-            # 새 엔트리 저장
-            entry = CacheEntry(
-                data=data,
-                timestamp=datetime.now(),
-                ttl=ttl
-            )
-            
-            self.memory_cache[key] = entry
-            self.access_times[key] = datetime.now()
+        # 기존 엔트리는 새 엔트리로 교체
+        self._remove(key)
+        
+        expires_at = time.monotonic() + ttl
+        entry = (expires_at, data)
+        self.memory_cache[key] = entry
+        self._push(self.HOT, key, entry)
+        self._push_expiry(expires_at, key)
+        
+        # 세그먼트 순환 및 한도 초과분 삭제
+        self._cycle()
+    
+    def _push(self, segment: int, key: Hashable, entry: Tuple[float, Any]):
+        """세그먼트 끝에 엔트리 추가"""
+        queue = self._segments[segment]
+        if len(queue) >= 2 * self.max_memory_items:
+            # 삭제/갱신으로 남은 무효 항목 정리 (분할 상환 O(1))
+            live = [(k, e) for k, e in queue if self.memory_cache.get(k) is e]
+            queue.clear()
+            queue.extend(live)
+        queue.append((key, entry))
+        self._segment_of[key] = segment
+        self._segment_counts[segment] += 1
+    
+    def _push_expiry(self, expires_at: float, key: Hashable):
+        """만료 힙에 키 추가"""
+        heap = self._expiry_heap
+        if len(heap) >= 2 * self.max_memory_items:
+            # 무효 항목 정리 (분할 상환 O(1))
+            heap[:] = [
+                item for item in heap
+                if (entry := self.memory_cache.get(item[2])) is not None and entry[0] == item[0]
+            ]
+            heapq.heapify(heap)
+        heapq.heappush(heap, (expires_at, next(self._expiry_seq), key))
+    
+    def _pop_live(self, segment: int) -> Optional[Tuple[Hashable, Tuple[float, Any]]]:
+        """세그먼트 앞에서 유효한 엔트리 하나 꺼내기"""
+        queue = self._segments[segment]
+        while queue:
+            key, entry = queue.popleft()
+            if self.memory_cache.get(key) is entry:
+                self._segment_counts[segment] -= 1
+                return key, entry
+        return None
     
-    async def _evict_lru(self):
-        """LRU 캐시 삭제"""
-        if not self.access_times:
+    def _remove(self, key: Hashable):
+        """엔트리 제거 (세그먼트 큐의 항목은 꺼낼 때 정리)"""
+        if self.memory_cache.pop(key, None) is None:
             return
+        self._segment_counts[self._segment_of.pop(key)] -= 1
+        self._touched.discard(key)
+    
+    def _cycle(self):
+        """hot -> warm/cold -> 삭제 순환"""
+        counts = self._segment_counts
+        hot_capacity, warm_capacity, _ = self._capacities
+        touched = self._touched
         
-        # 가장 오래된 접근 시간의 키 찾기
-        oldest_key = min(self.access_times.keys(), 
-                        key=lambda k: self.access_times[k])
+        while counts[self.HOT] > hot_capacity:
+            key, entry = self._pop_live(self.HOT)
+            if key in touched:
+                touched.discard(key)
+                self._push(self.WARM, key, entry)
+            else:
+                self._push(self.COLD, key, entry)
         
-        # 삭제
-        if oldest_key in self.memory_cache:
-            del self.memory_cache[oldest_key]
-        if oldest_key in self.access_times:
-            del self.access_times[oldest_key]
+        while counts[self.WARM] > warm_capacity:
+            key, entry = self._pop_live(self.WARM)
+            if key in touched:
+                touched.discard(key)
+                self._push(self.WARM, key, entry)
+            else:
+                self._push(self.COLD, key, entry)
         
-        logger.debug(f"LRU 캐시 삭제: {oldest_key}")
+        while len(self.memory_cache) > self.max_memory_items:
+            self._evict()
     
-    async def clear_expired(self):
-        """만료된 캐시 정리"""
-        await self._ensure_initialized()
-        async with self._lock:
-            expired_keys = [
-                key for key, entry in self.memory_cache.items()
-                if entry.is_expired()
-            ]
+    def _evict(self):
+        """cold 세그먼트부터 엔트리 하나 삭제"""
+        for segment in (self.COLD, self.WARM, self.HOT):
+            item = self._pop_live(segment)
+            if item is None:
+                continue
             
-            for key in expired_keys:
-                del self.memory_cache[key]
-                if key in self.access_times:
-                    del self.access_times[key]
+            key, entry = item
+            if (segment == self.COLD and key in self._touched and
+                    self._segment_counts[self.WARM] < self._capacities[self.WARM]):
+                # 조회된 cold 엔트리는 warm 여유가 있으면 승격
+                self._touched.discard(key)
+                self._push(self.WARM, key, entry)
+                return
             
-            if expired_keys:
-                logger.debug(f"만료된 캐시 정리: {len(expired_keys)}개 항목")
+            del self.memory_cache[key]
+            del self._segment_of[key]
+            self._touched.discard(key)
+            logger.debug(f"캐시 삭제: {key}")
+            return
+    
+    async def clear_expired(self):
+        """만료된 캐시 정리"""
+        now = time.monotonic()
+        heap = self._expiry_heap
+        expired_count = 0
+        
+        # 힙 맨 앞부터 만료된 항목만 꺼냄 - O(k log N)
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self.memory_cache.get(key)
+            if entry is not None and entry[0] == expires_at:
+                self._remove(key)
+                expired_count += 1
+        
+        if expired_count:
+            logger.debug(f"만료된 캐시 정리: {expired_count}개 항목")
     
-    async def delete(self, key: str):
+    async def delete(self, key: Hashable):
         """특정 키 삭제"""
-        await self._ensure_initialized()
-        async with self._lock:
-            if key in self.memory_cache:
-                del self.memory_cache[key]
-            if key in self.access_times:
-                del self.access_times[key]
+        self._remove(key)
     
     def clear_cache(self):
         """캐시 전체 삭제"""
         self.memory_cache.clear()
-        self.access_times.clear()
+        for queue in self._segments:
+            queue.clear()
+        self._segment_of.clear()
+        self._segment_counts[:] = [0, 0, 0]
+        self._touched.clear()
+        self._expiry_heap.clear()
         self.hits = 0
         self.misses = 0
     
     def get_stats(self) -> Dict[str, Any]:
-        """캐시 통계"""
+        """
+        캐시 통계 스냅샷
+        
+        await/잠금 없이 읽기만 하므로 동기 모니터링 코드에서도 호출 가능하다.
+        """
+        size = len(self.memory_cache)
+        hot, warm, cold = self._segment_counts
         return {
-            'memory_items': len(self.memory_cache),
+            'memory_items': size,
             'max_memory_items': self.max_memory_items,
-            'memory_usage_percent': len(self.memory_cache) / self.max_memory_items * 100,
-            'size': len(self.memory_cache),
+            'memory_usage_percent': size / self.max_memory_items * 100,
+            'size': size,
             'hits': self.hits,
-            'misses': self.misses
+            'misses': self.misses,
+            'segments': {'hot': hot, 'warm': warm, 'cold': cold}
         }
 
 
@@ -172,38 +344,131 @@ class ConnectionPool:
     연결 재사용을 통한 성능 최적화
     """
     
+    __slots__ = (
+        'connector', 'timeout', 'session', 'http_version',
+        'max_connections', 'max_keepalive_connections', 'keepalive_expiry',
+        'http2_client', 'connector_age_limit', '_connector_created_at',
+        '_retired_sessions'
+    )
+    
     def __init__(
         self,
         max_connections: int = 100,
         max_keepalive_connections: int = 20,
         keepalive_expiry: int = 30,
-        timeout: int = 30
+        timeout: int = 30,
+        http_version: str = "1.1",
+        connector_age_limit: int = 600
     ):
-        self.connector = aiohttp.TCPConnector(
-            limit=max_connections,
-            limit_per_host=max_keepalive_connections,
-            keepalive_timeout=keepalive_expiry,
+        """
+        Args:
+            http_version: "1.1" (aiohttp, 기본값) 또는 "2" (httpx, 단일 연결 다중화)
+            connector_age_limit: 커넥터 최대 사용 시간(초). 초과 시 새 커넥터로 교체하여
+                keepalive 만료 후 재사용되지 않는 오래된 연결 풀 문제를 회피
+        """
+        if http_version == "2" and not HTTPX_AVAILABLE:
+            logger.warning("httpx[http2]가 설치되지 않음. HTTP/1.1로 대체합니다.")
+            http_version = "1.1"
+        
+        self.http_version = http_version
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2_client = None
+        self.connector_age_limit = connector_age_limit
+        self._retired_sessions: List[aiohttp.ClientSession] = []
+        
+        self.connector = self._create_connector()
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session: Optional[aiohttp.ClientSession] = None
+    
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """TCP 커넥터 생성"""
+        self._connector_created_at = time.monotonic()
+        return aiohttp.TCPConnector(
+            resolver=self._create_resolver(),
+            limit=self.max_connections,
+            limit_per_host=self.max_keepalive_connections,
+            keepalive_timeout=self.keepalive_expiry,
             ttl_dns_cache=300,  # DNS 캐시 TTL
             use_dns_cache=True,
+            enable_cleanup_closed=True,  # 반쯤 닫힌 SSL 소켓 정리
         )
+    
+    @staticmethod
+    def _create_resolver() -> Optional[aiohttp.abc.AbstractResolver]:
+        """비동기 DNS 리졸버 생성 (aiodns 미설치 시 기본 스레드 리졸버 사용)"""
+        if not AIODNS_AVAILABLE or sys.platform == 'win32':
+            return None
         
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
-        self.session: Optional[aiohttp.ClientSession] = None
+        try:
+            return aiohttp.AsyncResolver()
+        except Exception as e:
+            logger.debug(f"AsyncResolver 생성 실패, 기본 리졸버 사용: {e}")
+            return None
     
-    async def get_session(self) -> aiohttp.ClientSession:
-        """세션 획득 (싱글톤)"""
+    def ensure_session(self) -> aiohttp.ClientSession:
+        """세션 획득 (싱글톤, 동기 버전)"""
         if self.session is None or self.session.closed:
+            if self.connector.closed:
+                # 종료된 풀을 다시 사용하는 경우 커넥터 재생성
+                self.connector = self._create_connector()
             self.session = aiohttp.ClientSession(
                 connector=self.connector,
                 timeout=self.timeout,
-                headers={'User-Agent': 'KAIROS-1/1.0'}
+                headers=SESSION_HEADERS
             )
         return self.session
     
+    async def get_session(self) -> aiohttp.ClientSession:
+        """세션 획득 (싱글톤)"""
+        if (self.session is not None and not self.session.closed and
+                time.monotonic() - self._connector_created_at > self.connector_age_limit):
+            self._recycle_connector()
+        return self.ensure_session()
+    
+    def _recycle_connector(self):
+        """오래된 커넥터 교체 (기존 세션은 진행 중인 요청이 끝날 시간을 두고 종료)"""
+        old_session = self.session
+        self._retired_sessions.append(old_session)
+        self.session = None
+        self.connector = self._create_connector()
+        
+        asyncio.get_running_loop().call_later(
+            self.timeout.total or 0, self._close_retired_session, old_session
+        )
+        logger.debug("연결 풀 커넥터 교체")
+    
+    def _close_retired_session(self, session: aiohttp.ClientSession):
+        """교체된 세션 종료"""
+        if session in self._retired_sessions:
+            self._retired_sessions.remove(session)
+            asyncio.ensure_future(session.close())
+    
+    async def get_http2_client(self) -> "httpx.AsyncClient":
+        """HTTP/2 클라이언트 획득 (싱글톤)"""
+        if self.http2_client is None or self.http2_client.is_closed:
+            self.http2_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                timeout=self.timeout.total,
+                headers=SESSION_HEADERS
+            )
+        return self.http2_client
+    
     async def close(self):
         """연결 풀 종료"""
+        for retired_session in self._retired_sessions:
+            await retired_session.close()
+        self._retired_sessions.clear()
         if self.session and not self.session.closed:
             await self.session.close()
+        if self.http2_client and not self.http2_client.is_closed:
+            await self.http2_client.aclose()
         if self.connector:
             await self.connector.close()
 
@@ -213,72 +478,84 @@ class RequestBatcher:
     요청 배치 처리기
     
     여러 요청을 배치로 처리하여 성능 최적화
+    
+    단일 소비자 코루틴이 큐에 쌓인 요청을 최대 batch_size개씩 꺼내 병렬
+    실행한다. 배치 N이 실행되는 동안 배치 N+1이 쌓이므로(파이프라이닝)
+    타이머 대기 없이 배치 크기가 부하에 맞춰 정해진다.
     """
     
+    __slots__ = ('batch_size', 'batch_timeout', '_queue', '_consumer_task')
+    
     def __init__(self, batch_size: int = 10, batch_timeout: float = 0.1):
+        """
+        Args:
+            batch_size: 배치당 최대 요청 수
+            batch_timeout: 하위 호환용 (파이프라인 방식에서는 대기하지 않음)
+        """
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
-        self.pending_requests: List[Tuple[Callable, asyncio.Future]] = []
-        self._batch_lock = None  # 이벤트 루프에서 초기화됨
-        self._initialized = False
-        self._batch_task: Optional[asyncio.Task] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Task] = None
     
-    async def _ensure_batch_initialized(self):
-        """이벤트 루프에서 초기화"""
-        if not self._initialized:
-            self._batch_lock = asyncio.Lock()
-            self._initialized = True
+    @property
+    def pending_count(self) -> int:
+        """실행 대기 중인 요청 수"""
+        return self._queue.qsize() if self._queue else 0
     
     async def add_request(self, request_func: Callable) -> Any:
         """배치에 요청 추가"""
-        future = asyncio.Future()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
         
-        await self._ensure_batch_initialized()
-        async with self._batch_lock:
-            self.pending_requests.append((request_func, future))
-            
-            # 배치 크기 확인
-            if len(self.pending_requests) >= self.batch_size:
-                await self._process_batch()
-            elif not self._batch_task:
-                # 타임아웃 배치 스케줄링
-                self._batch_task = asyncio.create_task(
-                    self._wait_and_process_batch()
-                )
+        # 소비자 코루틴은 첫 요청 시(또는 이벤트 루프가 바뀐 경우) 시작
+        task = self._consumer_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._consumer_task = asyncio.create_task(self._consumer_loop(self._queue))
         
+        self._queue.put_nowait((request_func, future))
         return await future
     
-    async def _wait_and_process_batch(self):
-        """타임아웃 후 배치 처리"""
-        await asyncio.sleep(self.batch_timeout)
-        await self._ensure_batch_initialized()
-        async with self._batch_lock:
-            await self._process_batch()
+    async def _consumer_loop(self, queue: asyncio.Queue):
+        """큐에서 배치를 꺼내 순차적으로 처리"""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            await self._process_batch(batch)
     
-    async def _process_batch(self):
+    async def _process_batch(self, batch: List[Tuple[Callable, asyncio.Future]]):
         """배치 처리 실행"""
-        if not self.pending_requests:
-            return
-        
-        batch = self.pending_requests.copy()
-        self.pending_requests.clear()
-        
-        if self._batch_task:
-            self._batch_task.cancel()
-            self._batch_task = None
-        
         # 배치 내 모든 요청을 병렬로 실행
         results = await asyncio.gather(
             *[req_func() for req_func, _ in batch],
             return_exceptions=True
         )
         
-        # 결과를 각 Future에 설정
+        # 결과를 각 Future에 설정 (취소된 호출자는 건너뜀)
         for (_, future), result in zip(batch, results):
-            if isinstance(result, Exception):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
                 future.set_exception(result)
             else:
                 future.set_result(result)
+    
+    async def close(self):
+        """소비자 코루틴 종료 및 대기 중인 요청 취소"""
+        if self._consumer_task and not self._consumer_task.done():
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+        self._consumer_task = None
+        
+        if self._queue:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
 
 
 class AsyncHTTPClient:
@@ -295,7 +572,10 @@ class AsyncHTTPClient:
         cache_ttl: int = 300,
         enable_caching: bool = True,
         enable_batching: bool = False,
-        rate_limit: Optional[Tuple[int, int]] = None  # (calls, seconds)
+        rate_limit: Optional[Tuple[int, int]] = None,  # (calls, seconds)
+        http_version: str = "1.1",
+        keepalive_expiry: int = 30,
+        max_keepalive_connections: int = 20
     ):
         self.base_url = base_url
         self.default_headers = default_headers or {}
@@ -304,49 +584,47 @@ class AsyncHTTPClient:
         self.enable_batching = enable_batching
         
         # 구성 요소 초기화
-        self.connection_pool = ConnectionPool()
+        self.connection_pool = ConnectionPool(
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http_version=http_version
+        )
         self.cache = AsyncCache() if enable_caching else None
         self.batcher = RequestBatcher() if enable_batching else None
         
-        # Session 속성 - 즉시 생성하여 tests에서 접근 가능하게 함
-        self._initialize_session()
+        # 연결 풀 한도만큼만 동시 요청 허용 (초과 요청은 aiohttp 진입 전 대기)
+        self._req_sem = asyncio.Semaphore(self.connection_pool.max_connections)
         
         # 성능 메트릭
-        self.request_count = 0
-        self.cache_hits = 0
-        self.cache_misses = 0
-        self.total_request_time = 0
+        # 요청 수, 누적 요청 시간, 캐시 히트, 캐시 미스, 오류 수
+        self._metrics = array('d', [0.0] * 5)
+        self.last_request_at = 0.0  # 마지막 요청 완료 시각 (이벤트 루프 monotonic 시각)
         
-        # Rate limiting
+        # Rate limiting (토큰 버킷: 남은 토큰 수와 마지막 충전 시각만 유지)
         if rate_limit:
             self.rate_limit_calls, self.rate_limit_window = rate_limit
-            self.rate_limit_requests: List[datetime] = []
             # Compatibility attributes for tests
             self.rate_limit = self.rate_limit_calls
             self.rate_window = self.rate_limit_window
         else:
             self.rate_limit_calls = None
             self.rate_limit_window = None
-            self.rate_limit_requests = []
             self.rate_limit = None
             self.rate_window = None
+        self._rate_tokens: Optional[float] = None  # 첫 요청 시 가득 찬 상태로 시작
+        self._rate_last_refill = 0.0
     
-    def _initialize_session(self):
-        """세션 즉시 초기화"""
-        connector = aiohttp.TCPConnector(
-            limit=100,
-            limit_per_host=20,
-            keepalive_timeout=30,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-        )
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        연결 풀의 공유 세션
         
-        timeout = aiohttp.ClientTimeout(total=30)
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
-            headers={'User-Agent': 'KAIROS-1/1.0'}
-        )
+        첫 접근 시 생성되며, close() 이후에는 닫힌 세션을 그대로 반환한다.
+        """
+        session = self.connection_pool.session
+        if session is None:
+            session = self.connection_pool.ensure_session()
+        return session
     
     async def get(
         self,
@@ -362,6 +640,43 @@ class AsyncHTTPClient:
             cache_ttl=cache_ttl, bypass_cache=bypass_cache
         )
     
+    async def get_fast(
+        self,
+        url: str,
+        params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        기본 헤더/기본 TTL GET 요청 (빠른 경로)
+        
+        헤더 오버라이드와 캐시 우회가 없는 가장 흔한 요청 형태에 특화하여
+        헤더 복사와 일반 경로의 분기를 생략한다. 캐시 키는 get()과 동일하게
+        생성되므로 두 경로가 캐시를 공유하며, 전송은 같은 _make_request 지점을 거친다.
+        """
+        if self.enable_batching:
+            return await self.get(url, params=params)
+        
+        full_url = self._build_url(url)
+        headers = self.default_headers
+        cache = self.cache
+        
+        cache_key = None
+        if self.enable_caching and cache:
+            cache_key = self._generate_cache_key('GET', full_url, params, headers)
+            cached_data = await cache.get(cache_key)
+            if cached_data is not None:
+                self._metrics[_M_HITS] += 1
+                return cached_data
+            self._metrics[_M_MISSES] += 1
+        
+        await self._check_rate_limit()
+        
+        response_data = await self._make_request('GET', full_url, params=params, headers=headers)
+        
+        if cache_key and response_data:
+            await cache.set(cache_key, response_data, self.cache_ttl)
+        
+        return response_data
+    
     async def post(
         self,
         url: str,
@@ -391,10 +706,8 @@ class AsyncHTTPClient:
         # URL 완성
         full_url = self._build_url(url)
         
-        # 헤더 병합
-        request_headers = self.default_headers.copy()
-        if headers:
-            request_headers.update(headers)
+        # 헤더 병합 (오버라이드가 없으면 기본 헤더를 복사 없이 공유, 읽기 전용으로만 사용)
+        request_headers = {**self.default_headers, **headers} if headers else self.default_headers
         
         # 캐시 키 생성 (GET 요청만)
         cache_key = None
@@ -407,33 +720,28 @@ class AsyncHTTPClient:
             # 캐시 확인
             cached_data = await self.cache.get(cache_key)
             if cached_data is not None:
-                self.cache_hits += 1
+                self._metrics[_M_HITS] += 1
                 return cached_data
             
-            self.cache_misses += 1
+            self._metrics[_M_MISSES] += 1
         
         # Rate limit 확인
         await self._check_rate_limit()
         
-        # 요청 함수 정의
-        async def make_request():
-            return await self._execute_request(
-                method, full_url, params, data, json_data, request_headers
-            )
-        
         # 배치 처리 또는 직접 실행
         if self.enable_batching and self.batcher and method == 'GET':
+            async def make_request():
+                return await self._make_request(
+                    method, full_url, params=params, data=data,
+                    json_data=json_data, headers=request_headers
+                )
+            
             response_data = await self.batcher.add_request(make_request)
         else:
-            # Check if this is being mocked for testing
-            if hasattr(self, '_make_request') and hasattr(self._make_request, '_mock_name'):
-                # If _make_request is mocked, use it for compatibility
-                response_data = await self._make_request(method, full_url, 
-                                                       params=params, data=data, 
-                                                       json_data=json_data, headers=request_headers,
-                                                       cache_ttl=cache_ttl, bypass_cache=bypass_cache)
-            else:
-                response_data = await make_request()
+            response_data = await self._make_request(
+                method, full_url, params=params, data=data,
+                json_data=json_data, headers=request_headers
+            )
         
         # 캐시 저장 (성공한 GET 요청만)
         if (cache_key and response_data and 
@@ -443,9 +751,17 @@ class AsyncHTTPClient:
         
         return response_data
     
-    async def _make_request(self, *args, **kwargs) -> Dict[str, Any]:
-        """Compatibility method for tests"""
-        return await self._request(*args, **kwargs)
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+        headers: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """요청 전송 (서브클래스/테스트에서 교체 가능한 전송 지점)"""
+        return await self._execute_request(method, url, params, data, json_data, headers)
     
     async def _execute_request(
         self,
@@ -456,82 +772,153 @@ class AsyncHTTPClient:
         json_data: Optional[Dict] = None,
         headers: Optional[Dict] = None
     ) -> Dict[str, Any]:
-        """실제 HTTP 요청 실행"""
-        start_time = time.time()
-        max_retries = 3
+        """실제 HTTP 요청 실행 (재시도 및 소요 시간 집계)"""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        send_once = (
+            self._send_http2_once if self.connection_pool.http_version == "2"
+            else self._send_once
+        )
+        max_retries = len(_RETRY_BACKOFF)
         
-        for attempt in range(max_retries):
-            try:
-                # Use the initialized session directly
-                if self.session is None or self.session.closed:
-                    self._initialize_session()
-                
-                session = self.session
-                
-                async with session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    data=data,
-                    json=json_data,
-                    headers=headers
-                ) as response:
-                    # 성능 메트릭 업데이트
-                    self.request_count += 1
-                    self.total_request_time += time.time() - start_time
+        try:
+            for attempt in range(max_retries):
+                try:
+                    return await send_once(method, url, params, data, json_data, headers)
+                except _RETRYABLE_ERRORS as e:
+                    if attempt < max_retries - 1:  # 마지막 시도가 아닌 경우
+                        # Exponential backoff + jitter (동시 재시도 분산)
+                        await asyncio.sleep(_RETRY_BACKOFF[attempt] * (0.75 + 0.5 * random.random()))
+                        continue
                     
-                    # 응답 상태 확인
-                    if response.status == 429:  # Rate limit
-                        retry_after = response.headers.get('Retry-After')
-                        raise APIRateLimitException(
-                            service=url,
-                            retry_after=int(retry_after) if retry_after else None
-                        )
-                    
-                    if response.status >= 400:
-                        error_text = await response.text()
-                        if 400 <= response.status < 500:
-                            raise APIClientException(
-                                service=url,
-                                status_code=response.status,
-                                response=error_text[:500]  # 처음 500자만
-                            )
-                        elif response.status >= 500:
-                            raise APIServerException(
-                                service=url,
-                                status_code=response.status,
-                                response=error_text[:500]  # 처음 500자만
-                            )
-                    
-                    # JSON 응답 파싱
-                    return await response.json()
-                    
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                if attempt < max_retries - 1:  # 마지막 시도가 아닌 경우
-                    await asyncio.sleep(0.1 * (2 ** attempt))  # Exponential backoff
-                    continue
-                else:
                     # 마지막 시도에서도 실패한 경우
-                    self.total_request_time += time.time() - start_time
-                    if isinstance(e, asyncio.TimeoutError):
+                    if isinstance(e, APIInvalidResponseException):
+                        raise
+                    if isinstance(e, _TIMEOUT_ERRORS):
                         raise APITimeoutException(
                             service=url,
                             timeout=30  # Default timeout
                         )
-                    else:
-                        raise APIException(f"Network error after {max_retries} attempts: {str(e)}")
-            except Exception as e:
-                self.total_request_time += time.time() - start_time
-                raise
+                    raise APIException(f"Network error after {max_retries} attempts: {str(e)}")
+            
+            # This should never be reached, but add a fallback
+            raise APIException("Unexpected error in request execution")
+        except BaseException:
+            self._metrics[_M_ERRORS] += 1
+            raise
+        finally:
+            end_time = loop.time()
+            self._metrics[_M_TIME] += end_time - start_time
+            self.last_request_at = end_time
+    
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        data: Optional[Dict],
+        json_data: Optional[Dict],
+        headers: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """HTTP/1.1 요청 1회 전송 (aiohttp)"""
+        session = await self.connection_pool.get_session()
+        
+        async with self._req_sem, session.request(
+            method=method,
+            url=url,
+            params=params,
+            data=data,
+            json=json_data,
+            headers=headers
+        ) as response:
+            self._metrics[_M_REQUESTS] += 1
+            
+            # 응답 상태 확인
+            if response.status >= 400:
+                error_text = '' if response.status == 429 else (
+                    (await response.read()).decode('utf-8', errors='replace')
+                )
+                self._raise_for_status(
+                    url, response.status, response.headers.get('Retry-After'), error_text
+                )
+            
+            # 본문을 바이트로 읽어 바로 파싱
+            return self._parse_body(url, await response.read())
+    
+    async def _send_http2_once(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        data: Optional[Dict],
+        json_data: Optional[Dict],
+        headers: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """HTTP/2 요청 1회 전송 (httpx, 단일 연결 다중화)"""
+        client = await self.connection_pool.get_http2_client()
+        
+        async with self._req_sem:
+            response = await client.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                json=json_data,
+                headers=headers
+            )
+        
+        self._metrics[_M_REQUESTS] += 1
+        
+        if response.status_code >= 400:
+            self._raise_for_status(
+                url, response.status_code, response.headers.get('Retry-After'), response.text
+            )
+        
+        return self._parse_body(url, response.content)
+    
+    @staticmethod
+    def _parse_body(url: str, raw: bytes) -> Any:
+        """응답 본문 JSON 파싱 (JSON이 아닌 본문은 APIInvalidResponseException)"""
+        if not raw:
+            return None
+        try:
+            return _json_loads(raw)
+        except ValueError as e:  # orjson.JSONDecodeError / json.JSONDecodeError 모두 ValueError
+            raise APIInvalidResponseException(
+                service=url,
+                response=raw[:500].decode('utf-8', errors='replace')  # 처음 500바이트만
+            ) from e
+    
+    @staticmethod
+    def _raise_for_status(
+        url: str,
+        status: int,
+        retry_after: Optional[str],
+        error_text: str
+    ):
+        """오류 응답 상태를 예외로 변환"""
+        if status == 429:  # Rate limit
+            raise APIRateLimitException(
+                service=url,
+                retry_after=int(retry_after) if retry_after else None
+            )
+        
+        if status < 500:
+            raise APIClientException(
+                service=url,
+                status_code=status,
+                response=error_text[:500]  # 처음 500자만
+            )
         
-        # This should never be reached, but add a fallback
-        raise APIException("Unexpected error in request execution")
+        raise APIServerException(
+            service=url,
+            status_code=status,
+            response=error_text[:500]  # 처음 500자만
+        )
     
     def _build_url(self, url: str) -> str:
         """URL 완성"""
-        if url.startswith(('http://', 'https://')):
-            return url
-        return f"{self.base_url.rstrip('/')}/{url.lstrip('/')}"
+        return _join_url(self.base_url, url)
     
     def _generate_cache_key(
         self,
@@ -539,18 +926,21 @@ class AsyncHTTPClient:
         url: str,
         params: Optional[Dict],
         headers: Dict[str, str]
-    ) -> str:
-        """캐시 키 생성"""
-        # 캐시에 영향을 주는 요소들을 해시
-        key_data = {
-            'method': method,
-            'url': url,
-            'params': sorted(params.items()) if params else None,
-            'auth_header': headers.get('Authorization', '')[:20]  # 인증 정보 일부만
-        }
+    ) -> Tuple[Hashable, ...]:
+        """캐시 키 생성 (프로세스 내부 전용이므로 해시 대신 튜플 사용)"""
+        params_key = tuple(sorted(params.items())) if params else ()
+        try:
+            hash(params_key)
+        except TypeError:
+            # 리스트 등 해시 불가능한 파라미터 값
+            params_key = repr(params_key)
         
-        key_string = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        return (
+            method,
+            url,
+            params_key,
+            headers.get('Authorization', '')[:20]  # 인증 정보 일부만
+        )
     
     async def _check_rate_limit(self):
         """Rate limit 확인"""
@@ -561,51 +951,89 @@ class AsyncHTTPClient:
         if not calls_limit:
             return
         
-        now = datetime.now()
+        now = time.monotonic()
         
-        # 윈도우 외 요청 제거
-        self.rate_limit_requests = [
-            req_time for req_time in self.rate_limit_requests
-            if (now - req_time).total_seconds() < window
-        ]
+        # 경과 시간만큼 토큰 충전 (버킷 크기 = calls_limit)
+        if self._rate_tokens is None:
+            tokens = float(calls_limit)
+        else:
+            refill = (now - self._rate_last_refill) * calls_limit / window
+            tokens = min(float(calls_limit), self._rate_tokens + refill)
+        self._rate_last_refill = now
         
-        # Rate limit 확인
-        if len(self.rate_limit_requests) >= calls_limit:
-            oldest_request = min(self.rate_limit_requests)
-            wait_time = window - (now - oldest_request).total_seconds()
-            
-            if wait_time > 0:
-                # 실제로 대기
-                await asyncio.sleep(wait_time)
+        # 토큰 차감 - 음수면 부족분만큼 대기 (동시 대기자는 순서대로 더 오래 대기)
+        tokens -= 1
+        self._rate_tokens = tokens
+        if tokens < 0:
+            await asyncio.sleep(-tokens * window / calls_limit)
+    
+    async def warm_up(self, url: str = "") -> bool:
+        """
+        연결 예열
         
-        # 현재 요청 기록
-        self.rate_limit_requests.append(now)
+        HEAD 요청으로 TCP/TLS 연결을 미리 열어 풀에 keep-alive 상태로 보관한다.
+        캐시/재시도/메트릭을 거치지 않으며 실패해도 예외를 던지지 않는다.
+        """
+        full_url = self._build_url(url)
+        try:
+            if self.connection_pool.http_version == "2":
+                client = await self.connection_pool.get_http2_client()
+                await client.head(full_url, headers=self.default_headers)
+            else:
+                session = await self.connection_pool.get_session()
+                async with session.head(full_url, headers=self.default_headers) as response:
+                    await response.release()
+            self.last_request_at = asyncio.get_running_loop().time()
+            return True
+        except Exception as e:
+            logger.debug(f"연결 예열 실패: {full_url} - {e}")
+            return False
     
     async def close(self):
         """클라이언트 종료"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        if self.batcher:
+            await self.batcher.close()
         await self.connection_pool.close()
-        self.session = None
+    
+    @property
+    def request_count(self) -> int:
+        """응답을 받은 요청 수"""
+        return int(self._metrics[_M_REQUESTS])
+    
+    @property
+    def total_request_time(self) -> float:
+        """누적 요청 시간(초)"""
+        return self._metrics[_M_TIME]
+    
+    @property
+    def cache_hits(self) -> int:
+        """캐시 히트 수"""
+        return int(self._metrics[_M_HITS])
+    
+    @property
+    def cache_misses(self) -> int:
+        """캐시 미스 수"""
+        return int(self._metrics[_M_MISSES])
     
     def get_performance_stats(self) -> Dict[str, Any]:
-        """성능 통계"""
-        avg_request_time = (
-            self.total_request_time / self.request_count
-            if self.request_count > 0 else 0
-        )
+        """
+        성능 통계 스냅샷
         
-        cache_hit_rate = (
-            self.cache_hits / (self.cache_hits + self.cache_misses)
-            if (self.cache_hits + self.cache_misses) > 0 else 0
-        )
+        메트릭 배열을 한 번에 언패킹하여 일관된 값을 읽으며, await/잠금이 없어
+        동기 모니터링 코드에서도 호출 가능하다.
+        """
+        request_count, total_time, hits, misses, errors = self._metrics
+        
+        avg_request_time = total_time / request_count if request_count > 0 else 0
+        cache_hit_rate = hits / (hits + misses) if (hits + misses) > 0 else 0
         
         stats = {
-            'request_count': self.request_count,
+            'request_count': int(request_count),
             'avg_request_time': round(avg_request_time, 3),
             'cache_hit_rate': round(cache_hit_rate, 3),
-            'cache_hits': self.cache_hits,
-            'cache_misses': self.cache_misses,
+            'cache_hits': int(hits),
+            'cache_misses': int(misses),
+            'error_count': int(errors),
         }
         
         if self.cache:
@@ -6,20 +6,32 @@ Base Service Classes
 
 import abc
 import asyncio
-from typing import Dict, Any, Optional, List, Type, TypeVar, Generic
-from datetime import datetime
+import bisect
+import functools
+import heapq
+import inspect
+import itertools
+import math
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Deque, Dict, Any, Callable, Optional, List, Set, Tuple, Type, TypeVar, Generic
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 from loguru import logger
 
-from .exceptions import KairosException, ConfigurationException
+from .exceptions import KairosException, LazyKairosException, ConfigurationException
 from .resilience import RetryManager, CircuitBreaker, RetryConfig, CircuitBreakerConfig
 from .async_client import AsyncHTTPClient
+from .health_state import SharedHealthState
 
 
 T = TypeVar('T')
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceConfig:
     """서비스 기본 설정"""
     name: str
@@ -37,14 +49,81 @@ class ServiceConfig:
 
 class ServiceStatus:
     """서비스 상태"""
+    
+    __slots__ = (
+        'name', '_started_at', '_started_at_iso', '_last_health_check',
+        '_last_health_check_iso', '_last_health_check_mono', '_is_healthy',
+        '_health_listener', 'error_count', 'last_error', 'metrics'
+    )
+    
     def __init__(self, name: str):
         self.name = name
         self.started_at: Optional[datetime] = None
         self.last_health_check: Optional[datetime] = None
+        self._health_listener: Optional[Callable[[str, bool], None]] = None
         self.is_healthy = False
         self.error_count = 0
         self.last_error: Optional[Exception] = None
         self.metrics: Dict[str, Any] = {}
+    
+    @property
+    def is_healthy(self) -> bool:
+        return self._is_healthy
+    
+    @is_healthy.setter
+    def is_healthy(self, value: bool):
+        # 상태가 바뀔 때만 리스너(레지스트리)에 통지
+        changed = value != getattr(self, '_is_healthy', None)
+        self._is_healthy = value
+        if changed and self._health_listener is not None:
+            self._health_listener(self.name, value)
+    
+    # 시각은 기록 시점에 ISO 문자열도 함께 저장 (상태 조회 시 포맷 비용 제거)
+    @property
+    def started_at(self) -> Optional[datetime]:
+        return self._started_at
+    
+    @started_at.setter
+    def started_at(self, value: Optional[datetime]):
+        self._started_at = value
+        self._started_at_iso = value.isoformat() if value else None
+    
+    @property
+    def last_health_check(self) -> Optional[datetime]:
+        # 헬스체크 루프는 monotonic 시각만 기록 - 벽시계 시각은 조회 시 한 번만 변환
+        if self._last_health_check is None and self._last_health_check_mono is not None:
+            elapsed = time.monotonic() - self._last_health_check_mono
+            self._last_health_check = datetime.now() - timedelta(seconds=elapsed)
+        return self._last_health_check
+    
+    @last_health_check.setter
+    def last_health_check(self, value: Optional[datetime]):
+        self._last_health_check = value
+        self._last_health_check_iso = value.isoformat() if value else None
+        self._last_health_check_mono = None
+    
+    @property
+    def last_health_check_iso(self) -> Optional[str]:
+        if self._last_health_check_iso is None:
+            last_check = self.last_health_check
+            if last_check is not None:
+                self._last_health_check_iso = last_check.isoformat()
+        return self._last_health_check_iso
+    
+    def mark_health_check(self, now_mono: float):
+        """헬스체크 시각 기록 (monotonic 초)"""
+        self._last_health_check_mono = now_mono
+        self._last_health_check = None
+        self._last_health_check_iso = None
+
+
+def _is_async_callable(func: Callable) -> bool:
+    """코루틴 함수 여부 (functools.partial, async __call__ 객체 포함)"""
+    while isinstance(func, functools.partial):
+        func = func.func
+    return asyncio.iscoroutinefunction(func) or asyncio.iscoroutinefunction(
+        getattr(func, '__call__', None)
+    )
 
 
 class BaseService(abc.ABC):
@@ -54,6 +133,15 @@ class BaseService(abc.ABC):
     모든 서비스가 상속받아야 하는 추상 기본 클래스
     """
     
+    # 서브클래스는 __slots__를 선언하지 않으면 __dict__를 가지므로 자유롭게 속성 추가 가능
+    __slots__ = (
+        'config', 'status', 'retry_manager', 'circuit_breaker',
+        '_health_check_task', '_managed_health_check'
+    )
+    
+    # 동기 함수 실행용 공유 스레드 풀 (서비스 간 공유하여 스레드 수 제한)
+    _sync_executor = ThreadPoolExecutor(thread_name_prefix="kairos-service")
+    
     def __init__(self, config: ServiceConfig):
         self.config = config
         self.status = ServiceStatus(config.name)
@@ -62,8 +150,9 @@ class BaseService(abc.ABC):
         self.retry_manager = RetryManager(config.retry_config)
         self.circuit_breaker = CircuitBreaker(config.name, config.circuit_breaker_config)
         
-        # 헬스체크 태스크
+        # 헬스체크 태스크 (레지스트리 스케줄러가 관리하는 경우 생성하지 않음)
         self._health_check_task: Optional[asyncio.Task] = None
+        self._managed_health_check = False
         
         logger.info(f"서비스 초기화: {self.config.name}")
     
@@ -94,7 +183,7 @@ class BaseService(abc.ABC):
             self.status.is_healthy = True
             
             # 헬스체크 스케줄링
-            if self.config.health_check_interval > 0:
+            if self.config.health_check_interval > 0 and not self._managed_health_check:
                 self._health_check_task = asyncio.create_task(
                     self._periodic_health_check()
                 )
@@ -131,47 +220,98 @@ class BaseService(abc.ABC):
         while True:
             try:
                 await asyncio.sleep(self.config.health_check_interval)
-                
-                is_healthy = await self.health_check()
-                self.status.is_healthy = is_healthy
-                self.status.last_health_check = datetime.now()
-                
-                if not is_healthy:
-                    logger.warning(f"⚠️ 헬스체크 실패: {self.config.name}")
-                
+                await self.run_health_check(time.monotonic())
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                self.status.last_error = e
-                self.status.error_count += 1
-                self.status.is_healthy = False
-                logger.error(f"❌ 헬스체크 오류: {self.config.name} - {e}")
+    
+    async def run_health_check(self, now_mono: Optional[float] = None):
+        """
+        헬스체크 1회 수행 및 상태 반영
+        
+        Args:
+            now_mono: 이번 주기의 시각 (time.monotonic). 스케줄러가 한 번 구한 값을 공유
+        """
+        if now_mono is None:
+            now_mono = time.monotonic()
+        
+        try:
+            # 응답 없는 헬스체크가 다음 주기를 막지 않도록 주기보다 짧은 타임아웃 적용
+            is_healthy = await asyncio.wait_for(
+                self.health_check(), timeout=self.config.health_check_interval * 0.9 or None
+            )
+            self.status.is_healthy = is_healthy
+            self.status.mark_health_check(now_mono)
+            
+            if not is_healthy:
+                logger.warning(f"⚠️ 헬스체크 실패: {self.config.name}")
+            
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError as e:
+            self.status.last_error = e
+            self.status.error_count += 1
+            self.status.is_healthy = False
+            self.status.mark_health_check(now_mono)
+            logger.error(f"❌ 헬스체크 시간 초과: {self.config.name}")
+        except Exception as e:
+            self.status.last_error = e
+            self.status.error_count += 1
+            self.status.is_healthy = False
+            logger.error(f"❌ 헬스체크 오류: {self.config.name} - {e}")
     
     async def execute_with_resilience(self, func, *args, **kwargs):
         """복원력 패턴이 적용된 함수 실행"""
         try:
-            return await asyncio.to_thread(
-                lambda: self.circuit_breaker.call(
-                    lambda: self.retry_manager.retry(func, *args, **kwargs)
+            # 재시도가 바깥 루프 - 매 시도 전 서킷 상태를 확인하여 OPEN이면 즉시 중단
+            if _is_async_callable(func):
+                # 코루틴은 이벤트 루프에서 직접 실행 (스레드 홉 없음)
+                return await self.retry_manager.retry_with_breaker_async(
+                    self.circuit_breaker, func, *args, **kwargs
+                )
+            
+            # 동기 함수는 매 시도마다 공유 스레드 풀에서 실행하고, awaitable을 반환하는 경우
+            # (코루틴을 반환하는 lambda 등) 그 완료까지를 한 번의 시도로 보아 재시도/서킷에 반영
+            loop = asyncio.get_running_loop()
+            executor = self._sync_executor
+            
+            async def attempt(*call_args, **call_kwargs):
+                result = await loop.run_in_executor(
+                    executor, functools.partial(func, *call_args, **call_kwargs)
                 )
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            
+            return await self.retry_manager.retry_with_breaker_async(
+                self.circuit_breaker, attempt, *args, **kwargs
             )
         except Exception as e:
             self.status.last_error = e
             self.status.error_count += 1
             raise
     
-    def get_status(self) -> Dict[str, Any]:
-        """서비스 상태 조회"""
+    def set_health_listener(self, listener: Optional[Callable[[str, bool], None]]):
+        """헬스 상태 변경 시 (이름, 건강 여부)로 호출될 콜백 등록"""
+        self.status._health_listener = listener
+    
+    def get_status(self, readonly_metrics: bool = False) -> Dict[str, Any]:
+        """
+        서비스 상태 조회
+        
+        Args:
+            readonly_metrics: True면 metrics를 복사 없이 읽기 전용 뷰로 반환
+        """
+        status = self.status
         return {
-            'name': self.status.name,
+            'name': status.name,
             'enabled': self.config.enabled,
-            'started_at': self.status.started_at.isoformat() if self.status.started_at else None,
-            'is_healthy': self.status.is_healthy,
-            'last_health_check': self.status.last_health_check.isoformat() if self.status.last_health_check else None,
-            'error_count': self.status.error_count,
-            'last_error': str(self.status.last_error) if self.status.last_error else None,
+            'started_at': status._started_at_iso,
+            'is_healthy': status.is_healthy,
+            'last_health_check': status.last_health_check_iso,
+            'error_count': status.error_count,
+            'last_error': str(status.last_error) if status.last_error else None,
             'circuit_breaker': self.circuit_breaker.get_state(),
-            'metrics': self.status.metrics.copy()
+            'metrics': MappingProxyType(status.metrics) if readonly_metrics else status.metrics.copy()
         }
 
 
@@ -182,31 +322,72 @@ class HTTPService(BaseService):
     API 클라이언트 서비스들의 공통 기능
     """
     
+    # keep-alive 연결 유지 시간 (초) 및 호스트당 유지 연결 수
+    KEEPALIVE_TIMEOUT = 75
+    KEEPALIVE_CONNECTIONS = 32
+    
     def __init__(self, config: ServiceConfig, base_url: str, default_headers: Optional[Dict] = None):
         super().__init__(config)
         self.base_url = base_url
         self.client = AsyncHTTPClient(
             base_url=base_url,
-            default_headers=default_headers or {}
+            default_headers=default_headers or {},
+            keepalive_expiry=self.KEEPALIVE_TIMEOUT,
+            max_keepalive_connections=self.KEEPALIVE_CONNECTIONS
         )
+        self._warm_pool_task: Optional[asyncio.Task] = None
+        
+        # HTTP 메서드별 요청 함수 (AsyncHTTPClient가 제공하는 메서드만)
+        self._method_dispatch: Dict[str, Callable] = {
+            'GET': self.client.get,
+            'POST': self.client.post,
+        }
     
     async def start(self):
         """HTTP 서비스 시작"""
         # 연결 테스트
         await self.health_check()
+        
+        # 연결 풀 예열 및 유휴 연결 유지 (백그라운드)
+        if self._warm_pool_task is None or self._warm_pool_task.done():
+            self._warm_pool_task = asyncio.create_task(self._keep_pool_warm())
     
     async def stop(self):
         """HTTP 서비스 종료"""
+        if self._warm_pool_task:
+            self._warm_pool_task.cancel()
+            try:
+                await self._warm_pool_task
+            except asyncio.CancelledError:
+                pass
+            self._warm_pool_task = None
+        
         if self.client:
             await self.client.close()
     
+    async def _keep_pool_warm(self):
+        """
+        연결 풀 예열 루프
+        
+        시작 직후 HEAD 요청으로 연결을 열어두고, 이후 keep-alive 만료 전에
+        (유휴 시간이 KEEPALIVE_TIMEOUT/2를 넘으면) 다시 요청하여 연결을 유지한다.
+        """
+        interval = self.KEEPALIVE_TIMEOUT / 2
+        loop = asyncio.get_running_loop()
+        await self.client.warm_up()
+        
+        while True:
+            await asyncio.sleep(interval)
+            if loop.time() - self.client.last_request_at >= interval:
+                await self.client.warm_up()
+    
     async def health_check(self) -> bool:
         """HTTP 헬스체크"""
         try:
             # 기본적으로 base URL에 대한 간단한 요청
             health_url = self.get_health_check_url()
             if health_url:
-                response = await self.client.get(health_url)
+                response = await self.client.get_fast(health_url)
                 return self.validate_health_response(response)
             return True
         except Exception as e:
@@ -223,26 +404,58 @@ class HTTPService(BaseService):
     
     async def make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """복원력이 적용된 HTTP 요청"""
-        async def _request():
-            if method.upper() == 'GET':
-                return await self.client.get(endpoint, **kwargs)
-            elif method.upper() == 'POST':
-                return await self.client.post(endpoint, **kwargs)
-            else:
-                raise NotImplementedError(f"지원하지 않는 HTTP 메서드: {method}")
+        handler = self._method_dispatch.get(method.upper())
+        if handler is None:
+            raise NotImplementedError(f"지원하지 않는 HTTP 메서드: {method}")
         
-        return await self.execute_with_resilience(_request)
+        return await self.execute_with_resilience(handler, endpoint, **kwargs)
+
+
+# 헬스체크 확인 쿼리 실행 중인지 (확인 쿼리는 성공 시각을 기록하지 않음)
+_HEALTH_PING: ContextVar[bool] = ContextVar('_health_ping', default=False)
+
+
+def _record_query_success(execute_query: Callable) -> Callable:
+    """
+    execute_query 성공 시 마지막 성공 시각을 기록하는 래퍼
+    
+    super()로 호출된 상위 클래스의 구현이 아니라 가장 하위 클래스의 execute_query가
+    성공했을 때만 기록한다.
+    """
+    
+    @functools.wraps(execute_query)
+    async def wrapper(self, *args, **kwargs):
+        result = await execute_query(self, *args, **kwargs)
+        if type(self).execute_query is wrapper and not _HEALTH_PING.get():
+            self._last_success_ts = time.monotonic()
+        return result
+    
+    wrapper._records_success = True
+    return wrapper
 
 
 class DatabaseService(BaseService):
     """
     데이터베이스 서비스 기본 클래스
+    
+    서브클래스가 구현한 execute_query는 성공 시각을 기록하도록 감싸져,
+    최근 쿼리가 성공했다면 헬스체크의 확인 쿼리를 생략한다.
     """
     
+    # 헬스체크 쿼리 타임아웃 (초)
+    HEALTH_CHECK_TIMEOUT = 2
+    
     def __init__(self, config: ServiceConfig, connection_string: str):
         super().__init__(config)
         self.connection_string = connection_string
         self.connection = None
+        self._last_success_ts: Optional[float] = None  # 마지막 쿼리 성공 시각 (monotonic)
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        execute_query = cls.__dict__.get('execute_query')
+        if execute_query is not None and not getattr(execute_query, '_records_success', False):
+            cls.execute_query = _record_query_success(execute_query)
     
     @abc.abstractmethod
     async def connect(self):
@@ -269,9 +482,19 @@ class DatabaseService(BaseService):
     
     async def health_check(self) -> bool:
         """데이터베이스 헬스체크"""
+        # 헬스체크 주기 안에 실제 쿼리가 성공했다면 별도 확인 쿼리 생략
+        if (self._last_success_ts is not None and
+                time.monotonic() - self._last_success_ts < self.config.health_check_interval):
+            return True
+        
         try:
-            # 간단한 쿼리로 연결 상태 확인
-            await self.execute_query("SELECT 1")
+            # 간단한 쿼리로 연결 상태 확인 (응답 없는 연결이 헬스체크 루프를 막지 않도록 타임아웃)
+            # 확인 쿼리는 성공 시각을 기록하지 않아야 다음 헬스체크도 연결을 실제로 확인한다
+            token = _HEALTH_PING.set(True)
+            try:
+                await asyncio.wait_for(self.execute_query("SELECT 1"), timeout=self.HEALTH_CHECK_TIMEOUT)
+            finally:
+                _HEALTH_PING.reset(token)
             return True
         except Exception as e:
             logger.warning(f"DB 헬스체크 실패: {self.config.name} - {e}")
@@ -285,9 +508,59 @@ class ServiceRegistry:
     모든 서비스를 중앙에서 관리
     """
     
-    def __init__(self):
+    # 다른 워커가 기록한 공유 헬스 상태를 다시 읽는 주기 (초)
+    SHARED_STATUS_REFRESH_INTERVAL = 1.0
+    
+    def __init__(self, shared_state_path: Optional[str] = None):
+        """
+        Args:
+            shared_state_path: 지정 시 헬스체크 결과를 이 파일(mmap)에 기록하여
+                같은 파일을 쓰는 다른 워커 프로세스와 상태를 공유
+        """
         self.services: Dict[str, BaseService] = {}
-        self._startup_order: List[str] = []
+        # (우선순위, 등록 순번, 이름) 정렬 리스트 - 같은 우선순위는 등록 순서 유지
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+        self._sorted: List[Tuple[int, int, str]] = []
+        self._counter = itertools.count()
+        
+        # 상태 조회 결과 캐시 (메트릭 스크레이프 등 반복 조회용)
+        self._status_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._status_cache_ts: float = 0.0
+        
+        # 헬스 상태별 서비스 이름 (상태 전환 시점에 갱신)
+        self._healthy: Set[str] = set()
+        self._unhealthy: Set[str] = set()
+        
+        # start_all로 시작한 서비스들의 헬스체크를 하나의 루프에서 수행
+        # 힙 항목: (다음 실행 시각, 순번, 서비스 이름, 서비스)
+        self._health_scheduler_task: Optional[asyncio.Task] = None
+        self._health_heap: List[Tuple[float, int, str, BaseService]] = []
+        self._health_seq = itertools.count()
+        self._health_pending: Deque[BaseService] = deque()  # 스케줄러 실행 중 등록된 서비스
+        self._health_wakeup: Optional[asyncio.Event] = None
+        self._health_tasks: Dict[str, asyncio.Task] = {}  # 서비스별 진행 중인 헬스체크
+        
+        # 워커 간 공유 헬스 상태 (stop_all에서 닫고 start_all에서 다시 연다)
+        self._shared_state_path = shared_state_path
+        self._shared_state: Optional[SharedHealthState] = (
+            SharedHealthState(shared_state_path) if shared_state_path else None
+        )
+        # 다른 워커 상태의 메모리 스냅샷 (이벤트 루프 밖에서 주기적으로 갱신, get_all_status는 이것만 읽음)
+        self._shared_snapshot: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._shared_refresh_task: Optional[asyncio.Task] = None
+    
+    def _invalidate_status_cache(self):
+        """상태 조회 캐시 무효화"""
+        self._status_cache = None
+    
+    def _notify_health_change(self, name: str, is_healthy: bool):
+        """서비스 헬스 상태 전환 통지"""
+        if is_healthy:
+            self._unhealthy.discard(name)
+            self._healthy.add(name)
+        else:
+            self._healthy.discard(name)
+            self._unhealthy.add(name)
     
     def register(self, service: BaseService, startup_priority: int = 0):
         """서비스 등록"""
@@ -297,80 +570,353 @@ class ServiceRegistry:
             raise ConfigurationException(f"이미 등록된 서비스: {name}")
         
         self.services[name] = service
+        self._notify_health_change(name, service.status.is_healthy)
+        service.set_health_listener(self._notify_health_change)
         
-        # 시작 순서 관리 (우선순위별)
-        self._startup_order.append(name)
-        self._startup_order.sort(key=lambda n: startup_priority)
+        # 시작 순서 관리 (우선순위별, O(log N) 탐색 후 삽입)
+        entry = (startup_priority, next(self._counter), name)
+        self._entries[name] = entry
+        bisect.insort(self._sorted, entry)
+        self._invalidate_status_cache()
+        
+        # 스케줄러 실행 중 등록된 서비스도 같은 스케줄러에서 헬스체크 (자체 태스크가 이미 있으면 제외)
+        if (self._health_scheduler_task is not None and not self._health_scheduler_task.done()
+                and service._health_check_task is None):
+            service._managed_health_check = True
+            if self._wants_health_check(service):
+                self._health_pending.append(service)
+                self._health_wakeup.set()
         
         logger.info(f"서비스 등록: {name}")
     
     def unregister(self, name: str):
         """서비스 등록 해제"""
         if name in self.services:
-            del self.services[name]
-            if name in self._startup_order:
-                self._startup_order.remove(name)
+            self.services.pop(name).set_health_listener(None)
+            self._health_tasks.pop(name, None)
+            self._healthy.discard(name)
+            self._unhealthy.discard(name)
+            entry = self._entries.pop(name, None)
+            if entry is not None:
+                # 항목 위치는 이분 탐색으로 찾아 삭제 (선형 비교 스캔 없음)
+                del self._sorted[bisect.bisect_left(self._sorted, entry)]
+            self._invalidate_status_cache()
             logger.info(f"서비스 등록 해제: {name}")
     
     def get_service(self, name: str) -> Optional[BaseService]:
         """서비스 조회"""
         return self.services.get(name)
     
+    def _priority_tiers(self) -> List[List[str]]:
+        """우선순위 오름차순으로 묶은 서비스 이름 목록"""
+        return [
+            [name for _, _, name in tier]
+            for _, tier in itertools.groupby(self._sorted, key=lambda entry: entry[0])
+        ]
+    
     async def start_all(self):
-        """모든 서비스 시작"""
+        """모든 서비스 시작 (같은 우선순위는 동시에 시작)"""
         logger.info("모든 서비스 시작 중...")
         
-        for name in self._startup_order:
-            service = self.services[name]
-            try:
-                await service.initialize()
-            except Exception as e:
-                logger.error(f"서비스 시작 실패: {name} - {e}")
-                # 의존성에 따라 계속 진행하거나 중단 결정
-                # 여기서는 로그만 남기고 계속 진행
+        # 헬스체크는 서비스별 태스크 대신 레지스트리 스케줄러가 수행
+        for service in self.services.values():
+            service._managed_health_check = True
+        
+        for tier in self._priority_tiers():
+            results = await asyncio.gather(
+                *(self.services[name].initialize() for name in tier),
+                return_exceptions=True
+            )
+            for name, result in zip(tier, results):
+                if isinstance(result, Exception):
+                    logger.error(f"서비스 시작 실패: {name} - {result}")
+                    # 의존성에 따라 계속 진행하거나 중단 결정
+                    # 여기서는 로그만 남기고 계속 진행
         
+        self._invalidate_status_cache()
+        if self._shared_state is None and self._shared_state_path:
+            self._shared_state = SharedHealthState(self._shared_state_path)
+        await self._persist_status(self.services.values())
+        if self._shared_state is not None and (
+                self._shared_refresh_task is None or self._shared_refresh_task.done()):
+            await self._refresh_shared_status()
+            self._shared_refresh_task = asyncio.create_task(self._shared_refresh_loop())
+        self._start_health_scheduler()
         logger.info("✅ 모든 서비스 시작 완료")
     
     async def stop_all(self):
-        """모든 서비스 종료 (역순)"""
+        """모든 서비스 종료 (우선순위 역순, 같은 우선순위는 동시에 종료)"""
         logger.info("모든 서비스 종료 중...")
         
-        # 시작 순서의 역순으로 종료
-        for name in reversed(self._startup_order):
-            service = self.services[name]
+        await self._stop_health_scheduler()
+        if self._shared_refresh_task is not None:
+            self._shared_refresh_task.cancel()
             try:
-                await service.shutdown()
-            except Exception as e:
-                logger.error(f"서비스 종료 실패: {name} - {e}")
+                await self._shared_refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._shared_refresh_task = None
+        
+        for tier in reversed(self._priority_tiers()):
+            results = await asyncio.gather(
+                *(self.services[name].shutdown() for name in tier),
+                return_exceptions=True
+            )
+            for name, result in zip(tier, results):
+                if isinstance(result, Exception):
+                    logger.error(f"서비스 종료 실패: {name} - {result}")
         
+        if self._shared_state is not None:
+            self._shared_state.close()
+            self._shared_state = None
+        self._shared_snapshot = {}
+        
+        self._invalidate_status_cache()
         logger.info("✅ 모든 서비스 종료 완료")
     
-    def get_all_status(self) -> Dict[str, Dict[str, Any]]:
-        """모든 서비스 상태 조회"""
-        return {
+    def _start_health_scheduler(self):
+        """헬스체크 스케줄러 시작"""
+        if self._health_scheduler_task is None or self._health_scheduler_task.done():
+            now = asyncio.get_running_loop().time()
+            self._health_heap = []
+            self._health_pending.clear()
+            self._health_wakeup = asyncio.Event()
+            for service in self.services.values():
+                if service._managed_health_check and self._wants_health_check(service):
+                    self._schedule_health_check(service, now)
+            self._health_scheduler_task = asyncio.create_task(self._health_scheduler())
+    
+    async def _stop_health_scheduler(self):
+        """헬스체크 스케줄러 및 진행 중인 헬스체크 종료"""
+        if self._health_scheduler_task:
+            self._health_scheduler_task.cancel()
+            try:
+                await self._health_scheduler_task
+            except asyncio.CancelledError:
+                pass
+            self._health_scheduler_task = None
+        
+        tasks = list(self._health_tasks.values())
+        self._health_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    @staticmethod
+    def _wants_health_check(service: BaseService) -> bool:
+        """스케줄러가 헬스체크를 예약할 서비스인지"""
+        return service.config.enabled and service.config.health_check_interval > 0
+    
+    def _schedule_health_check(self, service: BaseService, now: float):
+        """서비스의 다음 헬스체크를 힙에 예약"""
+        heapq.heappush(self._health_heap, (
+            now + service.config.health_check_interval, next(self._health_seq), service.config.name, service
+        ))
+    
+    async def _health_scheduler(self):
+        """
+        헬스체크 스케줄러
+        
+        최소 힙에서 가장 이른 시각까지만 대기한다. 도래한 서비스는 먼저 다음 주기로 다시 예약한 뒤
+        헬스체크를 서비스별 태스크로 실행하므로, 응답이 느린 헬스체크가 다른 서비스의 주기를
+        늦추지 않는다. 실행 중 등록된 서비스는 register()가 스케줄러를 깨워 바로 예약한다.
+        """
+        loop = asyncio.get_running_loop()
+        heap = self._health_heap
+        pending = self._health_pending
+        wakeup = self._health_wakeup
+        
+        while True:
+            now = loop.time()
+            while pending:
+                self._schedule_health_check(pending.popleft(), now)
+            
+            if heap and heap[0][0] <= now:
+                # 이번 주기의 시각은 한 번만 구해 도래한 모든 서비스에 공유
+                now_mono = time.monotonic()
+                while heap and heap[0][0] <= now:
+                    _, _, name, service = heapq.heappop(heap)
+                    if self.services.get(name) is not service:
+                        continue  # 등록 해제된 서비스는 예약에서 제외
+                    self._schedule_health_check(service, now)
+                    self._dispatch_health_check(service, now_mono)
+                continue
+            
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=heap[0][0] - now if heap else None)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+    
+    def _dispatch_health_check(self, service: BaseService, now_mono: float):
+        """헬스체크를 태스크로 실행 (시작 전이거나 이전 헬스체크가 아직 진행 중이면 이번 주기는 건너뜀)"""
+        name = service.config.name
+        if service.status.started_at is None:
+            return
+        running = self._health_tasks.get(name)
+        if running is not None and not running.done():
+            return
+        self._health_tasks[name] = asyncio.create_task(self._run_health_check(service, now_mono))
+    
+    async def _run_health_check(self, service: BaseService, now_mono: float):
+        """헬스체크 1회 수행 후 공유 상태에 기록"""
+        await service.run_health_check(now_mono)
+        await self._persist_status((service,))
+    
+    async def _persist_status(self, services):
+        """
+        공유 헬스 상태 파일에 서비스 상태 기록
+        
+        다른 워커가 파일 잠금을 잡고 있어도 이벤트 루프가 멈추지 않도록 기록은 스레드에서 수행한다.
+        """
+        shared_state = self._shared_state
+        if shared_state is None:
+            return
+        now = time.time()
+        records = [(service.config.name, service.get_status()) for service in services]
+        await asyncio.to_thread(self._write_shared_status, shared_state, records, now)
+    
+    @staticmethod
+    def _write_shared_status(shared_state: SharedHealthState, records, now: float):
+        for name, status in records:
+            try:
+                shared_state.write(name, status, now)
+            except Exception as e:
+                logger.debug(f"공유 헬스 상태 기록 실패: {name} - {e}")
+    
+    async def _shared_refresh_loop(self):
+        """공유 헬스 상태 스냅샷 주기적 갱신"""
+        while True:
+            await asyncio.sleep(self.SHARED_STATUS_REFRESH_INTERVAL)
+            await self._refresh_shared_status()
+    
+    async def _refresh_shared_status(self):
+        """
+        다른 워커가 기록한 상태를 다시 읽어 스냅샷 갱신
+        
+        파일 잠금 대기 / 레코드 파싱 / pid 생존 확인은 스레드에서 수행하여 이벤트 루프를 막지 않는다.
+        """
+        shared_state = self._shared_state
+        if shared_state is None:
+            return
+        try:
+            snapshot = await asyncio.to_thread(shared_state.read_all, True)
+        except Exception as e:
+            logger.debug(f"공유 헬스 상태 조회 실패: {e}")
+            return
+        self._shared_snapshot = snapshot
+        self._invalidate_status_cache()
+    
+    def get_all_status(self, ttl: float = 1.0) -> Dict[str, Dict[str, Any]]:
+        """
+        모든 서비스 상태 조회
+        
+        다른 워커의 상태는 파일을 직접 읽지 않고 주기적으로 갱신되는 스냅샷에서 병합한다
+        (최대 SHARED_STATUS_REFRESH_INTERVAL 만큼 지연될 수 있음).
+        
+        Args:
+            ttl: 직전 조회 결과를 재사용할 시간 (초, 0이면 항상 새로 조회)
+        """
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache_ts < ttl:
+            return self._status_cache
+        
+        statuses = {
             name: service.get_status()
             for name, service in self.services.items()
         }
+        if self._shared_snapshot:
+            statuses = self._merge_shared_status(statuses)
+        
+        self._status_cache = statuses
+        self._status_cache_ts = now
+        return self._status_cache
+    
+    def _merge_shared_status(self, statuses: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """다른 워커가 기록한 상태 중 로컬보다 최신인 것으로 대체"""
+        for name, (updated_at, shared_status) in self._shared_snapshot.items():
+            service = self.services.get(name)
+            if service is not None:
+                last_check = service.status.last_health_check or service.status.started_at
+                if last_check is not None and last_check.timestamp() >= updated_at:
+                    continue
+            statuses[name] = shared_status
+        return statuses
     
     def get_healthy_services(self) -> List[str]:
         """건강한 서비스 목록"""
-        return [
-            name for name, service in self.services.items()
-            if service.status.is_healthy
-        ]
+        return list(self._healthy)
     
     def get_unhealthy_services(self) -> List[str]:
         """비건강한 서비스 목록"""
-        return [
-            name for name, service in self.services.items()
-            if not service.status.is_healthy
-        ]
+        return list(self._unhealthy)
+    
+    @property
+    def healthy_count(self) -> int:
+        """건강한 서비스 수"""
+        return len(self._healthy)
 
 
 # 전역 서비스 레지스트리
 service_registry = ServiceRegistry()
 
 
+@functools.lru_cache(maxsize=256)
+def _required_field_set(required_fields: Tuple[str, ...]) -> frozenset:
+    """필수 필드 목록의 frozenset (같은 스키마 반복 검증 시 재사용)"""
+    return frozenset(required_fields)
+
+
+def _raise_missing_fields(data: Dict[str, Any], required_fields: Tuple[str, ...]):
+    """필수 필드 누락 예외 (required_fields 순서 유지)"""
+    missing_fields = [field for field in required_fields if field not in data or data[field] is None]
+    raise KairosException(
+        f"필수 필드 누락: {', '.join(missing_fields)}",
+        error_code="MISSING_REQUIRED_FIELDS",
+        details={'missing_fields': missing_fields}
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_validator(schema: Tuple[Tuple[str, Optional[Tuple[Optional[float], Optional[float]]]], ...]):
+    """
+    스키마 전용 검증 함수 생성
+    
+    필드/범위 검사를 직선 코드로 펼친 함수를 exec로 만들어 반복문과 메서드 호출을 제거한다.
+    필드명과 경계값은 repr 리터럴로만 삽입한다.
+    """
+    fields = tuple(field for field, _ in schema)
+    lines = ["def _validate(d):"]
+    
+    if fields:
+        presence = " or ".join(f"{field!r} not in d or d[{field!r}] is None" for field in fields)
+        lines.append(f"    if {presence}:")
+        lines.append("        _raise_missing(d, _fields)")
+    
+    for field, bounds in schema:
+        if bounds is None:
+            continue
+        min_val, max_val = bounds
+        if min_val is not None:
+            lines.append(f"    if d[{field!r}] < {min_val!r}:")
+            lines.append(f"        _raise_too_small(d[{field!r}], {field!r}, {min_val!r})")
+        if max_val is not None:
+            lines.append(f"    if d[{field!r}] > {max_val!r}:")
+            lines.append(f"        _raise_too_large(d[{field!r}], {field!r}, {max_val!r})")
+    
+    if len(lines) == 1:
+        lines.append("    return None")
+    
+    namespace = {
+        '_fields': fields,
+        '_raise_missing': _raise_missing_fields,
+        '_raise_too_small': DataValidationMixin._raise_too_small,
+        '_raise_too_large': DataValidationMixin._raise_too_large,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace['_validate']
+
+
 class DataValidationMixin:
     """
     데이터 검증 믹스인
@@ -380,85 +926,135 @@ class DataValidationMixin:
     
     def validate_required_fields(self, data: Dict[str, Any], required_fields: List[str]):
         """필수 필드 검증"""
-        missing_fields = [field for field in required_fields if field not in data or data[field] is None]
-        if missing_fields:
-            raise KairosException(
-                f"필수 필드 누락: {', '.join(missing_fields)}",
-                error_code="MISSING_REQUIRED_FIELDS",
-                details={'missing_fields': missing_fields}
-            )
+        # 키 존재 여부는 C 수준 집합 차집합으로 확인, None 값은 존재하는 키만 확인
+        required_set = _required_field_set(tuple(required_fields))
+        if not required_set.difference(data) and not any(data[field] is None for field in required_set):
+            return
+        
+        # 오류 메시지는 required_fields 순서를 유지
+        _raise_missing_fields(data, tuple(required_fields))
+    
+    def compile_validator(
+        self, schema: Dict[str, Optional[Tuple[Optional[float], Optional[float]]]]
+    ) -> Callable[[Dict[str, Any]], None]:
+        """
+        스키마 전용 검증 함수 생성 (같은 스키마는 캐시된 함수 재사용)
+        
+        Args:
+            schema: 필드명 -> None(필수만) 또는 (최솟값, 최댓값) - 모든 필드는 필수
+        
+        Returns:
+            data 딕셔너리를 검증하는 함수. 실패 시 validate_* 메서드와 동일한 KairosException 발생
+        """
+        for field, bounds in schema.items():
+            if not isinstance(field, str):
+                raise TypeError(f"필드명은 문자열이어야 합니다: {field!r}")
+            if bounds is not None and not all(
+                bound is None or (type(bound) in (int, float) and math.isfinite(bound))
+                for bound in bounds
+            ):
+                raise TypeError(f"범위 값은 유한한 int/float이어야 합니다: {field}={bounds!r}")
+        
+        return _compile_validator(tuple(
+            (field, tuple(bounds) if bounds is not None else None)
+            for field, bounds in schema.items()
+        ))
     
     def validate_numeric_range(self, value: float, field_name: str, min_val: Optional[float] = None, max_val: Optional[float] = None):
         """숫자 범위 검증"""
         if min_val is not None and value < min_val:
-            raise KairosException(
-                f"{field_name} 값이 최솟값보다 작습니다: {value} < {min_val}",
-                error_code="VALUE_TOO_SMALL",
-                details={'field': field_name, 'value': value, 'min': min_val}
-            )
+            self._raise_too_small(value, field_name, min_val)
         
         if max_val is not None and value > max_val:
-            raise KairosException(
-                f"{field_name} 값이 최댓값보다 큽니다: {value} > {max_val}",
-                error_code="VALUE_TOO_LARGE",
-                details={'field': field_name, 'value': value, 'max': max_val}
-            )
+            self._raise_too_large(value, field_name, max_val)
     
     def validate_percentage(self, value: float, field_name: str):
         """백분율 검증 (0-1 범위)"""
-        self.validate_numeric_range(value, field_name, 0.0, 1.0)
+        if value < 0.0:
+            self._raise_too_small(value, field_name, 0.0)
+        if value > 1.0:
+            self._raise_too_large(value, field_name, 1.0)
     
     def validate_positive_number(self, value: float, field_name: str):
         """양수 검증"""
         if value <= 0:
-            raise KairosException(
-                f"{field_name}는 양수여야 합니다: {value}",
-                error_code="INVALID_POSITIVE_NUMBER",
-                details={'field': field_name, 'value': value}
-            )
+            self._raise_not_positive(value, field_name)
+    
+    # 검증 실패 시에만 호출되는 예외 생성 경로 (메시지/상세 정보는 조회 시 생성)
+    @staticmethod
+    def _raise_too_small(value: float, field_name: str, min_val: float):
+        raise LazyKairosException(
+            "{0} 값이 최솟값보다 작습니다: {1} < {2}", field_name, value, min_val,
+            error_code="VALUE_TOO_SMALL",
+            detail_keys=('field', 'value', 'min')
+        )
+    
+    @staticmethod
+    def _raise_too_large(value: float, field_name: str, max_val: float):
+        raise LazyKairosException(
+            "{0} 값이 최댓값보다 큽니다: {1} > {2}", field_name, value, max_val,
+            error_code="VALUE_TOO_LARGE",
+            detail_keys=('field', 'value', 'max')
+        )
+    
+    @staticmethod
+    def _raise_not_positive(value: float, field_name: str):
+        raise LazyKairosException(
+            "{0}는 양수여야 합니다: {1}", field_name, value,
+            error_code="INVALID_POSITIVE_NUMBER",
+            detail_keys=('field', 'value')
+        )
 
 
 class CacheableMixin:
     """
     캐시 가능 믹스인
     
-    공통 캐싱 로직
+    공통 캐싱 로직 (최대 크기 초과 시 가장 오래 사용되지 않은 항목부터 제거)
     """
     
-    def __init__(self):
-        self._cache: Dict[str, Any] = {}
-        self._cache_timestamps: Dict[str, datetime] = {}
+    def __init__(self, max_cache_size: int = 1024):
+        # 키 -> (저장 시각(monotonic), 값), 사용 순서대로 정렬
+        self._cache: OrderedDict = OrderedDict()
+        self._max_cache_size = max_cache_size
     
     def get_from_cache(self, key: str, ttl: int = 300) -> Optional[Any]:
         """캐시에서 값 조회"""
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             return None
         
         # TTL 확인
-        timestamp = self._cache_timestamps.get(key)
-        if timestamp and (datetime.now() - timestamp).total_seconds() > ttl:
-            self.invalidate_cache(key)
+        stored_at, value = entry
+        if time.monotonic() - stored_at > ttl:
+            del self._cache[key]
             return None
         
-        return self._cache[key]
+        self._cache.move_to_end(key)
+        return value
     
     def set_cache(self, key: str, value: Any):
         """캐시에 값 저장"""
-        self._cache[key] = value
-        self._cache_timestamps[key] = datetime.now()
+        self._cache[key] = (time.monotonic(), value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._max_cache_size:
+            self._cache.popitem(last=False)
     
     def invalidate_cache(self, key: Optional[str] = None):
         """캐시 무효화"""
         if key:
             self._cache.pop(key, None)
-            self._cache_timestamps.pop(key, None)
         else:
             self._cache.clear()
-            self._cache_timestamps.clear()
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계"""
+        oldest_entry = None
+        if self._cache:
+            age = time.monotonic() - min(stored_at for stored_at, _ in self._cache.values())
+            oldest_entry = datetime.now() - timedelta(seconds=age)
         return {
             'cache_size': len(self._cache),
-            'oldest_entry': min(self._cache_timestamps.values()) if self._cache_timestamps else None
-        }
\ No newline at end of file
+            'max_cache_size': self._max_cache_size,
+            'oldest_entry': oldest_entry
+        }
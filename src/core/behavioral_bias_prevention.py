@@ -10,14 +10,23 @@ Behavioral Bias Prevention System
 - 확증 편향 방지
 """
 
+import itertools
+import operator
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Any
+from dataclasses import dataclass, field
 from enum import Enum
 import pandas as pd
 import numpy as np
 from loguru import logger
 
+from ..utils.numba_compat import NUMBA_AVAILABLE, njit
+
 
 class BiasType(Enum):
     """편향 유형"""
@@ -49,7 +58,7 @@ class PreventionAction(Enum):
     COOLING_PERIOD = "cooling_period"       # 쿨링 기간
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BiasDetection:
     """편향 감지 결과"""
     bias_type: BiasType
@@ -58,33 +67,586 @@ class BiasDetection:
     evidence: List[str]           # 근거 리스트
     risk_score: float             # 리스크 점수 (0-100)
     detected_at: datetime
+    _evidence_head: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _warning_message: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def evidence_head(self) -> str:
+        """주요 근거 2개 요약 (처음 접근할 때 한 번만 생성)"""
+        head = self._evidence_head
+        if head is None:
+            head = " | ".join(self.evidence[:2])
+            object.__setattr__(self, '_evidence_head', head)
+        return head
+    
+    @property
+    def warning_message(self) -> str:
+        """경고 메시지 (로그/알림 등 여러 경로에서 사용해도 한 번만 생성)"""
+        message = self._warning_message
+        if message is None:
+            message = _format_message(self.bias_type, self.evidence_head)
+            object.__setattr__(self, '_warning_message', message)
+        return message
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PreventionRule:
-    """방지 규칙"""
+    """방지 규칙 (인스턴스 간 공유되므로 불변, 활성 여부는 BehavioralBiasPrevention.active_rule_ids)"""
     rule_id: str
     bias_type: BiasType
     trigger_conditions: Dict[str, Any]
-    prevention_actions: List[PreventionAction]
+    prevention_actions: Tuple[PreventionAction, ...]
     cooling_period_hours: int
     description: str
-    is_active: bool = True
+    is_active: bool = True         # 기본 활성 여부
 
 
-@dataclass
+@dataclass(slots=True)
 class BiasEvent:
     """편향 이벤트"""
     event_id: str
     bias_type: BiasType
     level: BiasLevel
     triggered_at: datetime
-    original_decision: Dict[str, Any]  # 원래 결정
+    original_decision: Mapping[str, Any]  # 원래 결정 (읽기 전용 스냅샷)
     prevented_actions: List[PreventionAction]
     user_override: bool = False    # 사용자가 오버라이드했는지
     outcome_data: Dict[str, Any] = None  # 결과 데이터
 
 
+# 편향 유형 -> 임계값 배열 행 번호
+_BIAS_INDEX = {bias_type: i for i, bias_type in enumerate(BiasType)}
+
+# 감지 임계값 (행: BiasType, 해당 없는 칸은 NaN)
+THRESHOLD_DTYPE = np.dtype([
+    ('price_change', 'f8'),      # 가격 변동률 (FOMO: 24시간 상승, 공황 매도: 1시간 하락)
+    ('volume_surge', 'f8'),      # 거래량 배수
+    ('amount_multiple', 'f8'),   # 평소 대비 주문/포지션 크기 배수
+    ('decision_seconds', 'f8'),  # 성급한 의사결정 기준 (초)
+    ('sentiment', 'f8'),         # 소셜 센티먼트 / 공포지수 (군중 심리: 낙관 기준)
+    ('sentiment_low', 'f8'),     # 소셜 센티먼트 비관 기준 (군중 심리)
+    ('pnl_pct', 'f8'),           # 미실현 손익률
+    ('liquidations', 'f8'),      # 24시간 청산 규모 (달러)
+    ('consecutive_wins', 'f8'),  # 연속 수익 횟수
+    ('trade_frequency', 'f8'),   # 평소 대비 거래 빈도 배수
+    ('expected_return', 'f8'),   # 기대 수익률
+    ('news_impact', 'f8'),       # 뉴스 영향도 절대값
+    ('news_minutes', 'f8'),      # 뉴스 이후 경과 시간 (분)
+])
+
+
+def _build_thresholds() -> np.ndarray:
+    """감지 임계값 배열 생성 (읽기 전용)"""
+    
+    thresholds = np.full(len(BiasType), np.nan, dtype=THRESHOLD_DTYPE)
+    
+    fomo = thresholds[_BIAS_INDEX[BiasType.FOMO]]
+    fomo['price_change'] = 0.15       # 24시간 15% 이상 상승
+    fomo['volume_surge'] = 2.0
+    fomo['amount_multiple'] = 3.0
+    fomo['decision_seconds'] = 300    # 5분 이내
+    fomo['sentiment'] = 0.8
+    
+    panic = thresholds[_BIAS_INDEX[BiasType.PANIC_SELLING]]
+    panic['price_change'] = -0.10     # 1시간 10% 하락
+    panic['sentiment'] = 25           # 공포지수
+    panic['decision_seconds'] = 180   # 3분 이내
+    panic['pnl_pct'] = -0.15          # 15% 이상 손실
+    panic['liquidations'] = 500000000  # 5억달러 이상
+    
+    overconfidence = thresholds[_BIAS_INDEX[BiasType.OVERCONFIDENCE]]
+    overconfidence['consecutive_wins'] = 5
+    overconfidence['amount_multiple'] = 2.0
+    overconfidence['trade_frequency'] = 3.0
+    overconfidence['expected_return'] = 0.5   # 50% 이상 기대
+    
+    herding = thresholds[_BIAS_INDEX[BiasType.HERDING]]
+    herding['sentiment'] = 0.8
+    herding['sentiment_low'] = 0.2
+    herding['volume_surge'] = 3.0
+    herding['news_impact'] = 0.7
+    herding['news_minutes'] = 60      # 1시간 이내
+    
+    thresholds.flags.writeable = False
+    return thresholds
+
+
+DETECTION_THRESHOLDS = _build_thresholds()
+
+_FOMO_T = DETECTION_THRESHOLDS[_BIAS_INDEX[BiasType.FOMO]]
+_PANIC_T = DETECTION_THRESHOLDS[_BIAS_INDEX[BiasType.PANIC_SELLING]]
+_OVERCONFIDENCE_T = DETECTION_THRESHOLDS[_BIAS_INDEX[BiasType.OVERCONFIDENCE]]
+_HERDING_T = DETECTION_THRESHOLDS[_BIAS_INDEX[BiasType.HERDING]]
+
+
+# 규칙별 가중치 (행: BiasType, 열: 규칙 순서, 해당 없는 칸은 NaN)
+# 단건 커널과 detect_bias_batch가 같은 표를 읽는다
+_RULE_WEIGHTS: Dict[BiasType, Tuple[float, ...]] = {
+    # 가격 급등, 거래량 급증, 주문 크기, 빠른 결정, 소셜 미디어
+    BiasType.FOMO: (30, 20, 25, 15, 10),
+    # 가격 급락, 극도의 공포, 빠른 결정, 손실 상태, 대량 청산
+    BiasType.PANIC_SELLING: (40, 30, 20, 15, 10),
+    # 연속 수익, 포지션 크기, 거래 빈도, 기대 수익률, 손절 미설정
+    BiasType.OVERCONFIDENCE: (30, 25, 20, 15, 10),
+    # 소셜 센티먼트 동조, 거래량 급증, 뉴스 직후, 인플루언서 동조, 독립적 분석 부재
+    BiasType.HERDING: (30, 20, 25, 15, 20),
+}
+
+
+def _build_weights() -> np.ndarray:
+    """규칙 가중치 배열 생성 (읽기 전용)"""
+    
+    weights = np.full((len(BiasType), 5), np.nan)
+    for bias_type, row in _RULE_WEIGHTS.items():
+        weights[_BIAS_INDEX[bias_type]] = row
+    
+    weights.flags.writeable = False
+    return weights
+
+
+RULE_WEIGHTS = _build_weights()
+
+_FOMO_W = RULE_WEIGHTS[_BIAS_INDEX[BiasType.FOMO]]
+_PANIC_W = RULE_WEIGHTS[_BIAS_INDEX[BiasType.PANIC_SELLING]]
+_OVERCONFIDENCE_W = RULE_WEIGHTS[_BIAS_INDEX[BiasType.OVERCONFIDENCE]]
+_HERDING_W = RULE_WEIGHTS[_BIAS_INDEX[BiasType.HERDING]]
+
+
+# 편향 수준 구간: (점수 경계, 경계별 수준) - 첫 경계 미만은 감지하지 않음
+_LEVEL_LADDERS: Dict[BiasType, Tuple[Tuple[float, ...], Tuple[Optional[BiasLevel], ...]]] = {
+    BiasType.FOMO: ((30, 50, 70), (None, BiasLevel.MEDIUM, BiasLevel.HIGH, BiasLevel.CRITICAL)),
+    BiasType.PANIC_SELLING: ((30, 50, 75), (None, BiasLevel.MEDIUM, BiasLevel.HIGH, BiasLevel.CRITICAL)),
+    BiasType.OVERCONFIDENCE: ((30, 50, 70), (None, BiasLevel.MEDIUM, BiasLevel.HIGH, BiasLevel.CRITICAL)),
+    BiasType.LOSS_AVERSION: ((20, 40, 60), (None, BiasLevel.LOW, BiasLevel.MEDIUM, BiasLevel.HIGH)),
+    BiasType.ANCHORING: ((15, 30, 50), (None, BiasLevel.LOW, BiasLevel.MEDIUM, BiasLevel.HIGH)),
+    BiasType.HERDING: ((20, 40, 60), (None, BiasLevel.LOW, BiasLevel.MEDIUM, BiasLevel.HIGH)),
+}
+
+
+def _classify_level(bias_type: BiasType, risk_score: float) -> Optional[BiasLevel]:
+    """리스크 점수 -> 편향 수준 (첫 경계 미만이면 None)"""
+    cuts, levels = _LEVEL_LADDERS[bias_type]
+    return levels[bisect_right(cuts, risk_score)]
+
+
+def _batch_column(frame: pd.DataFrame, name: str, default: Any, dtype: Any = np.float64) -> np.ndarray:
+    """배치 입력 열 (열이 없거나 결측이면 기본값)"""
+    if name not in frame.columns:
+        return np.full(len(frame), default, dtype=dtype)
+    values = frame[name]
+    return np.where(values.isna(), default, values).astype(dtype)
+
+
+class _Inputs(NamedTuple):
+    """감지기 공용 입력 (_normalize_inputs에서 한 번 검증/기본값 적용)"""
+    # 결정
+    order_side: Optional[str]
+    order_amount: float
+    decision_time_seconds: float
+    unrealized_pnl_pct: float
+    expected_return: float
+    has_stop_loss: bool
+    target_price: float
+    time_since_news_minutes: float
+    has_independent_analysis: bool
+    # 시장
+    price_change_24h: float
+    price_change_1h: float
+    volume_surge: float
+    social_sentiment: float
+    influencer_sentiment: float
+    fear_greed_index: float
+    liquidations_24h: float
+    news_impact_score: float
+    current_price: float
+    all_time_high: float
+    price_trend_7d: str
+    # 사용자 이력
+    avg_order_amount: float
+    avg_position_size: float
+    consecutive_wins: float
+    trades_last_7d: float
+    avg_trades_per_week: float
+    stop_loss_triggered_count: float
+    total_loss_trades: float
+    avg_loss_percentage: float
+    positions: Tuple[Dict[str, Any], ...]
+    position_pnl: np.ndarray       # 포지션별 미실현 손익률
+    position_days: np.ndarray      # 포지션별 보유 일수
+    position_entry: np.ndarray     # 포지션별 매수가
+
+
+def _number(data: Dict[str, Any], key: str, default: float) -> float:
+    """숫자 입력 (없거나 None이면 기본값, int/float는 그대로, 그 외는 float 변환)"""
+    value = data.get(key)
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return value
+    return float(value)
+
+
+def _ratio_exceeds(values: np.ndarray, base: np.ndarray, multiple: float) -> np.ndarray:
+    """기준값이 양수이고 values가 기준값의 multiple배를 넘는지 (배치용)"""
+    return (base > 0) & (values > base * multiple)
+
+
+def _normalize_inputs(
+    decision_data: Dict[str, Any],
+    market_context: Dict[str, Any],
+    user_history: Dict[str, Any]
+) -> _Inputs:
+    """
+    감지 입력 검증
+    
+    모든 감지기가 쓰는 값을 한 번에 꺼내 기본값을 채운다.
+    숫자로 변환할 수 없는 값이 있으면 ValueError / TypeError가 발생한다.
+    """
+    
+    current_price = _number(market_context, "current_price", 0)
+    
+    positions = tuple(user_history.get("current_positions") or ())
+    count = len(positions)
+    position_pnl = np.fromiter(
+        (_number(p, "unrealized_pnl_pct", 0) for p in positions), dtype=np.float64, count=count
+    )
+    position_days = np.fromiter(
+        (_number(p, "holding_days", 0) for p in positions), dtype=np.float64, count=count
+    )
+    position_entry = np.fromiter(
+        (_number(p, "entry_price", 0) for p in positions), dtype=np.float64, count=count
+    )
+    
+    return _Inputs(
+        order_side=decision_data.get("order_side"),
+        order_amount=_number(decision_data, "order_amount", 0),
+        decision_time_seconds=_number(decision_data, "decision_time_seconds", 600),
+        unrealized_pnl_pct=_number(decision_data, "unrealized_pnl_pct", 0),
+        expected_return=_number(decision_data, "expected_return", 0),
+        has_stop_loss=bool(decision_data.get("has_stop_loss", True)),
+        target_price=_number(decision_data, "target_price", 0),
+        time_since_news_minutes=_number(decision_data, "time_since_news_minutes", 1440),  # 기본 24시간
+        has_independent_analysis=bool(decision_data.get("has_independent_analysis", True)),
+        price_change_24h=_number(market_context, "price_change_24h", 0),
+        price_change_1h=_number(market_context, "price_change_1h", 0),
+        volume_surge=_number(market_context, "volume_surge", 1.0),
+        social_sentiment=_number(market_context, "social_sentiment", 0.5),
+        influencer_sentiment=_number(market_context, "influencer_sentiment", 0.5),
+        fear_greed_index=_number(market_context, "fear_greed_index", 50),
+        liquidations_24h=_number(market_context, "liquidations_24h", 0),
+        news_impact_score=_number(market_context, "news_impact_score", 0),  # -1 to 1
+        current_price=current_price,
+        all_time_high=_number(market_context, "all_time_high", current_price),
+        price_trend_7d=market_context.get("price_trend_7d", "neutral"),
+        avg_order_amount=_number(user_history, "avg_order_amount", 100000),
+        avg_position_size=_number(user_history, "avg_position_size", 100000),
+        consecutive_wins=_number(user_history, "consecutive_wins", 0),
+        trades_last_7d=_number(user_history, "trades_last_7d", 0),
+        avg_trades_per_week=_number(user_history, "avg_trades_per_week", 1),
+        stop_loss_triggered_count=_number(user_history, "stop_loss_triggered_count", 0),
+        total_loss_trades=_number(user_history, "total_loss_trades", 1),
+        avg_loss_percentage=_number(user_history, "avg_loss_percentage", 0),
+        positions=positions,
+        position_pnl=position_pnl,
+        position_days=position_days,
+        position_entry=position_entry,
+    )
+
+
+# 점수 계산 커널: (리스크 점수, 근거 비트마스크) 반환
+# 근거 문자열은 점수가 임계값을 넘은 경우에만 비트마스크로부터 생성한다
+
+@njit(cache=True)
+def _fomo_score(t, w, price_change_24h, volume_surge, current_amount, normal_amount,
+                decision_time, social_sentiment):
+    score = 0.0
+    ev = 0
+    if price_change_24h > t['price_change']:  # 가격 급등
+        score += w[0]
+        ev |= 1
+    if volume_surge > t['volume_surge']:  # 거래량 급증
+        score += w[1]
+        ev |= 2
+    if normal_amount > 0 and current_amount > normal_amount * t['amount_multiple']:  # 비정상적 주문 크기
+        score += w[2]
+        ev |= 4
+    if decision_time < t['decision_seconds']:  # 빠른 의사결정
+        score += w[3]
+        ev |= 8
+    if social_sentiment > t['sentiment']:  # 소셜 미디어 영향
+        score += w[4]
+        ev |= 16
+    return score, ev
+
+
+@njit(cache=True)
+def _panic_score(t, w, price_change_1h, fear_index, decision_time, unrealized_pnl, liquidations_24h):
+    score = 0.0
+    ev = 0
+    if price_change_1h < t['price_change']:  # 급격한 가격 하락
+        score += w[0]
+        ev |= 1
+    if fear_index < t['sentiment']:  # 극도의 공포
+        score += w[1]
+        ev |= 2
+    if decision_time < t['decision_seconds']:  # 빠른 매도 결정
+        score += w[2]
+        ev |= 4
+    if unrealized_pnl < t['pnl_pct']:  # 손실 상태에서 매도
+        score += w[3]
+        ev |= 8
+    if liquidations_24h > t['liquidations']:  # 대량 청산
+        score += w[4]
+        ev |= 16
+    return score, ev
+
+
+@njit(cache=True)
+def _overconfidence_score(t, w, consecutive_wins, avg_position_size, current_position,
+                          recent_trades, avg_trades, expected_return, has_stop_loss):
+    score = 0.0
+    ev = 0
+    if consecutive_wins >= t['consecutive_wins']:  # 연속 수익 거래
+        score += w[0]
+        ev |= 1
+    if avg_position_size > 0 and current_position > avg_position_size * t['amount_multiple']:  # 포지션 크기 급증
+        score += w[1]
+        ev |= 2
+    if avg_trades > 0 and recent_trades > avg_trades * t['trade_frequency']:  # 거래 빈도 증가
+        score += w[2]
+        ev |= 4
+    if expected_return > t['expected_return']:  # 높은 기대 수익률
+        score += w[3]
+        ev |= 8
+    if not has_stop_loss:  # 리스크 관리 무시
+        score += w[4]
+        ev |= 16
+    return score, ev
+
+
+# 편향 유형별 경고 메시지
+_BIAS_MESSAGES: Dict[BiasType, str] = {
+    BiasType.FOMO: "급등 상황에서 FOMO(기회상실 공포)가 감지되었습니다. 신중한 판단이 필요합니다.",
+    BiasType.PANIC_SELLING: "급락 상황에서 공황 매도 심리가 감지되었습니다. 감정적 매도를 피하세요.",
+    BiasType.OVERCONFIDENCE: "연승 이후 과신 편향이 감지되었습니다. 리스크 관리를 재점검하세요.",
+    BiasType.LOSS_AVERSION: "손실 회피 편향이 감지되었습니다. 손절매 규칙을 재검토하세요.",
+    BiasType.ANCHORING: "과거 가격에 대한 앵커링 편향 가능성이 있습니다. 현재 시장 상황을 재평가하세요.",
+    BiasType.HERDING: "군중 심리를 따라가는 패턴이 감지되었습니다. 독립적 분석을 권장합니다."
+}
+_DEFAULT_BIAS_MESSAGE = "심리적 편향이 감지되었습니다."
+
+
+@lru_cache(maxsize=256)
+def _format_message(bias_type: BiasType, evidence_head: str) -> str:
+    """(편향 유형, 주요 근거) -> 경고 메시지 (반복되는 경고는 캐시에서 반환)"""
+    base_message = _BIAS_MESSAGES.get(bias_type, _DEFAULT_BIAS_MESSAGE)
+    return f"{base_message} 근거: {evidence_head}"
+
+# 편향 수준별 실행 지연 (분)
+_DELAY_MINUTES: Dict[BiasLevel, int] = {
+    BiasLevel.LOW: 5,
+    BiasLevel.MEDIUM: 15,
+    BiasLevel.HIGH: 30,
+    BiasLevel.CRITICAL: 60
+}
+
+# 편향 수준별 주문 금액 축소율
+_REDUCTION_RATES: Dict[BiasLevel, float] = {
+    BiasLevel.LOW: 0.1,      # 10% 축소
+    BiasLevel.MEDIUM: 0.25,  # 25% 축소
+    BiasLevel.HIGH: 0.4,     # 40% 축소
+    BiasLevel.CRITICAL: 0.6  # 60% 축소
+}
+
+# 편향 수준별 쿨링 기간 (시간)
+_COOLING_HOURS: Dict[BiasLevel, int] = {
+    BiasLevel.LOW: 1,
+    BiasLevel.MEDIUM: 4,
+    BiasLevel.HIGH: 12,
+    BiasLevel.CRITICAL: 24
+}
+
+# 테이블에 없는 조합의 기본 방지 조치
+_DEFAULT_MEASURES: Tuple[PreventionAction, ...] = (PreventionAction.WARN_USER,)
+
+
+def _build_measures() -> Dict[Tuple[BiasType, BiasLevel], Tuple[PreventionAction, ...]]:
+    """(편향 유형, 수준) -> 방지 조치 테이블 생성"""
+    
+    warn = _DEFAULT_MEASURES
+    
+    # 기타 편향들: 높은 수준이면 확인 요구
+    measures = {
+        bias_type: {
+            BiasLevel.CRITICAL: (PreventionAction.WARN_USER, PreventionAction.REQUIRE_CONFIRMATION),
+            BiasLevel.HIGH: (PreventionAction.WARN_USER, PreventionAction.REQUIRE_CONFIRMATION),
+            BiasLevel.MEDIUM: warn,
+            BiasLevel.LOW: warn,
+        }
+        for bias_type in BiasType
+    }
+    
+    measures[BiasType.FOMO] = {
+        BiasLevel.CRITICAL: (PreventionAction.DELAY_EXECUTION, PreventionAction.REDUCE_AMOUNT,
+                             PreventionAction.REQUIRE_CONFIRMATION),
+        BiasLevel.HIGH: (PreventionAction.DELAY_EXECUTION, PreventionAction.WARN_USER),
+        BiasLevel.MEDIUM: warn,
+        BiasLevel.LOW: warn,
+    }
+    
+    measures[BiasType.PANIC_SELLING] = {
+        BiasLevel.CRITICAL: (PreventionAction.BLOCK_ORDER, PreventionAction.COOLING_PERIOD),
+        BiasLevel.HIGH: (PreventionAction.DELAY_EXECUTION, PreventionAction.REQUIRE_CONFIRMATION),
+        BiasLevel.MEDIUM: warn,
+        BiasLevel.LOW: warn,
+    }
+    
+    # 과신 편향은 수준과 관계없이 동일
+    overconfidence = (PreventionAction.REDUCE_AMOUNT, PreventionAction.WARN_USER,
+                      PreventionAction.COOLING_PERIOD)
+    measures[BiasType.OVERCONFIDENCE] = {level: overconfidence for level in BiasLevel}
+    
+    return {
+        (bias_type, level): actions
+        for bias_type, by_level in measures.items()
+        for level, actions in by_level.items()
+    }
+
+
+# 방지 조치 적용 순서 정렬 키
+_RISK_KEY = operator.attrgetter('risk_score')
+
+# 이벤트 ID 일련번호 (같은 초에 여러 편향이 발생해도 충돌하지 않음)
+_event_counter = itertools.count()
+
+# 보관할 최대 편향 이벤트 수 (초과 시 오래된 이벤트부터 제거하고 통계 집계에서도 제외)
+BIAS_HISTORY_MAX = 10000
+
+# 최근 7일 통계 창 ((now - 발생 시각).days <= 7 과 동일하게 8일 미만)
+_RECENT_WINDOW_SECONDS = 8 * 86400.0
+
+# (편향 유형, 수준) -> 방지 조치 (호출마다 리스트를 만들지 않도록 모듈 로드 시 한 번 생성)
+_MEASURES_TABLE = _build_measures()
+
+
+def _build_prevention_rules() -> Tuple[PreventionRule, ...]:
+    """방지 규칙 생성"""
+    
+    rules = []
+    
+    # 1. FOMO 방지 규칙
+    rules.append(PreventionRule(
+        rule_id="fomo_price_surge",
+        bias_type=BiasType.FOMO,
+        trigger_conditions={
+            "price_change_24h": ">0.20",       # 20% 이상 상승
+            "order_amount": ">normal_amount*2", # 평소 2배 이상
+            "quick_decision": "<300"            # 5분 이내 결정
+        },
+        prevention_actions=(
+            PreventionAction.DELAY_EXECUTION,
+            PreventionAction.WARN_USER,
+            PreventionAction.REDUCE_AMOUNT
+        ),
+        cooling_period_hours=4,
+        description="급격한 가격 상승 시 FOMO 방지"
+    ))
+    
+    # 2. 공황 매도 방지
+    rules.append(PreventionRule(
+        rule_id="panic_selling_crash",
+        bias_type=BiasType.PANIC_SELLING,
+        trigger_conditions={
+            "price_change_1h": "<-0.15",       # 1시간 15% 하락
+            "sell_order": "True",              # 매도 주문
+            "fear_index": "<30"                # 공포지수 30 미만
+        },
+        prevention_actions=(
+            PreventionAction.DELAY_EXECUTION,
+            PreventionAction.REQUIRE_CONFIRMATION,
+            PreventionAction.WARN_USER
+        ),
+        cooling_period_hours=2,
+        description="급락 시 공황 매도 방지"
+    ))
+    
+    # 3. 과신 편향 방지
+    rules.append(PreventionRule(
+        rule_id="overconfidence_winning_streak",
+        bias_type=BiasType.OVERCONFIDENCE,
+        trigger_conditions={
+            "consecutive_wins": ">=5",         # 연속 5회 수익
+            "position_increase": ">0.5",       # 포지션 50% 증가
+            "leverage_increase": "True"        # 레버리지 증가 시도
+        },
+        prevention_actions=(
+            PreventionAction.WARN_USER,
+            PreventionAction.REDUCE_AMOUNT,
+            PreventionAction.COOLING_PERIOD
+        ),
+        cooling_period_hours=24,
+        description="연승 후 과신 편향 방지"
+    ))
+    
+    # 4. 손실 회피 편향 방지
+    rules.append(PreventionRule(
+        rule_id="loss_aversion_hold",
+        bias_type=BiasType.LOSS_AVERSION,
+        trigger_conditions={
+            "unrealized_loss": ">0.20",        # 20% 이상 손실
+            "holding_period": ">30",           # 30일 이상 보유
+            "no_sell_action": "True"           # 매도 행동 없음
+        },
+        prevention_actions=(
+            PreventionAction.WARN_USER,
+            PreventionAction.REQUIRE_CONFIRMATION
+        ),
+        cooling_period_hours=168,  # 7일
+        description="손실 포지션 과도한 보유 방지"
+    ))
+    
+    # 5. 앵커링 편향 방지
+    rules.append(PreventionRule(
+        rule_id="anchoring_ath_reference",
+        bias_type=BiasType.ANCHORING,
+        trigger_conditions={
+            "reference_to_ath": "True",        # 최고가 기준 언급
+            "current_vs_ath": "<0.5",          # 최고가 대비 50% 미만
+            "expected_return": ">2.0"          # 2배 이상 기대수익
+        },
+        prevention_actions=(
+            PreventionAction.WARN_USER,
+            PreventionAction.DELAY_EXECUTION
+        ),
+        cooling_period_hours=12,
+        description="과거 최고가 앵커링 편향 방지"
+    ))
+    
+    # 6. 군중 심리 방지
+    rules.append(PreventionRule(
+        rule_id="herding_social_media",
+        bias_type=BiasType.HERDING,
+        trigger_conditions={
+            "social_sentiment": ">0.8",        # 소셜 미디어 극도 긍정
+            "follow_trend": "True",            # 트렌드 추종
+            "no_analysis": "True"              # 독립적 분석 없음
+        },
+        prevention_actions=(
+            PreventionAction.WARN_USER,
+            PreventionAction.DELAY_EXECUTION,
+            PreventionAction.REQUIRE_CONFIRMATION
+        ),
+        cooling_period_hours=6,
+        description="소셜 미디어 군중 심리 방지"
+    ))
+    
+    return tuple(rules)
+
+
+# 방지 규칙 (모든 인스턴스가 공유하는 읽기 전용 규칙 집합)
+_RULES = _build_prevention_rules()
+
+
 class BehavioralBiasPrevention:
     """
     심리적 편향 방지 시스템
@@ -93,147 +655,40 @@ class BehavioralBiasPrevention:
     감지하고 방지합니다.
     """
     
+    # 보관할 최대 편향 이벤트 수 (인스턴스/테스트별로 재정의 가능)
+    MAX_HISTORY = BIAS_HISTORY_MAX
+    
     def __init__(self):
         """편향 방지 시스템 초기화"""
         
-        self.prevention_rules = self._initialize_prevention_rules()
-        self.bias_history: List[BiasEvent] = []
-        self.cooling_periods: Dict[str, datetime] = {}
+        self.prevention_rules = _RULES
+        self.active_rule_ids: Set[str] = {rule.rule_id for rule in _RULES if rule.is_active}
+        self.bias_history: Deque[BiasEvent] = deque(maxlen=self.MAX_HISTORY)
+        self.cooling_periods: Dict[BiasType, float] = {}  # 편향 -> 쿨링 종료 시각 (time.monotonic 기준)
+        self._cooling_expiries: List[float] = []  # cooling_periods 값의 정렬 사본 (활성 개수 이분 탐색용)
         self.user_overrides: Dict[BiasType, int] = {}  # 편향별 오버라이드 횟수
         
-        # 임계값 설정
-        self.detection_thresholds = {
-            BiasType.FOMO: {
-                "price_surge_24h": 0.15,          # 24시간 15% 이상 상승
-                "volume_surge": 3.0,               # 거래량 3배 증가
-                "order_frequency_increase": 5.0    # 주문 빈도 5배 증가
-            },
-            BiasType.PANIC_SELLING: {
-                "price_drop_1h": -0.10,            # 1시간 10% 하락
-                "fear_index": 25,                  # 공포지수 25 미만
-                "quick_sell_threshold": 0.05       # 5분내 매도 시도
-            },
-            BiasType.OVERCONFIDENCE: {
-                "consecutive_wins": 5,             # 연속 5회 수익
-                "position_size_increase": 0.5,     # 포지션 크기 50% 증가
-                "frequency_increase": 3.0          # 거래 빈도 3배 증가
-            }
-        }
+        # 통계용 누적 집계 (bias_history에 기록/제거될 때 함께 갱신)
+        self._type_counts: Counter = Counter()  # BiasType -> 건수 (출력 시 값 문자열로 변환)
+        self._level_counts: Counter = Counter()  # BiasLevel -> 건수
+        self._prevented_count = 0
+        self._override_count = 0
+        self._recent_triggered: Deque[float] = deque(maxlen=self.MAX_HISTORY)  # 기록 순 발생 시각 (epoch 초)
         
-        logger.info("Behavioral Bias Prevention System 초기화 완료")
-    
-    def _initialize_prevention_rules(self) -> List[PreventionRule]:
-        """방지 규칙 초기화"""
+        # 편향 유형별 감지 함수 (감지기가 없는 유형은 검사하지 않음)
+        self._detectors = {
+            BiasType.FOMO: self._detect_fomo,
+            BiasType.PANIC_SELLING: self._detect_panic_selling,
+            BiasType.OVERCONFIDENCE: self._detect_overconfidence,
+            BiasType.LOSS_AVERSION: self._detect_loss_aversion,
+            BiasType.ANCHORING: self._detect_anchoring,
+            BiasType.HERDING: self._detect_herding,
+        }
         
-        rules = []
+        # 임계값 (모듈 공용 읽기 전용 배열)
+        self.detection_thresholds = DETECTION_THRESHOLDS
         
-        # 1. FOMO 방지 규칙
-        rules.append(PreventionRule(
-            rule_id="fomo_price_surge",
-            bias_type=BiasType.FOMO,
-            trigger_conditions={
-                "price_change_24h": ">0.20",       # 20% 이상 상승
-                "order_amount": ">normal_amount*2", # 평소 2배 이상
-                "quick_decision": "<300"            # 5분 이내 결정
-            },
-            prevention_actions=[
-                PreventionAction.DELAY_EXECUTION,
-                PreventionAction.WARN_USER,
-                PreventionAction.REDUCE_AMOUNT
-            ],
-            cooling_period_hours=4,
-            description="급격한 가격 상승 시 FOMO 방지"
-        ))
-        
-        # 2. 공황 매도 방지
-        rules.append(PreventionRule(
-            rule_id="panic_selling_crash",
-            bias_type=BiasType.PANIC_SELLING,
-            trigger_conditions={
-                "price_change_1h": "<-0.15",       # 1시간 15% 하락
-                "sell_order": "True",              # 매도 주문
-                "fear_index": "<30"                # 공포지수 30 미만
-            },
-            prevention_actions=[
-                PreventionAction.DELAY_EXECUTION,
-                PreventionAction.REQUIRE_CONFIRMATION,
-                PreventionAction.WARN_USER
-            ],
-            cooling_period_hours=2,
-            description="급락 시 공황 매도 방지"
-        ))
-        
-        # 3. 과신 편향 방지
-        rules.append(PreventionRule(
-            rule_id="overconfidence_winning_streak",
-            bias_type=BiasType.OVERCONFIDENCE,
-            trigger_conditions={
-                "consecutive_wins": ">=5",         # 연속 5회 수익
-                "position_increase": ">0.5",       # 포지션 50% 증가
-                "leverage_increase": "True"        # 레버리지 증가 시도
-            },
-            prevention_actions=[
-                PreventionAction.WARN_USER,
-                PreventionAction.REDUCE_AMOUNT,
-                PreventionAction.COOLING_PERIOD
-            ],
-            cooling_period_hours=24,
-            description="연승 후 과신 편향 방지"
-        ))
-        
-        # 4. 손실 회피 편향 방지
-        rules.append(PreventionRule(
-            rule_id="loss_aversion_hold",
-            bias_type=BiasType.LOSS_AVERSION,
-            trigger_conditions={
-                "unrealized_loss": ">0.20",        # 20% 이상 손실
-                "holding_period": ">30",           # 30일 이상 보유
-                "no_sell_action": "True"           # 매도 행동 없음
-            },
-            prevention_actions=[
-                PreventionAction.WARN_USER,
-                PreventionAction.REQUIRE_CONFIRMATION
-            ],
-            cooling_period_hours=168,  # 7일
-            description="손실 포지션 과도한 보유 방지"
-        ))
-        
-        # 5. 앵커링 편향 방지
-        rules.append(PreventionRule(
-            rule_id="anchoring_ath_reference",
-            bias_type=BiasType.ANCHORING,
-            trigger_conditions={
-                "reference_to_ath": "True",        # 최고가 기준 언급
-                "current_vs_ath": "<0.5",          # 최고가 대비 50% 미만
-                "expected_return": ">2.0"          # 2배 이상 기대수익
-            },
-            prevention_actions=[
-                PreventionAction.WARN_USER,
-                PreventionAction.DELAY_EXECUTION
-            ],
-            cooling_period_hours=12,
-            description="과거 최고가 앵커링 편향 방지"
-        ))
-        
-        # 6. 군중 심리 방지
-        rules.append(PreventionRule(
-            rule_id="herding_social_media",
-            bias_type=BiasType.HERDING,
-            trigger_conditions={
-                "social_sentiment": ">0.8",        # 소셜 미디어 극도 긍정
-                "follow_trend": "True",            # 트렌드 추종
-                "no_analysis": "True"              # 독립적 분석 없음
-            },
-            prevention_actions=[
-                PreventionAction.WARN_USER,
-                PreventionAction.DELAY_EXECUTION,
-                PreventionAction.REQUIRE_CONFIRMATION
-            ],
-            cooling_period_hours=6,
-            description="소셜 미디어 군중 심리 방지"
-        ))
-        
-        return rules
+        logger.info("Behavioral Bias Prevention System 초기화 완료")
     
     def detect_bias(
         self, 
@@ -246,11 +701,18 @@ class BehavioralBiasPrevention:
         detected_biases = []
         
         try:
-            # 각 편향 유형별로 검사
-            for bias_type in BiasType:
-                detection = self._detect_specific_bias(
-                    bias_type, decision_data, market_context, user_history
-                )
+            inputs = _normalize_inputs(decision_data, market_context, user_history)
+            
+            # 감지 시각은 한 번만 구해 모든 감지기에 전달
+            now = datetime.now()
+            now_mono = time.monotonic()
+            cooling_periods = self.cooling_periods
+            
+            # 각 편향 유형별로 검사 (쿨링 기간 중인 편향은 건너뜀)
+            for bias_type, detector in self._detectors.items():
+                if cooling_periods and cooling_periods.get(bias_type, 0.0) > now_mono:
+                    continue
+                detection = detector(inputs, now=now)
                 if detection:
                     detected_biases.append(detection)
             
@@ -264,451 +726,443 @@ class BehavioralBiasPrevention:
             logger.error(f"편향 감지 실패: {e}")
             return []
     
-    def _detect_specific_bias(
+    def detect_bias_batch(
         self,
-        bias_type: BiasType,
-        decision_data: Dict[str, Any],
-        market_context: Dict[str, Any], 
-        user_history: Dict[str, Any]
-    ) -> Optional[BiasDetection]:
-        """특정 편향 감지"""
-        
-        if bias_type == BiasType.FOMO:
-            return self._detect_fomo(decision_data, market_context, user_history)
-        elif bias_type == BiasType.PANIC_SELLING:
-            return self._detect_panic_selling(decision_data, market_context, user_history)
-        elif bias_type == BiasType.OVERCONFIDENCE:
-            return self._detect_overconfidence(decision_data, market_context, user_history)
-        elif bias_type == BiasType.LOSS_AVERSION:
-            return self._detect_loss_aversion(decision_data, market_context, user_history)
-        elif bias_type == BiasType.ANCHORING:
-            return self._detect_anchoring(decision_data, market_context, user_history)
-        elif bias_type == BiasType.HERDING:
-            return self._detect_herding(decision_data, market_context, user_history)
-        
-        return None
-    
-    def _detect_fomo(
-        self,
-        decision_data: Dict[str, Any],
-        market_context: Dict[str, Any],
-        user_history: Dict[str, Any]
-    ) -> Optional[BiasDetection]:
+        decisions: pd.DataFrame,
+        market: pd.DataFrame,
+        user_history: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
+        """
+        여러 결정에 대한 일괄 편향 감지 (백테스트 / 후보 거래 평가용)
+        
+        행 인덱스로 맞춰진 결정 / 시장 / 사용자 이력 DataFrame의 열 이름은
+        detect_bias의 딕셔너리 키와 같다. 편향별 규칙을 열 단위 마스크로 한 번에 계산하며,
+        근거 문자열은 만들지 않는다. 보유 포지션 목록이 필요한 손실 회피 / 앵커링 편향은
+        대상에서 제외된다.
+        
+        Returns:
+            감지된 (행, 편향)마다 한 줄 - bias_type, level, risk_score 열, 인덱스는 입력 행 인덱스
+        """
+        
+        frame = pd.concat([decisions, market, user_history], axis=1)
+        
+        def col(name: str, default: Any, dtype: Any = np.float64) -> np.ndarray:
+            return _batch_column(frame, name, default, dtype)
+        
+        order_side = col("order_side", None, object)
+        is_buy = order_side == "buy"
+        is_sell = order_side == "sell"
+        
+        t, w = _FOMO_T, _FOMO_W
+        fomo = (
+            w[0] * (col("price_change_24h", 0) > t['price_change'])
+            + w[1] * (col("volume_surge", 1.0) > t['volume_surge'])
+            + w[2] * _ratio_exceeds(col("order_amount", 0), col("avg_order_amount", 100000), t['amount_multiple'])
+            + w[3] * (col("decision_time_seconds", 600) < t['decision_seconds'])
+            + w[4] * (col("social_sentiment", 0.5) > t['sentiment'])
+        )
+        
+        t, w = _PANIC_T, _PANIC_W
+        panic = is_sell * (
+            w[0] * (col("price_change_1h", 0) < t['price_change'])
+            + w[1] * (col("fear_greed_index", 50) < t['sentiment'])
+            + w[2] * (col("decision_time_seconds", 600) < t['decision_seconds'])
+            + w[3] * (col("unrealized_pnl_pct", 0) < t['pnl_pct'])
+            + w[4] * (col("liquidations_24h", 0) > t['liquidations'])
+        )
+        
+        t, w = _OVERCONFIDENCE_T, _OVERCONFIDENCE_W
+        overconfidence = (
+            w[0] * (col("consecutive_wins", 0) >= t['consecutive_wins'])
+            + w[1] * _ratio_exceeds(col("order_amount", 0), col("avg_position_size", 100000), t['amount_multiple'])
+            + w[2] * _ratio_exceeds(col("trades_last_7d", 0), col("avg_trades_per_week", 1), t['trade_frequency'])
+            + w[3] * (col("expected_return", 0) > t['expected_return'])
+            + w[4] * ~col("has_stop_loss", True, bool)
+        )
+        
+        t, w = _HERDING_T, _HERDING_W
+        social = col("social_sentiment", 0.5)
+        influencer = col("influencer_sentiment", 0.5)
+        herding = (
+            w[0] * (((social > t['sentiment']) & is_buy) | ((social < t['sentiment_low']) & is_sell))
+            + w[1] * (col("volume_surge", 1.0) > t['volume_surge'])
+            + w[2] * ((np.abs(col("news_impact_score", 0)) > t['news_impact'])
+                      & (col("time_since_news_minutes", 1440) < t['news_minutes']))
+            + w[3] * (((influencer > t['sentiment']) & is_buy) | ((influencer < t['sentiment_low']) & is_sell))
+            + w[4] * ~col("has_independent_analysis", True, bool)
+        )
+        
+        results = []
+        for bias_type, scores in (
+            (BiasType.FOMO, fomo),
+            (BiasType.PANIC_SELLING, panic),
+            (BiasType.OVERCONFIDENCE, overconfidence),
+            (BiasType.HERDING, herding),
+        ):
+            cuts, levels = _LEVEL_LADDERS[bias_type]
+            level_idx = np.searchsorted(cuts, scores, side='right')
+            detected = level_idx > 0
+            if not detected.any():
+                continue
+            results.append(pd.DataFrame({
+                "bias_type": bias_type,
+                "level": np.array(levels, dtype=object)[level_idx[detected]],
+                "risk_score": scores[detected].astype(np.float64),
+            }, index=frame.index[detected]))
+        
+        if not results:
+            return pd.DataFrame(columns=["bias_type", "level", "risk_score"])
+        
+        return pd.concat(results).sort_index(kind="stable")
+    
+    def _detect_fomo(self, inputs: _Inputs, *, now: datetime) -> Optional[BiasDetection]:
         """FOMO 감지"""
         
-        try:
-            evidence = []
-            risk_score = 0.0
-            
-            # 가격 급등 확인
-            price_change_24h = market_context.get("price_change_24h", 0)
-            if price_change_24h > 0.15:  # 15% 이상 상승
-                evidence.append(f"24시간 {price_change_24h*100:.1f}% 급등")
-                risk_score += 30
-            
-            # 거래량 급증 확인
-            volume_surge = market_context.get("volume_surge", 1.0)
-            if volume_surge > 2.0:
-                evidence.append(f"거래량 {volume_surge:.1f}배 급증")
-                risk_score += 20
-            
-            # 비정상적 주문 크기
-            normal_amount = user_history.get("avg_order_amount", 100000)
-            current_amount = decision_data.get("order_amount", 0)
-            if current_amount > normal_amount * 3:
-                evidence.append(f"평소 {current_amount/normal_amount:.1f}배 주문 크기")
-                risk_score += 25
-            
-            # 빠른 의사결정
-            decision_time = decision_data.get("decision_time_seconds", 600)
-            if decision_time < 300:  # 5분 이내
-                evidence.append(f"성급한 의사결정 ({decision_time}초)")
-                risk_score += 15
-            
-            # 소셜 미디어 영향
-            social_sentiment = market_context.get("social_sentiment", 0.5)
-            if social_sentiment > 0.8:
-                evidence.append("소셜 미디어 극도 긍정 분위기")
-                risk_score += 10
-            
-            # 편향 수준 결정
-            if risk_score >= 70:
-                level = BiasLevel.CRITICAL
-            elif risk_score >= 50:
-                level = BiasLevel.HIGH
-            elif risk_score >= 30:
-                level = BiasLevel.MEDIUM
-            else:
-                return None  # 임계값 미만
-            
-            return BiasDetection(
-                bias_type=BiasType.FOMO,
-                level=level,
-                confidence=min(risk_score / 100, 0.95),
-                evidence=evidence,
-                risk_score=risk_score,
-                detected_at=datetime.now()
-            )
-            
-        except Exception as e:
-            logger.error(f"FOMO 감지 실패: {e}")
-            return None
+        risk_score, ev = _fomo_score(
+            _FOMO_T, _FOMO_W,
+            float(inputs.price_change_24h), float(inputs.volume_surge), float(inputs.order_amount),
+            float(inputs.avg_order_amount), float(inputs.decision_time_seconds), float(inputs.social_sentiment)
+        )
+        
+        # 편향 수준 결정
+        level = _classify_level(BiasType.FOMO, risk_score)
+        if level is None:
+            return None  # 임계값 미만
+        
+        # 근거 문자열은 임계값을 넘은 경우에만, 적중 수만큼 미리 할당한 리스트에 생성
+        evidence = [None] * ev.bit_count()
+        n = 0
+        if ev & 1:
+            evidence[n] = f"24시간 {inputs.price_change_24h*100:.1f}% 급등"
+            n += 1
+        if ev & 2:
+            evidence[n] = f"거래량 {inputs.volume_surge:.1f}배 급증"
+            n += 1
+        if ev & 4:
+            evidence[n] = f"평소 {inputs.order_amount/inputs.avg_order_amount:.1f}배 주문 크기"
+            n += 1
+        if ev & 8:
+            evidence[n] = f"성급한 의사결정 ({inputs.decision_time_seconds}초)"
+            n += 1
+        if ev & 16:
+            evidence[n] = "소셜 미디어 극도 긍정 분위기"
+            n += 1
+        
+        return BiasDetection(
+            bias_type=BiasType.FOMO,
+            level=level,
+            confidence=0.95 if risk_score >= 95 else risk_score / 100,
+            evidence=evidence,
+            risk_score=risk_score,
+            detected_at=now
+        )
     
-    def _detect_panic_selling(
-        self,
-        decision_data: Dict[str, Any],
-        market_context: Dict[str, Any],
-        user_history: Dict[str, Any]
-    ) -> Optional[BiasDetection]:
+    def _detect_panic_selling(self, inputs: _Inputs, *, now: datetime) -> Optional[BiasDetection]:
         """공황 매도 감지"""
         
-        try:
-            # 매도 주문이 아니면 스킵
-            if decision_data.get("order_side") != "sell":
-                return None
-            
-            evidence = []
-            risk_score = 0.0
-            
-            # 급격한 가격 하락
-            price_change_1h = market_context.get("price_change_1h", 0)
-            if price_change_1h < -0.10:  # 1시간 10% 하락
-                evidence.append(f"1시간 {abs(price_change_1h)*100:.1f}% 급락")
-                risk_score += 40
-            
-            # 공포 지수
-            fear_index = market_context.get("fear_greed_index", 50)
-            if fear_index < 25:
-                evidence.append(f"극도의 공포 상태 (공포지수: {fear_index})")
-                risk_score += 30
-            
-            # 빠른 매도 결정
-            decision_time = decision_data.get("decision_time_seconds", 600)
-            if decision_time < 180:  # 3분 이내
-                evidence.append(f"성급한 매도 결정 ({decision_time}초)")
-                risk_score += 20
-            
-            # 손실 상태에서 매도
-            unrealized_pnl = decision_data.get("unrealized_pnl_pct", 0)
-            if unrealized_pnl < -0.15:  # 15% 이상 손실
-                evidence.append(f"손실 상태 매도 ({unrealized_pnl*100:.1f}%)")
-                risk_score += 15
-            
-            # 대량 청산
-            liquidations_24h = market_context.get("liquidations_24h", 0)
-            if liquidations_24h > 500000000:  # 5억달러 이상
-                evidence.append("대규모 청산 발생")
-                risk_score += 10
-            
-            # 편향 수준 결정
-            if risk_score >= 75:
-                level = BiasLevel.CRITICAL
-            elif risk_score >= 50:
-                level = BiasLevel.HIGH
-            elif risk_score >= 30:
-                level = BiasLevel.MEDIUM
-            else:
-                return None
-            
-            return BiasDetection(
-                bias_type=BiasType.PANIC_SELLING,
-                level=level,
-                confidence=min(risk_score / 100, 0.95),
-                evidence=evidence,
-                risk_score=risk_score,
-                detected_at=datetime.now()
-            )
-            
-        except Exception as e:
-            logger.error(f"공황 매도 감지 실패: {e}")
+        # 매도 주문이 아니면 스킵
+        if inputs.order_side != "sell":
             return None
+        
+        risk_score, ev = _panic_score(
+            _PANIC_T, _PANIC_W,
+            float(inputs.price_change_1h), float(inputs.fear_greed_index), float(inputs.decision_time_seconds),
+            float(inputs.unrealized_pnl_pct), float(inputs.liquidations_24h)
+        )
+        
+        # 편향 수준 결정
+        level = _classify_level(BiasType.PANIC_SELLING, risk_score)
+        if level is None:
+            return None
+        
+        evidence = [None] * ev.bit_count()
+        n = 0
+        if ev & 1:
+            evidence[n] = f"1시간 {abs(inputs.price_change_1h)*100:.1f}% 급락"
+            n += 1
+        if ev & 2:
+            evidence[n] = f"극도의 공포 상태 (공포지수: {inputs.fear_greed_index})"
+            n += 1
+        if ev & 4:
+            evidence[n] = f"성급한 매도 결정 ({inputs.decision_time_seconds}초)"
+            n += 1
+        if ev & 8:
+            evidence[n] = f"손실 상태 매도 ({inputs.unrealized_pnl_pct*100:.1f}%)"
+            n += 1
+        if ev & 16:
+            evidence[n] = "대규모 청산 발생"
+            n += 1
+        
+        return BiasDetection(
+            bias_type=BiasType.PANIC_SELLING,
+            level=level,
+            confidence=0.95 if risk_score >= 95 else risk_score / 100,
+            evidence=evidence,
+            risk_score=risk_score,
+            detected_at=now
+        )
     
-    def _detect_overconfidence(
-        self,
-        decision_data: Dict[str, Any],
-        market_context: Dict[str, Any],
-        user_history: Dict[str, Any]
-    ) -> Optional[BiasDetection]:
+    def _detect_overconfidence(self, inputs: _Inputs, *, now: datetime) -> Optional[BiasDetection]:
         """과신 편향 감지"""
         
-        try:
-            evidence = []
-            risk_score = 0.0
-            
-            # 연속 수익 거래
-            consecutive_wins = user_history.get("consecutive_wins", 0)
-            if consecutive_wins >= 5:
-                evidence.append(f"연속 {consecutive_wins}회 수익")
-                risk_score += 30
-            
-            # 포지션 크기 급증
-            avg_position_size = user_history.get("avg_position_size", 100000)
-            current_position = decision_data.get("order_amount", 0)
-            if current_position > avg_position_size * 2:
-                size_ratio = current_position / avg_position_size
-                evidence.append(f"평소 {size_ratio:.1f}배 포지션 크기")
-                risk_score += 25
-            
-            # 거래 빈도 증가
-            recent_trades = user_history.get("trades_last_7d", 0)
-            avg_trades = user_history.get("avg_trades_per_week", 1)
-            if recent_trades > avg_trades * 3:
-                evidence.append(f"거래 빈도 {recent_trades/avg_trades:.1f}배 증가")
-                risk_score += 20
-            
-            # 높은 기대 수익률
-            expected_return = decision_data.get("expected_return", 0)
-            if expected_return > 0.5:  # 50% 이상 기대
-                evidence.append(f"비현실적 기대수익률 {expected_return*100:.1f}%")
-                risk_score += 15
-            
-            # 리스크 관리 무시
-            stop_loss = decision_data.get("has_stop_loss", True)
-            if not stop_loss:
-                evidence.append("손절매 설정 없음")
-                risk_score += 10
-            
-            # 편향 수준 결정
-            if risk_score >= 70:
-                level = BiasLevel.CRITICAL
-            elif risk_score >= 50:
-                level = BiasLevel.HIGH
-            elif risk_score >= 30:
-                level = BiasLevel.MEDIUM
-            else:
-                return None
-            
-            return BiasDetection(
-                bias_type=BiasType.OVERCONFIDENCE,
-                level=level,
-                confidence=min(risk_score / 100, 0.9),
-                evidence=evidence,
-                risk_score=risk_score,
-                detected_at=datetime.now()
-            )
-            
-        except Exception as e:
-            logger.error(f"과신 편향 감지 실패: {e}")
+        risk_score, ev = _overconfidence_score(
+            _OVERCONFIDENCE_T, _OVERCONFIDENCE_W,
+            float(inputs.consecutive_wins), float(inputs.avg_position_size), float(inputs.order_amount),
+            float(inputs.trades_last_7d), float(inputs.avg_trades_per_week), float(inputs.expected_return),
+            inputs.has_stop_loss
+        )
+        
+        # 편향 수준 결정
+        level = _classify_level(BiasType.OVERCONFIDENCE, risk_score)
+        if level is None:
             return None
+        
+        evidence = [None] * ev.bit_count()
+        n = 0
+        if ev & 1:
+            evidence[n] = f"연속 {inputs.consecutive_wins}회 수익"
+            n += 1
+        if ev & 2:
+            evidence[n] = f"평소 {inputs.order_amount/inputs.avg_position_size:.1f}배 포지션 크기"
+            n += 1
+        if ev & 4:
+            evidence[n] = f"거래 빈도 {inputs.trades_last_7d/inputs.avg_trades_per_week:.1f}배 증가"
+            n += 1
+        if ev & 8:
+            evidence[n] = f"비현실적 기대수익률 {inputs.expected_return*100:.1f}%"
+            n += 1
+        if ev & 16:
+            evidence[n] = "손절매 설정 없음"
+            n += 1
+        
+        return BiasDetection(
+            bias_type=BiasType.OVERCONFIDENCE,
+            level=level,
+            confidence=0.9 if risk_score >= 90 else risk_score / 100,
+            evidence=evidence,
+            risk_score=risk_score,
+            detected_at=now
+        )
     
-    def _detect_loss_aversion(
-        self,
-        decision_data: Dict[str, Any],
-        market_context: Dict[str, Any],
-        user_history: Dict[str, Any]
-    ) -> Optional[BiasDetection]:
+    def _detect_loss_aversion(self, inputs: _Inputs, *, now: datetime) -> Optional[BiasDetection]:
         """손실 회피 편향 감지"""
         
-        try:
-            evidence = []
-            risk_score = 0.0
-            
-            # 장기간 손실 포지션 보유
-            holding_positions = user_history.get("current_positions", [])
-            for position in holding_positions:
-                unrealized_loss = position.get("unrealized_pnl_pct", 0)
-                holding_days = position.get("holding_days", 0)
-                
-                if unrealized_loss < -0.20 and holding_days > 30:  # 20% 이상 손실, 30일 이상
-                    evidence.append(f"{position.get('asset')} {holding_days}일간 {abs(unrealized_loss)*100:.1f}% 손실 보유")
-                    risk_score += 30
-                
-                if unrealized_loss < -0.30 and holding_days > 60:  # 더 심각한 경우
-                    risk_score += 20
-            
-            # 손절매 회피 패턴
-            stop_loss_hits = user_history.get("stop_loss_triggered_count", 0)
-            total_loss_trades = user_history.get("total_loss_trades", 1)
-            if total_loss_trades > 5 and stop_loss_hits / total_loss_trades < 0.1:
-                evidence.append("손절매 회피 패턴 (자동 손절 비율 매우 낮음)")
-                risk_score += 25
-            
-            # 평균 손실 크기
-            avg_loss_pct = user_history.get("avg_loss_percentage", 0)
-            if avg_loss_pct > 0.25:  # 평균 25% 이상 손실
-                evidence.append(f"평균 손실률 {avg_loss_pct*100:.1f}% (과도함)")
-                risk_score += 20
-            
-            # 현재 의사결정이 손실 회피인지
-            if decision_data.get("order_side") == "hold" and decision_data.get("unrealized_pnl_pct", 0) < -0.15:
-                evidence.append("15% 이상 손실 상황에서 보유 지속 결정")
-                risk_score += 15
-            
-            # 편향 수준 결정
-            if risk_score >= 60:
-                level = BiasLevel.HIGH
-            elif risk_score >= 40:
-                level = BiasLevel.MEDIUM
-            elif risk_score >= 20:
-                level = BiasLevel.LOW
-            else:
-                return None
-            
-            return BiasDetection(
-                bias_type=BiasType.LOSS_AVERSION,
-                level=level,
-                confidence=min(risk_score / 100, 0.85),
-                evidence=evidence,
-                risk_score=risk_score,
-                detected_at=datetime.now()
-            )
-            
-        except Exception as e:
-            logger.error(f"손실 회피 편향 감지 실패: {e}")
+        risk_score = 0.0
+        ev = 0
+        
+        # 장기간 손실 포지션 보유
+        pnl = inputs.position_pnl
+        days = inputs.position_days
+        long_loss_idx = np.flatnonzero((pnl < -0.20) & (days > 30))  # 20% 이상 손실, 30일 이상
+        severe_loss = (pnl < -0.30) & (days > 60)  # 더 심각한 경우
+        risk_score += 30 * len(long_loss_idx) + 20 * int(severe_loss.sum())
+        
+        # 손절매 회피 패턴
+        if inputs.total_loss_trades > 5 and inputs.stop_loss_triggered_count / inputs.total_loss_trades < 0.1:
+            risk_score += 25
+            ev |= 1
+        
+        # 평균 손실 크기
+        if inputs.avg_loss_percentage > 0.25:  # 평균 25% 이상 손실
+            risk_score += 20
+            ev |= 2
+        
+        # 현재 의사결정이 손실 회피인지
+        if inputs.order_side == "hold" and inputs.unrealized_pnl_pct < -0.15:
+            risk_score += 15
+            ev |= 4
+        
+        # 편향 수준 결정
+        level = _classify_level(BiasType.LOSS_AVERSION, risk_score)
+        if level is None:
             return None
+        
+        # 근거 문자열은 임계값을 넘은 경우에만 생성
+        evidence = [None] * (len(long_loss_idx) + ev.bit_count())
+        n = 0
+        for i in long_loss_idx:
+            position = inputs.positions[i]
+            evidence[n] = (
+                f"{position.get('asset')} {position.get('holding_days', 0)}일간 "
+                f"{abs(pnl[i])*100:.1f}% 손실 보유"
+            )
+            n += 1
+        if ev & 1:
+            evidence[n] = "손절매 회피 패턴 (자동 손절 비율 매우 낮음)"
+            n += 1
+        if ev & 2:
+            evidence[n] = f"평균 손실률 {inputs.avg_loss_percentage*100:.1f}% (과도함)"
+            n += 1
+        if ev & 4:
+            evidence[n] = "15% 이상 손실 상황에서 보유 지속 결정"
+            n += 1
+        
+        return BiasDetection(
+            bias_type=BiasType.LOSS_AVERSION,
+            level=level,
+            confidence=0.85 if risk_score >= 85 else risk_score / 100,
+            evidence=evidence,
+            risk_score=risk_score,
+            detected_at=now
+        )
     
-    def _detect_anchoring(
-        self,
-        decision_data: Dict[str, Any],
-        market_context: Dict[str, Any],
-        user_history: Dict[str, Any]
-    ) -> Optional[BiasDetection]:
+    def _detect_anchoring(self, inputs: _Inputs, *, now: datetime) -> Optional[BiasDetection]:
         """앵커링 편향 감지"""
         
-        try:
-            evidence = []
-            risk_score = 0.0
-            
-            # 과거 최고가 기준 참조
-            current_price = market_context.get("current_price", 0)
-            all_time_high = market_context.get("all_time_high", current_price)
-            
-            if all_time_high > current_price * 2:  # 최고가가 현재의 2배 이상
-                ath_ratio = all_time_high / current_price
-                evidence.append(f"최고가 대비 {(1-1/ath_ratio)*100:.1f}% 하락 상태")
-                risk_score += 20
-                
-                # 목표가가 최고가 근처인지
-                target_price = decision_data.get("target_price", 0)
-                if target_price > current_price * 1.5:  # 50% 이상 상승 기대
-                    evidence.append(f"현재가 대비 {(target_price/current_price-1)*100:.1f}% 상승 기대")
-                    risk_score += 25
-            
-            # 매수가 기준 앵커링
-            user_positions = user_history.get("current_positions", [])
-            for position in user_positions:
-                entry_price = position.get("entry_price", 0)
-                if entry_price > current_price * 1.3:  # 매수가가 현재가의 1.3배 이상
-                    evidence.append(f"높은 매수가({entry_price:,.0f}) 기준 판단 가능성")
-                    risk_score += 15
-            
-            # 라운드 넘버 앵커링
-            if current_price > 10000:  # 만원 이상일 때
-                round_number_distance = abs(current_price % 10000) / 10000
-                if round_number_distance < 0.05:  # 라운드 넘버 5% 이내
-                    evidence.append(f"라운드 넘버({int(current_price//10000)*10000:,}) 근처에서 결정")
-                    risk_score += 10
-            
-            # 최근 가격 변동 무시
-            price_trend_7d = market_context.get("price_trend_7d", "neutral")
-            if price_trend_7d == "downward" and decision_data.get("order_side") == "buy":
-                evidence.append("하락 추세 무시하고 매수 결정 (앵커링 가능성)")
-                risk_score += 15
-            
-            # 편향 수준 결정
-            if risk_score >= 50:
-                level = BiasLevel.HIGH
-            elif risk_score >= 30:
-                level = BiasLevel.MEDIUM
-            elif risk_score >= 15:
-                level = BiasLevel.LOW
-            else:
-                return None
-            
-            return BiasDetection(
-                bias_type=BiasType.ANCHORING,
-                level=level,
-                confidence=min(risk_score / 80, 0.8),  # 앵커링은 확실성이 낮음
-                evidence=evidence,
-                risk_score=risk_score,
-                detected_at=datetime.now()
-            )
+        risk_score = 0.0
+        ev = 0
+        current_price = inputs.current_price
+        
+        # 과거 최고가 기준 참조 (최고가가 현재의 2배 이상)
+        if current_price > 0 and inputs.all_time_high > current_price * 2:
+            risk_score += 20
+            ev |= 1
             
-        except Exception as e:
-            logger.error(f"앵커링 편향 감지 실패: {e}")
+            # 목표가가 최고가 근처인지
+            if inputs.target_price > current_price * 1.5:  # 50% 이상 상승 기대
+                risk_score += 25
+                ev |= 2
+        
+        # 매수가 기준 앵커링 (매수가가 현재가의 1.3배 이상)
+        high_entries = inputs.position_entry[inputs.position_entry > current_price * 1.3]
+        risk_score += 15 * len(high_entries)
+        
+        # 라운드 넘버 앵커링
+        if current_price > 10000:  # 만원 이상일 때
+            round_number_distance = abs(current_price % 10000) / 10000
+            if round_number_distance < 0.05:  # 라운드 넘버 5% 이내
+                risk_score += 10
+                ev |= 4
+        
+        # 최근 가격 변동 무시
+        if inputs.price_trend_7d == "downward" and inputs.order_side == "buy":
+            risk_score += 15
+            ev |= 8
+        
+        # 편향 수준 결정
+        level = _classify_level(BiasType.ANCHORING, risk_score)
+        if level is None:
             return None
+        
+        evidence = [None] * (ev.bit_count() + len(high_entries))
+        n = 0
+        if ev & 1:
+            ath_ratio = inputs.all_time_high / current_price
+            evidence[n] = f"최고가 대비 {(1-1/ath_ratio)*100:.1f}% 하락 상태"
+            n += 1
+        if ev & 2:
+            evidence[n] = f"현재가 대비 {(inputs.target_price/current_price-1)*100:.1f}% 상승 기대"
+            n += 1
+        for entry_price in high_entries:
+            evidence[n] = f"높은 매수가({entry_price:,.0f}) 기준 판단 가능성"
+            n += 1
+        if ev & 4:
+            evidence[n] = f"라운드 넘버({int(current_price//10000)*10000:,}) 근처에서 결정"
+            n += 1
+        if ev & 8:
+            evidence[n] = "하락 추세 무시하고 매수 결정 (앵커링 가능성)"
+            n += 1
+        
+        return BiasDetection(
+            bias_type=BiasType.ANCHORING,
+            level=level,
+            confidence=0.8 if risk_score >= 64 else risk_score / 80,  # 앵커링은 확실성이 낮음
+            evidence=evidence,
+            risk_score=risk_score,
+            detected_at=now
+        )
     
-    def _detect_herding(
-        self,
-        decision_data: Dict[str, Any],
-        market_context: Dict[str, Any],
-        user_history: Dict[str, Any]
-    ) -> Optional[BiasDetection]:
+    def _detect_herding(self, inputs: _Inputs, *, now: datetime) -> Optional[BiasDetection]:
         """군중 심리 편향 감지"""
         
-        try:
-            evidence = []
-            risk_score = 0.0
-            
-            # 소셜 미디어 센티먼트와 동일한 방향
-            social_sentiment = market_context.get("social_sentiment", 0.5)
-            order_side = decision_data.get("order_side")
-            
-            if social_sentiment > 0.8 and order_side == "buy":
-                evidence.append("소셜 미디어 극도 낙관과 동일한 매수 결정")
-                risk_score += 30
-            elif social_sentiment < 0.2 and order_side == "sell":
-                evidence.append("소셜 미디어 극도 비관과 동일한 매도 결정")
-                risk_score += 30
-            
-            # 거래량 급증 시 동참
-            volume_surge = market_context.get("volume_surge", 1.0)
-            if volume_surge > 3.0:
-                evidence.append(f"거래량 {volume_surge:.1f}배 급증 시 거래 동참")
-                risk_score += 20
-            
-            # 뉴스/이벤트 직후 거래
-            news_impact = market_context.get("news_impact_score", 0)  # -1 to 1
-            decision_delay = decision_data.get("time_since_news_minutes", 1440)  # 기본 24시간
-            
-            if abs(news_impact) > 0.7 and decision_delay < 60:  # 1시간 이내
-                evidence.append("중대 뉴스 직후 즉석 거래 (군중 심리 가능성)")
-                risk_score += 25
-            
-            # 인플루언서 의견과 동일
-            influencer_sentiment = market_context.get("influencer_sentiment", 0.5)
-            if (influencer_sentiment > 0.8 and order_side == "buy") or \
-               (influencer_sentiment < 0.2 and order_side == "sell"):
-                evidence.append("인플루언서 의견과 동일한 방향 거래")
-                risk_score += 15
-            
-            # 독립적 분석 부재
-            has_analysis = decision_data.get("has_independent_analysis", True)
-            if not has_analysis:
-                evidence.append("독립적 분석 없이 거래 결정")
-                risk_score += 20
-            
-            # 편향 수준 결정
-            if risk_score >= 60:
-                level = BiasLevel.HIGH
-            elif risk_score >= 40:
-                level = BiasLevel.MEDIUM
-            elif risk_score >= 20:
-                level = BiasLevel.LOW
-            else:
-                return None
-            
-            return BiasDetection(
-                bias_type=BiasType.HERDING,
-                level=level,
-                confidence=min(risk_score / 100, 0.85),
-                evidence=evidence,
-                risk_score=risk_score,
-                detected_at=datetime.now()
-            )
-            
-        except Exception as e:
-            logger.error(f"군중 심리 감지 실패: {e}")
+        t, w = _HERDING_T, _HERDING_W
+        risk_score = 0.0
+        ev = 0
+        order_side = inputs.order_side
+        
+        # 소셜 미디어 센티먼트와 동일한 방향
+        if inputs.social_sentiment > t['sentiment'] and order_side == "buy":
+            risk_score += w[0]
+            ev |= 1
+        elif inputs.social_sentiment < t['sentiment_low'] and order_side == "sell":
+            risk_score += w[0]
+            ev |= 2
+        
+        # 거래량 급증 시 동참
+        if inputs.volume_surge > t['volume_surge']:
+            risk_score += w[1]
+            ev |= 4
+        
+        # 뉴스/이벤트 직후 거래 (1시간 이내)
+        if abs(inputs.news_impact_score) > t['news_impact'] and inputs.time_since_news_minutes < t['news_minutes']:
+            risk_score += w[2]
+            ev |= 8
+        
+        # 인플루언서 의견과 동일
+        influencer_sentiment = inputs.influencer_sentiment
+        if (influencer_sentiment > t['sentiment'] and order_side == "buy") or \
+           (influencer_sentiment < t['sentiment_low'] and order_side == "sell"):
+            risk_score += w[3]
+            ev |= 16
+        
+        # 독립적 분석 부재
+        if not inputs.has_independent_analysis:
+            risk_score += w[4]
+            ev |= 32
+        
+        # 편향 수준 결정
+        level = _classify_level(BiasType.HERDING, risk_score)
+        if level is None:
             return None
+        
+        evidence = [None] * ev.bit_count()
+        n = 0
+        if ev & 1:
+            evidence[n] = "소셜 미디어 극도 낙관과 동일한 매수 결정"
+            n += 1
+        if ev & 2:
+            evidence[n] = "소셜 미디어 극도 비관과 동일한 매도 결정"
+            n += 1
+        if ev & 4:
+            evidence[n] = f"거래량 {inputs.volume_surge:.1f}배 급증 시 거래 동참"
+            n += 1
+        if ev & 8:
+            evidence[n] = "중대 뉴스 직후 즉석 거래 (군중 심리 가능성)"
+            n += 1
+        if ev & 16:
+            evidence[n] = "인플루언서 의견과 동일한 방향 거래"
+            n += 1
+        if ev & 32:
+            evidence[n] = "독립적 분석 없이 거래 결정"
+            n += 1
+        
+        return BiasDetection(
+            bias_type=BiasType.HERDING,
+            level=level,
+            confidence=0.85 if risk_score >= 85 else risk_score / 100,
+            evidence=evidence,
+            risk_score=risk_score,
+            detected_at=now
+        )
     
     def apply_prevention_measures(
         self, 
         biases: List[BiasDetection],
-        original_decision: Dict[str, Any]
+        original_decision: Dict[str, Any],
+        *,
+        now_mono: Optional[float] = None
     ) -> Dict[str, Any]:
-        """방지 조치 적용"""
+        """
+        방지 조치 적용
+        
+        Args:
+            now_mono: 쿨링 기간 기준 시각 (time.monotonic, 생략 시 한 번 측정)
+        """
         
         try:
+            if now_mono is None:
+                now_mono = time.monotonic()
+            
             prevention_result = {
                 "decision_modified": False,
                 "actions_taken": [],
@@ -718,21 +1172,25 @@ class BehavioralBiasPrevention:
                 "cooling_period_applied": False
             }
             
+            # 실제 적용된 조치 (actions_taken은 표시용 문자열)
+            applied_actions: Set[PreventionAction] = set()
+            
             # 편향별 방지 조치 적용
-            for bias in sorted(biases, key=lambda x: x.risk_score, reverse=True):
-                measures = self._get_prevention_measures(bias)
-                
+            ordered = sorted(biases, key=_RISK_KEY, reverse=True)
+            for bias, measures in zip(ordered, self._get_prevention_measures_batch(ordered)):
                 for action in measures:
                     if action == PreventionAction.BLOCK_ORDER:
                         prevention_result["modified_decision"]["blocked"] = True
                         prevention_result["decision_modified"] = True
                         prevention_result["actions_taken"].append("주문 차단")
+                        applied_actions.add(action)
                         
                     elif action == PreventionAction.DELAY_EXECUTION:
                         delay_minutes = self._calculate_delay(bias.level)
                         prevention_result["modified_decision"]["delay_minutes"] = delay_minutes
                         prevention_result["decision_modified"] = True
                         prevention_result["actions_taken"].append(f"{delay_minutes}분 지연")
+                        applied_actions.add(action)
                         
                     elif action == PreventionAction.REQUIRE_CONFIRMATION:
                         prevention_result["requires_confirmation"] = True
@@ -749,6 +1207,7 @@ class BehavioralBiasPrevention:
                         prevention_result["actions_taken"].append(
                             f"주문 금액 {reduction_rate*100:.0f}% 축소"
                         )
+                        applied_actions.add(action)
                         
                     elif action == PreventionAction.WARN_USER:
                         warning_msg = self._generate_warning_message(bias)
@@ -756,24 +1215,24 @@ class BehavioralBiasPrevention:
                         
                     elif action == PreventionAction.COOLING_PERIOD:
                         cooling_hours = self._calculate_cooling_period(bias.level)
-                        self.cooling_periods[bias.bias_type.value] = (
-                            datetime.now() + timedelta(hours=cooling_hours)
-                        )
+                        self._set_cooling(bias.bias_type, now_mono + cooling_hours * 3600.0)
                         prevention_result["cooling_period_applied"] = True
                         prevention_result["actions_taken"].append(f"{cooling_hours}시간 쿨링 기간")
+                        applied_actions.add(action)
             
             # 이벤트 기록
+            prevented_actions = [action for action in PreventionAction if action in applied_actions]
+            snapshot = MappingProxyType(dict(original_decision))  # 모든 이벤트가 공유
             for bias in biases:
                 event = BiasEvent(
-                    event_id=f"{bias.bias_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                    event_id=f"{bias.bias_type.value}_{next(_event_counter)}",
                     bias_type=bias.bias_type,
                     level=bias.level,
                     triggered_at=bias.detected_at,
-                    original_decision=original_decision.copy(),
-                    prevented_actions=[action for action in PreventionAction 
-                                     if action.value in prevention_result["actions_taken"]]
+                    original_decision=snapshot,
+                    prevented_actions=list(prevented_actions)
                 )
-                self.bias_history.append(event)
+                self._record_event(event)
             
             logger.info(f"편향 방지 조치 적용: {len(prevention_result['actions_taken'])}개 조치")
             return prevention_result
@@ -789,86 +1248,81 @@ class BehavioralBiasPrevention:
                 "cooling_period_applied": False
             }
     
-    def _get_prevention_measures(self, bias: BiasDetection) -> List[PreventionAction]:
+    def _get_prevention_measures(self, bias: BiasDetection) -> Tuple[PreventionAction, ...]:
         """편향별 방지 조치 결정"""
-        
-        measures = []
-        
-        if bias.bias_type == BiasType.FOMO:
-            if bias.level == BiasLevel.CRITICAL:
-                measures = [PreventionAction.DELAY_EXECUTION, PreventionAction.REDUCE_AMOUNT, 
-                           PreventionAction.REQUIRE_CONFIRMATION]
-            elif bias.level == BiasLevel.HIGH:
-                measures = [PreventionAction.DELAY_EXECUTION, PreventionAction.WARN_USER]
-            else:
-                measures = [PreventionAction.WARN_USER]
-                
-        elif bias.bias_type == BiasType.PANIC_SELLING:
-            if bias.level == BiasLevel.CRITICAL:
-                measures = [PreventionAction.BLOCK_ORDER, PreventionAction.COOLING_PERIOD]
-            elif bias.level == BiasLevel.HIGH:
-                measures = [PreventionAction.DELAY_EXECUTION, PreventionAction.REQUIRE_CONFIRMATION]
-            else:
-                measures = [PreventionAction.WARN_USER]
-                
-        elif bias.bias_type == BiasType.OVERCONFIDENCE:
-            measures = [PreventionAction.REDUCE_AMOUNT, PreventionAction.WARN_USER, 
-                       PreventionAction.COOLING_PERIOD]
-                       
-        else:  # 기타 편향들
-            if bias.level in [BiasLevel.CRITICAL, BiasLevel.HIGH]:
-                measures = [PreventionAction.WARN_USER, PreventionAction.REQUIRE_CONFIRMATION]
-            else:
-                measures = [PreventionAction.WARN_USER]
-        
-        return measures
+        return _MEASURES_TABLE.get((bias.bias_type, bias.level), _DEFAULT_MEASURES)
+    
+    def _get_prevention_measures_batch(
+        self, biases: Sequence[BiasDetection]
+    ) -> List[Tuple[PreventionAction, ...]]:
+        """여러 편향의 방지 조치를 한 번에 결정 (biases와 같은 순서)"""
+        table_get = _MEASURES_TABLE.get
+        default = _DEFAULT_MEASURES
+        return [table_get((bias.bias_type, bias.level), default) for bias in biases]
     
     def _calculate_delay(self, level: BiasLevel) -> int:
         """지연 시간 계산 (분)"""
-        delay_map = {
-            BiasLevel.LOW: 5,
-            BiasLevel.MEDIUM: 15,
-            BiasLevel.HIGH: 30,
-            BiasLevel.CRITICAL: 60
-        }
-        return delay_map.get(level, 15)
+        return _DELAY_MINUTES.get(level, 15)
     
     def _calculate_reduction_rate(self, level: BiasLevel) -> float:
         """금액 축소율 계산"""
-        reduction_map = {
-            BiasLevel.LOW: 0.1,      # 10% 축소
-            BiasLevel.MEDIUM: 0.25,  # 25% 축소
-            BiasLevel.HIGH: 0.4,     # 40% 축소
-            BiasLevel.CRITICAL: 0.6  # 60% 축소
-        }
-        return reduction_map.get(level, 0.25)
+        return _REDUCTION_RATES.get(level, 0.25)
     
     def _calculate_cooling_period(self, level: BiasLevel) -> int:
         """쿨링 기간 계산 (시간)"""
-        cooling_map = {
-            BiasLevel.LOW: 1,
-            BiasLevel.MEDIUM: 4,
-            BiasLevel.HIGH: 12,
-            BiasLevel.CRITICAL: 24
-        }
-        return cooling_map.get(level, 4)
+        return _COOLING_HOURS.get(level, 4)
     
     def _generate_warning_message(self, bias: BiasDetection) -> str:
         """경고 메시지 생성"""
+        return bias.warning_message
+    
+    def set_rule_active(self, rule_id: str, active: bool = True):
+        """방지 규칙 활성/비활성 (이 인스턴스에만 적용)"""
+        if active:
+            self.active_rule_ids.add(rule_id)
+        else:
+            self.active_rule_ids.discard(rule_id)
+    
+    def _record_event(self, event: BiasEvent):
+        """이벤트 기록 및 통계 집계 갱신 (가득 찬 경우 가장 오래된 이벤트 제거)"""
         
-        bias_messages = {
-            BiasType.FOMO: "급등 상황에서 FOMO(기회상실 공포)가 감지되었습니다. 신중한 판단이 필요합니다.",
-            BiasType.PANIC_SELLING: "급락 상황에서 공황 매도 심리가 감지되었습니다. 감정적 매도를 피하세요.",
-            BiasType.OVERCONFIDENCE: "연승 이후 과신 편향이 감지되었습니다. 리스크 관리를 재점검하세요.",
-            BiasType.LOSS_AVERSION: "손실 회피 편향이 감지되었습니다. 손절매 규칙을 재검토하세요.",
-            BiasType.ANCHORING: "과거 가격에 대한 앵커링 편향 가능성이 있습니다. 현재 시장 상황을 재평가하세요.",
-            BiasType.HERDING: "군중 심리를 따라가는 패턴이 감지되었습니다. 독립적 분석을 권장합니다."
-        }
+        history = self.bias_history
+        if len(history) == history.maxlen:
+            self._forget_event(history[0])
+        history.append(event)
         
-        base_message = bias_messages.get(bias.bias_type, "심리적 편향이 감지되었습니다.")
-        evidence_text = " | ".join(bias.evidence[:2])  # 주요 근거 2개만
+        self._type_counts[event.bias_type] += 1
+        self._level_counts[event.level] += 1
+        if event.prevented_actions:
+            self._prevented_count += 1
+        if event.user_override:
+            self._override_count += 1
+        self._recent_triggered.append(event.triggered_at.timestamp())
+    
+    def _forget_event(self, event: BiasEvent):
+        """이력에서 밀려나는 이벤트를 통계 집계에서 제외"""
         
-        return f"{base_message} 근거: {evidence_text}"
+        for counts, key in ((self._type_counts, event.bias_type), (self._level_counts, event.level)):
+            counts[key] -= 1
+            if not counts[key]:
+                del counts[key]
+        if event.prevented_actions:
+            self._prevented_count -= 1
+        if event.user_override:
+            self._override_count -= 1
+    
+    def record_user_override(self, event: BiasEvent):
+        """사용자가 방지 조치를 무시하고 진행한 이벤트 기록"""
+        
+        if event.user_override:
+            return
+        event.user_override = True
+        self.user_overrides[event.bias_type] = self.user_overrides.get(event.bias_type, 0) + 1
+        self._override_count += 1
+    
+    def to_list(self) -> List[BiasEvent]:
+        """편향 이벤트 이력 (오래된 순) 리스트 사본"""
+        return list(self.bias_history)
     
     def get_bias_statistics(self) -> Dict[str, Any]:
         """편향 통계"""
@@ -877,54 +1331,61 @@ class BehavioralBiasPrevention:
             if not self.bias_history:
                 return {"total_events": 0}
             
-            # 편향 유형별 통계
-            type_counts = {}
-            level_counts = {}
-            
-            for event in self.bias_history:
-                bias_type = event.bias_type.value
-                level = event.level.value
-                
-                type_counts[bias_type] = type_counts.get(bias_type, 0) + 1
-                level_counts[level] = level_counts.get(level, 0) + 1
-            
-            # 방지 효과 통계
-            prevented_count = len([e for e in self.bias_history if e.prevented_actions])
-            override_count = len([e for e in self.bias_history if e.user_override])
+            now_mono = time.monotonic()
+            inv_total = 1.0 / len(self.bias_history)
             
-            # 최근 7일 편향 발생 빈도
-            recent_events = [
-                e for e in self.bias_history 
-                if (datetime.now() - e.triggered_at).days <= 7
-            ]
+            # 최근 7일 편향 발생 빈도 ((now - 발생 시각).days <= 7)
+            cutoff = time.time() - _RECENT_WINDOW_SECONDS
+            recent = self._recent_triggered
+            while recent and recent[0] <= cutoff:
+                recent.popleft()
             
             return {
                 "total_events": len(self.bias_history),
-                "recent_7d_events": len(recent_events),
-                "bias_type_distribution": type_counts,
-                "severity_distribution": level_counts,
-                "prevention_rate": prevented_count / len(self.bias_history) if self.bias_history else 0,
-                "user_override_rate": override_count / len(self.bias_history) if self.bias_history else 0,
-                "active_cooling_periods": len([
-                    cp for cp in self.cooling_periods.values() 
-                    if cp > datetime.now()
-                ])
+                "recent_7d_events": len(recent),
+                "bias_type_distribution": {bias_type.value: count for bias_type, count in self._type_counts.items()},
+                "severity_distribution": {level.value: count for level, count in self._level_counts.items()},
+                "prevention_rate": self._prevented_count * inv_total,
+                "user_override_rate": self._override_count * inv_total,
+                "active_cooling_periods": self._active_cooling_count(now_mono)
             }
             
         except Exception as e:
             logger.error(f"편향 통계 계산 실패: {e}")
             return {"error": str(e)}
     
+    def is_cooling(self, bias_type: BiasType) -> bool:
+        """쿨링 기간 중인지 (단조 시계 비교만 수행)"""
+        return self.cooling_periods.get(bias_type, 0.0) > time.monotonic()
+    
     def is_in_cooling_period(self, bias_type: BiasType) -> Tuple[bool, Optional[datetime]]:
-        """쿨링 기간 확인"""
+        """쿨링 기간 확인 (종료 시각은 현재 벽시계 기준으로 환산)"""
         
-        bias_key = bias_type.value
-        if bias_key in self.cooling_periods:
-            cooling_end = self.cooling_periods[bias_key]
-            if datetime.now() < cooling_end:
-                return True, cooling_end
+        cooling_end = self.cooling_periods.get(bias_type)
+        if cooling_end is not None:
+            remaining = cooling_end - time.monotonic()
+            if remaining > 0:
+                return True, datetime.now() + timedelta(seconds=remaining)
             else:
                 # 만료된 쿨링 기간 제거
-                del self.cooling_periods[bias_key]
+                self._clear_cooling(bias_type)
         
-        return False, None
\ No newline at end of file
+        return False, None
+    
+    def _set_cooling(self, bias_type: BiasType, cooling_end: float):
+        """쿨링 기간 설정 (정렬된 종료 시각 목록도 함께 갱신)"""
+        self._clear_cooling(bias_type)
+        self.cooling_periods[bias_type] = cooling_end
+        insort(self._cooling_expiries, cooling_end)
+    
+    def _clear_cooling(self, bias_type: BiasType):
+        """쿨링 기간 제거"""
+        cooling_end = self.cooling_periods.pop(bias_type, None)
+        if cooling_end is not None:
+            expiries = self._cooling_expiries
+            del expiries[bisect_left(expiries, cooling_end)]
+    
+    def _active_cooling_count(self, now_mono: float) -> int:
+        """진행 중인 쿨링 기간 수 (정렬된 종료 시각 목록에서 이분 탐색)"""
+        expiries = self._cooling_expiries
+        return len(expiries) - bisect_right(expiries, now_mono)
\ No newline at end of file
@@ -8,6 +8,10 @@ DCA+ Strategy (Dollar Cost Averaging Plus)
 - 세금 효율적인 매수 스케줄링
 """
 
+import warnings
+import weakref
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
@@ -17,6 +21,7 @@ import numpy as np
 from loguru import logger
 
 from ..utils.market_data_provider import MarketDataProvider
+from ..utils.numba_compat import NUMBA_AVAILABLE, njit
 
 
 @dataclass
@@ -75,6 +80,264 @@ class DCASchedule:
     tax_optimization: bool  # 세금 최적화 여부
 
 
+# 시장 상황 분석 결과 캐시 크기 (BTC 데이터프레임 기준)
+_MARKET_CACHE_SIZE = 64
+
+
+def _frame_digest(data: pd.DataFrame) -> int:
+    """시장 분석에 쓰이는 Close / Volume 열 전체 내용의 해시 (제자리 수정 감지용)"""
+    columns = [name for name in ('Close', 'Volume') if name in data.columns]
+    return hash(tuple(
+        data[name].to_numpy(dtype=np.float64, copy=False).tobytes() for name in columns
+    ))
+
+# 공포/탐욕 지수(또는 RSI) 구간 상한 (값 <= 상한이면 해당 구간, NaN은 마지막 구간)
+_FEAR_GREED_BOUNDS = np.array([25.0, 40.0, 55.0, 75.0])
+_FEAR_GREED_LEVELS = (
+    FearGreedLevel.EXTREME_FEAR,
+    FearGreedLevel.FEAR,
+    FearGreedLevel.NEUTRAL,
+    FearGreedLevel.GREED,
+    FearGreedLevel.EXTREME_GREED,
+)
+_FEAR_GREED_MULTIPLIERS = (3.0, 2.0, 1.0, 0.7, 0.3)
+
+
+def _fear_greed_bucket(index_value: float) -> int:
+    """구간 번호 (0: 극도의 공포 ~ 4: 극도의 탐욕)"""
+    return int(np.searchsorted(_FEAR_GREED_BOUNDS, index_value, side='left'))
+
+
+# 트렌드 방향별 배수 (하락 시 더 많이, 상승 시 적게 매수, 그 외 1.0)
+_TREND_MULTIPLIERS = {"down": 1.3, "up": 0.8}
+
+# 축적 신호별 배수
+_ACCUMULATION_MULTIPLIERS = {
+    AccumulationSignal.NONE: 1.0,
+    AccumulationSignal.WEAK: 1.1,
+    AccumulationSignal.MODERATE: 1.2,
+    AccumulationSignal.STRONG: 1.3,
+    AccumulationSignal.EXTREME: 1.5
+}
+
+
+def _volatility_multiplier(price_volatility):
+    """
+    가격 변동성 -> 매수 배수 (8% 초과 1.5, 5% 초과 1.2, 그 외 1.0)
+    
+    스칼라와 배열 모두 받으므로 여러 자산의 변동성을 한 번에 계산할 수 있다.
+    """
+    volatility = np.asarray(price_volatility)
+    return np.select([volatility > 0.08, volatility > 0.05], [1.5, 1.2], default=1.0)
+
+
+# 축적 점수 하한 (점수 >= 하한이면 해당 신호 이상)
+_ACCUMULATION_BOUNDS = (0.2, 0.4, 0.6, 0.8)
+_ACCUMULATION_SIGNALS = (
+    AccumulationSignal.NONE,
+    AccumulationSignal.WEAK,
+    AccumulationSignal.MODERATE,
+    AccumulationSignal.STRONG,
+    AccumulationSignal.EXTREME,
+)
+
+# 축적 점수 구성 요소별 점수 (구간 번호 순)
+_RSI_SCORES = (0.9, 0.6, 0.1)                 # 주간 RSI <= 과매도 기준, <= 45, 그 외
+_MA_DEVIATION_SCORES = (1.0, 0.7, 0.4, 0.1)   # 200주 MA 괴리 <= 기준, <= -15%, <= 0, 그 외
+_VOLUME_SCORES = (0.2, 0.5, 0.8)              # 거래량 비율 < 1.2, >= 1.2, >= 급증 기준
+
+
+def _bucket_at_most(value: float, bounds: Tuple[float, ...]) -> int:
+    """
+    value <= bounds[i] 인 첫 구간 번호 (if value <= ... elif 사다리와 동일, NaN은 마지막 구간)
+    
+    조정된 임계값이 뒤 경계를 넘어 bounds가 정렬되지 않아도 앞 조건이 우선하도록
+    누적 최대값으로 경계를 펴서 탐색한다.
+    """
+    if value != value:
+        return len(bounds)
+    return bisect_left(tuple(accumulate(bounds, max)), value)
+
+
+def _bucket_at_least(value: float, bounds: Tuple[float, ...]) -> int:
+    """
+    value >= bounds[i] 를 만족하는 가장 높은 구간 (if value >= 마지막 경계 ... elif 사다리와 동일, NaN은 0)
+    
+    높은 구간의 조건이 먼저 검사되므로 뒤에서부터의 누적 최소값으로 경계를 편다.
+    """
+    if value != value:
+        return 0
+    lowered = tuple(accumulate(reversed(bounds), min))[::-1]
+    return bisect_right(lowered, value)
+
+
+@njit(cache=True)
+def _rsi_kernel(prices: np.ndarray, period: int) -> np.ndarray:
+    """
+    단순 이동평균 RSI (pandas rolling(period).mean() 기반 계산과 동일, 워밍업 구간은 50)
+    
+    상승/하락 폭의 구간 합을 한 번의 순회로 갱신한다. 구간 안에 상승(하락)이 하나도 없으면
+    합을 정확히 0으로 되돌려 누적 오차로 인한 잘못된 RSI를 막는다.
+    """
+    n = prices.shape[0]
+    out = np.full(n, 50.0)
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+    
+    gain_sum = 0.0
+    loss_sum = 0.0
+    gain_count = 0
+    loss_count = 0
+    for i in range(n):
+        if gains[i] > 0:
+            gain_sum += gains[i]
+            gain_count += 1
+        if losses[i] > 0:
+            loss_sum += losses[i]
+            loss_count += 1
+        if i >= period:
+            j = i - period
+            if gains[j] > 0:
+                gain_sum -= gains[j]
+                gain_count -= 1
+            if losses[j] > 0:
+                loss_sum -= losses[j]
+                loss_count -= 1
+        if i < period - 1:
+            continue
+        if gain_count == 0:
+            gain_sum = 0.0
+        if loss_count == 0:
+            loss_sum = 0.0
+        
+        if loss_sum > 0:
+            rs = (gain_sum / period) / (loss_sum / period)
+            out[i] = 100.0 - 100.0 / (1.0 + rs)
+        elif gain_sum > 0:
+            out[i] = 100.0  # 하락 없음
+        # 상승/하락 모두 없으면 50 유지
+    return out
+
+
+@njit(cache=True)
+def _annualized_volatility(prices: np.ndarray) -> float:
+    """
+    일간 수익률의 연환산 표준편차 (pct_change().dropna().std() * sqrt(365) 와 동일)
+    
+    Welford 방식으로 한 번만 순회하며, 가격이 NaN인 구간의 수익률은 제외한다.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, prices.shape[0]):
+        r = prices[i] / prices[i - 1] - 1.0
+        if r != r:  # NaN
+            continue
+        count += 1
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+    if count < 2:
+        return np.nan
+    return np.sqrt(m2 / (count - 1)) * np.sqrt(365.0)
+
+
+def _precompute_ta_features(close: np.ndarray, volume: Optional[np.ndarray] = None) -> Dict[str, float]:
+    """
+    종가/거래량 배열에서 분석에 쓰는 이동평균, 고저점, 거래량 평균을 한 번에 계산
+    
+    pandas .tail(n).mean() 과 같이 NaN은 제외하고 집계한다 (NaN이 없으면 일반 numpy 집계 사용).
+    """
+    if np.isnan(close).any() or (volume is not None and np.isnan(volume).any()):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # 전부 NaN인 구간은 NaN
+            return _summarize(close, volume, np.nanmean, np.nanmax, np.nanmin)
+    return _summarize(close, volume, np.mean, np.max, np.min)
+
+
+def _summarize(close: np.ndarray, volume: Optional[np.ndarray], mean, high, low) -> Dict[str, float]:
+    features = {
+        "price": close[-1],
+        "ma_10": mean(close[-10:]),
+        "ma_20": mean(close[-20:]),
+        "ma_30": mean(close[-30:]),
+        "ma_50": mean(close[-50:]),
+        "ma_200": mean(close[-200:]),
+        "high_50": high(close[-50:]),
+        "low_50": low(close[-50:]),
+    }
+    if volume is not None:
+        features["volume_10"] = mean(volume[-10:])
+        features["volume_50"] = mean(volume[-50:])
+    return features
+
+
+def _batch_asset_features(closes: Dict[str, np.ndarray]) -> Dict[str, Dict[str, float]]:
+    """
+    여러 자산의 현재가, 10/30일 이동평균, 50일 고저점을 한 번에 계산
+    
+    최근 50개 종가가 모두 있는 자산은 (자산 수, 50) 행렬로 쌓아 축 방향 reduction 한 번으로
+    처리하고, 데이터가 짧거나 NaN이 섞인 자산은 _precompute_ta_features로 개별 계산한다.
+    """
+    stackable = [
+        asset for asset, close in closes.items()
+        if close.shape[0] >= 50 and not np.isnan(close[-50:]).any()
+    ]
+    
+    features: Dict[str, Dict[str, float]] = {}
+    if stackable:
+        window = np.stack([closes[asset][-50:] for asset in stackable])
+        prices = window[:, -1]
+        ma_10 = window[:, -10:].mean(axis=1)
+        ma_30 = window[:, -30:].mean(axis=1)
+        highs = window.max(axis=1)
+        lows = window.min(axis=1)
+        for i, asset in enumerate(stackable):
+            features[asset] = {
+                "price": prices[i],
+                "ma_10": ma_10[i],
+                "ma_30": ma_30[i],
+                "high_50": highs[i],
+                "low_50": lows[i],
+            }
+    
+    for asset, close in closes.items():
+        if asset not in features:
+            features[asset] = _precompute_ta_features(close)
+    return features
+
+
+def _return_sum(close: np.ndarray) -> float:
+    """단순 수익률의 합 (pct_change().sum() 과 동일, NaN 수익률은 제외)"""
+    returns = close[1:] / close[:-1] - 1.0
+    total = returns.sum()
+    if total != total:
+        total = np.nansum(returns)
+    return total
+
+
+def _nan_aware_mean(values: np.ndarray) -> float:
+    """NaN을 제외한 평균 (pandas Series.mean 과 동일, NaN이 없으면 한 번의 reduction)"""
+    mean = values.mean() if values.size else np.nan
+    if mean != mean:
+        valid = values[~np.isnan(values)]
+        mean = valid.mean() if valid.size else np.nan
+    return mean
+
+
+def _frame_features(data: pd.DataFrame) -> Dict[str, float]:
+    """가격 데이터프레임의 기술적 지표 요약 (Volume 컬럼이 없으면 거래량 항목 생략)"""
+    close = data['Close'].to_numpy(dtype=np.float64, copy=False)
+    volume = data['Volume'].to_numpy(dtype=np.float64, copy=False) if 'Volume' in data.columns else None
+    return _precompute_ta_features(close, volume)
+
+
 class DCAPlus:
     """
     DCA+ 전략 엔진
@@ -119,6 +382,9 @@ class DCAPlus:
             "volume_surge_min": 1.5         # 거래량 1.5배 이상 증가
         }
         
+        # (id, 길이, Close/Volume 내용 해시) -> (BTC 데이터프레임 약한 참조, 분석 결과)
+        self._market_analysis_cache: Dict[Tuple[int, int, int], Tuple[weakref.ref, Dict[str, Any]]] = {}
+        
         logger.info("DCA+ 전략 엔진 초기화 완료")
     
     def calculate_dca_signal(
@@ -148,37 +414,15 @@ class DCAPlus:
             trend_direction = market_conditions.get("trend_direction", "neutral")
             
             # 공포/탐욕 지수 기반 배수
-            if fear_greed_index <= 25:  # 극도의 공포
-                fear_greed_multiplier = 3.0
-                fear_greed_level = FearGreedLevel.EXTREME_FEAR
-            elif fear_greed_index <= 40:  # 공포
-                fear_greed_multiplier = 2.0
-                fear_greed_level = FearGreedLevel.FEAR
-            elif fear_greed_index <= 55:  # 중립
-                fear_greed_multiplier = 1.0
-                fear_greed_level = FearGreedLevel.NEUTRAL
-            elif fear_greed_index <= 75:  # 탐욕
-                fear_greed_multiplier = 0.7
-                fear_greed_level = FearGreedLevel.GREED
-            else:  # 극도의 탐욕
-                fear_greed_multiplier = 0.3
-                fear_greed_level = FearGreedLevel.EXTREME_GREED
+            bucket = _fear_greed_bucket(fear_greed_index)
+            fear_greed_multiplier = _FEAR_GREED_MULTIPLIERS[bucket]
+            fear_greed_level = _FEAR_GREED_LEVELS[bucket]
             
             # 변동성 기반 배수
-            if price_volatility > 0.08:  # 8% 이상 고변동성
-                volatility_multiplier = 1.5
-            elif price_volatility > 0.05:  # 5% 이상 중변동성
-                volatility_multiplier = 1.2
-            else:  # 저변동성
-                volatility_multiplier = 1.0
+            volatility_multiplier = float(_volatility_multiplier(price_volatility))
             
             # 트렌드 기반 배수
-            if trend_direction == "down":
-                trend_multiplier = 1.3  # 하락 시 더 많이 매수
-            elif trend_direction == "up":
-                trend_multiplier = 0.8  # 상승 시 적게 매수
-            else:
-                trend_multiplier = 1.0  # 횡보
+            trend_multiplier = _TREND_MULTIPLIERS.get(trend_direction, 1.0)
             
             # 전체 배수 계산 (가중 평균)
             market_adjustment_factor = (
@@ -195,7 +439,7 @@ class DCAPlus:
             signal_strength = min(1.0, (
                 (100 - fear_greed_index) / 100 * 0.4 +  # 공포 지수 (역방향)
                 min(price_volatility / 0.1, 1.0) * 0.3 +  # 변동성
-                (1.3 if trend_direction == "down" else 0.8 if trend_direction == "up" else 1.0) * 0.3
+                trend_multiplier * 0.3
             ))
             
             # 다음 실행 일자 계산 (기본 주간 DCA)
@@ -281,7 +525,7 @@ class DCAPlus:
             dca_events = {}
             
             # 시장 상황 분석
-            market_analysis = self._analyze_market_conditions(market_data, current_date)
+            market_analysis = self._get_market_analysis(market_data, current_date)
             
             # 기본 매수 금액 (주기별 분할)
             base_amount = schedule.base_amount_krw * (schedule.frequency_days / 30)  # 월 기준을 주기별로 변환
@@ -297,6 +541,14 @@ class DCAPlus:
                 overall_multiplier = schedule.max_monthly_amount / base_amount
                 logger.warning(f"월간 한도 적용: {overall_multiplier:.2f}x")
             
+            # 자산별 기술적 지표 (분석 대상 자산 전체를 한 번에 계산)
+            asset_features = _batch_asset_features({
+                asset: market_data[asset]['Close'].to_numpy(dtype=np.float64, copy=False)
+                for asset in schedule.assets
+                if asset in market_data and len(market_data[asset]) > 20
+                and 'Close' in market_data[asset].columns
+            })
+            
             # 자산별 DCA 이벤트 생성
             for asset, weight in schedule.assets.items():
                 asset_amount = base_amount * weight * overall_multiplier
@@ -305,7 +557,9 @@ class DCAPlus:
                     continue
                 
                 # 자산별 세부 분석
-                asset_analysis = self._analyze_asset_conditions(asset, market_data, current_date)
+                asset_analysis = self._analyze_asset_conditions(
+                    asset, market_data, current_date, asset_features.get(asset)
+                )
                 
                 # 현재 가격
                 current_price = self._get_current_price(asset, market_data)
@@ -340,6 +594,30 @@ class DCAPlus:
             logger.error(f"DCA+ 매수 금액 계산 실패: {e}")
             return {}
     
+    def _get_market_analysis(self, market_data: Dict[str, pd.DataFrame], date: datetime) -> Dict[str, Any]:
+        """
+        시장 상황 분석 (같은 BTC 데이터에 대한 결과는 재사용)
+        
+        분석은 BTC 데이터만 사용하므로 날짜가 달라도 데이터프레임이 그대로면 결과가 같다.
+        키에 Close / Volume 내용의 해시를 넣어 앞쪽 행이나 거래량을 제자리에서 바꿔도 다시 계산하고,
+        약한 참조로 같은 객체인지 확인하므로 id가 재사용되어도 잘못된 결과를 돌려주지 않는다.
+        """
+        btc_data = market_data.get("BTC")
+        if btc_data is None or len(btc_data) == 0 or 'Close' not in btc_data.columns:
+            return self._analyze_market_conditions(market_data, date)
+        
+        cache = self._market_analysis_cache
+        key = (id(btc_data), len(btc_data), _frame_digest(btc_data))
+        cached = cache.get(key)
+        if cached is not None and cached[0]() is btc_data:
+            return dict(cached[1])
+        
+        analysis = self._analyze_market_conditions(market_data, date)
+        if len(cache) >= _MARKET_CACHE_SIZE:
+            del cache[next(iter(cache))]  # 가장 오래된 항목 제거
+        cache[key] = (weakref.ref(btc_data), analysis)
+        return dict(analysis)
+    
     def _analyze_market_conditions(self, market_data: Dict[str, pd.DataFrame], date: datetime) -> Dict[str, Any]:
         """시장 상황 종합 분석"""
         analysis = {
@@ -355,42 +633,29 @@ class DCAPlus:
             # BTC 데이터 분석 (대표 지표로 사용)
             if "BTC" in market_data and len(market_data["BTC"]) > 30:
                 btc_data = market_data["BTC"]
+                features = _frame_features(btc_data)
                 
                 # 변동성 점수 계산 (최근 30일)
-                recent_returns = btc_data['Close'].tail(30).pct_change().dropna()
-                volatility = recent_returns.std() * np.sqrt(365)  # 연화 변동성
+                close = btc_data['Close'].to_numpy(dtype=np.float64, copy=False)
+                volatility = _annualized_volatility(close[-30:])  # 연화 변동성
                 analysis["volatility_score"] = min(volatility / 1.0, 2.0)  # 0-2 스케일
                 
                 # 공포/탐욕 지수 추정 (RSI 기반)
-                rsi = self._calculate_rsi(btc_data['Close'].tail(60))
+                rsi = _rsi_kernel(close[-60:], 14)
                 if len(rsi) > 0:
-                    current_rsi = rsi.iloc[-1]
-                    if current_rsi <= 25:
-                        analysis["fear_greed_level"] = FearGreedLevel.EXTREME_FEAR
-                    elif current_rsi <= 40:
-                        analysis["fear_greed_level"] = FearGreedLevel.FEAR
-                    elif current_rsi <= 55:
-                        analysis["fear_greed_level"] = FearGreedLevel.NEUTRAL
-                    elif current_rsi <= 75:
-                        analysis["fear_greed_level"] = FearGreedLevel.GREED
-                    else:
-                        analysis["fear_greed_level"] = FearGreedLevel.EXTREME_GREED
+                    current_rsi = rsi[-1]
+                    analysis["fear_greed_level"] = _FEAR_GREED_LEVELS[_fear_greed_bucket(current_rsi)]
                 
                 # 축적 신호 분석
-                accumulation_score = self._calculate_accumulation_score(btc_data)
-                if accumulation_score >= 0.8:
-                    analysis["accumulation_signal"] = AccumulationSignal.EXTREME
-                elif accumulation_score >= 0.6:
-                    analysis["accumulation_signal"] = AccumulationSignal.STRONG
-                elif accumulation_score >= 0.4:
-                    analysis["accumulation_signal"] = AccumulationSignal.MODERATE
-                elif accumulation_score >= 0.2:
-                    analysis["accumulation_signal"] = AccumulationSignal.WEAK
+                accumulation_score = self._calculate_accumulation_score(btc_data, features)
+                analysis["accumulation_signal"] = _ACCUMULATION_SIGNALS[
+                    _bucket_at_least(accumulation_score, _ACCUMULATION_BOUNDS)
+                ]
                 
                 # 트렌드 분석
-                ma_20 = btc_data['Close'].tail(20).mean()
-                ma_200 = btc_data['Close'].tail(200).mean() if len(btc_data) >= 200 else ma_20
-                current_price = btc_data['Close'].iloc[-1]
+                ma_20 = features["ma_20"]
+                ma_200 = features["ma_200"] if len(btc_data) >= 200 else ma_20
+                current_price = features["price"]
                 
                 if current_price > ma_20 > ma_200:
                     analysis["market_trend"] = "bullish"
@@ -400,9 +665,9 @@ class DCAPlus:
                     analysis["market_trend"] = "sideways"
                 
                 # 거래량 프로필
-                if 'Volume' in btc_data.columns:
-                    recent_volume = btc_data['Volume'].tail(10).mean()
-                    avg_volume = btc_data['Volume'].tail(50).mean()
+                if "volume_10" in features:
+                    recent_volume = features["volume_10"]
+                    avg_volume = features["volume_50"]
                     volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1
                     
                     if volume_ratio > 1.5:
@@ -441,27 +706,18 @@ class DCAPlus:
         
         # 3. 축적 신호 기반 배수
         accumulation_signal = market_analysis.get("accumulation_signal", AccumulationSignal.NONE)
-        accumulation_multipliers = {
-            AccumulationSignal.NONE: 1.0,
-            AccumulationSignal.WEAK: 1.1,
-            AccumulationSignal.MODERATE: 1.2,
-            AccumulationSignal.STRONG: 1.3,
-            AccumulationSignal.EXTREME: 1.5
-        }
-        accumulation_multiplier = accumulation_multipliers[accumulation_signal]
+        accumulation_multiplier = _ACCUMULATION_MULTIPLIERS[accumulation_signal]
         
         # 4. 시즌별 조정 (연말, 보너스 시즌 등)
         seasonal_multiplier = self._calculate_seasonal_multiplier(current_date)
         
         # 전체 배수 계산 (곱셈이 아닌 가중 평균으로 극단적 값 방지)
-        components = [
-            (volatility_multiplier, 0.3),
-            (fear_greed_multiplier, 0.4),
-            (accumulation_multiplier, 0.2),
-            (seasonal_multiplier, 0.1)
-        ]
-        
-        weighted_multiplier = sum(mult * weight for mult, weight in components)
+        weighted_multiplier = (
+            volatility_multiplier * 0.3 +
+            fear_greed_multiplier * 0.4 +
+            accumulation_multiplier * 0.2 +
+            seasonal_multiplier * 0.1
+        )
         
         # 최종 배수 제한 (0.2x ~ 3.0x)
         final_multiplier = max(0.2, min(3.0, weighted_multiplier))
@@ -471,58 +727,61 @@ class DCAPlus:
         
         return final_multiplier
     
-    def _calculate_accumulation_score(self, price_data: pd.DataFrame) -> float:
-        """축적 구간 점수 계산 (0-1)"""
+    def _calculate_accumulation_score(
+        self,
+        price_data: pd.DataFrame,
+        features: Optional[Dict[str, float]] = None
+    ) -> float:
+        """
+        축적 구간 점수 계산 (0-1)
+        
+        Args:
+            features: _frame_features(price_data) 결과 (생략 시 계산)
+        """
         try:
+            if features is None:
+                features = _frame_features(price_data)
+            
+            thresholds = self.accumulation_thresholds
             score_components = []
             
             # 1. BTC 도미넌스 (가정: 높은 도미넌스 = 축적)
             # 실제로는 외부 API에서 가져와야 함
             btc_dominance = 0.6  # 기본값
-            if btc_dominance >= self.accumulation_thresholds["btc_dominance_min"]:
+            if btc_dominance >= thresholds["btc_dominance_min"]:
                 score_components.append(0.8)
             else:
                 score_components.append(0.2)
             
+            close = price_data['Close'].to_numpy(dtype=np.float64, copy=False)
+            
             # 2. RSI 기반 과매도
-            rsi = self._calculate_rsi(price_data['Close'].tail(100))
+            rsi = _rsi_kernel(close[-100:], 14)
             if len(rsi) > 0:
-                weekly_rsi = rsi.iloc[-7:].mean()  # 주간 평균 RSI
-                if weekly_rsi <= self.accumulation_thresholds["rsi_weekly_max"]:
-                    score_components.append(0.9)
-                elif weekly_rsi <= 45:
-                    score_components.append(0.6)
-                else:
-                    score_components.append(0.1)
+                weekly_rsi = _nan_aware_mean(rsi[-7:])  # 주간 평균 RSI
+                rsi_bounds = (thresholds["rsi_weekly_max"], 45)
+                score_components.append(_RSI_SCORES[_bucket_at_most(weekly_rsi, rsi_bounds)])
             
             # 3. 200주 MA 대비 위치
             if len(price_data) >= 1400:  # 200주 데이터
-                weekly_prices = price_data['Close'].iloc[::7]  # 주간 샘플링
-                ma_200w = weekly_prices.tail(200).mean()
-                current_price = price_data['Close'].iloc[-1]
+                weekly_prices = close[::7]  # 주간 샘플링 (복사 없는 strided view)
+                ma_200w = _nan_aware_mean(weekly_prices[-200:])
+                current_price = features["price"]
                 ma_deviation = (current_price - ma_200w) / ma_200w
                 
-                if ma_deviation <= self.accumulation_thresholds["ma_deviation_min"]:
-                    score_components.append(1.0)
-                elif ma_deviation <= -0.15:
-                    score_components.append(0.7)
-                elif ma_deviation <= 0:
-                    score_components.append(0.4)
-                else:
-                    score_components.append(0.1)
+                deviation_bounds = (thresholds["ma_deviation_min"], -0.15, 0)
+                score_components.append(
+                    _MA_DEVIATION_SCORES[_bucket_at_most(ma_deviation, deviation_bounds)]
+                )
             
             # 4. 거래량 분석 (높은 거래량 = 관심 증가)
-            if 'Volume' in price_data.columns:
-                recent_volume = price_data['Volume'].tail(10).mean()
-                avg_volume = price_data['Volume'].tail(50).mean()
+            if "volume_10" in features:
+                recent_volume = features["volume_10"]
+                avg_volume = features["volume_50"]
                 volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1
                 
-                if volume_ratio >= self.accumulation_thresholds["volume_surge_min"]:
-                    score_components.append(0.8)
-                elif volume_ratio >= 1.2:
-                    score_components.append(0.5)
-                else:
-                    score_components.append(0.2)
+                volume_bounds = (1.2, thresholds["volume_surge_min"])
+                score_components.append(_VOLUME_SCORES[_bucket_at_least(volume_ratio, volume_bounds)])
             
             return np.mean(score_components) if score_components else 0.0
             
@@ -530,8 +789,19 @@ class DCAPlus:
             logger.error(f"축적 점수 계산 실패: {e}")
             return 0.0
     
-    def _analyze_asset_conditions(self, asset: str, market_data: Dict[str, pd.DataFrame], date: datetime) -> Dict[str, Any]:
-        """개별 자산 상황 분석"""
+    def _analyze_asset_conditions(
+        self,
+        asset: str,
+        market_data: Dict[str, pd.DataFrame],
+        date: datetime,
+        features: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """
+        개별 자산 상황 분석
+        
+        Args:
+            features: _batch_asset_features 로 미리 계산한 지표 (생략 시 계산)
+        """
         analysis = {
             "relative_strength": 0.5,
             "support_level": 0,
@@ -542,24 +812,28 @@ class DCAPlus:
         try:
             if asset in market_data and len(market_data[asset]) > 20:
                 asset_data = market_data[asset]
-                current_price = asset_data['Close'].iloc[-1]
+                if features is None:
+                    features = _frame_features(asset_data)
+                current_price = features["price"]
                 
                 # 상대 강도 (vs BTC)
                 if "BTC" in market_data and asset != "BTC":
-                    btc_return = market_data["BTC"]['Close'].tail(30).pct_change().sum()
-                    asset_return = asset_data['Close'].tail(30).pct_change().sum()
+                    btc_close = market_data["BTC"]['Close'].to_numpy(dtype=np.float64, copy=False)
+                    asset_close = asset_data['Close'].to_numpy(dtype=np.float64, copy=False)
+                    btc_return = _return_sum(btc_close[-30:])
+                    asset_return = _return_sum(asset_close[-30:])
                     relative_performance = (asset_return - btc_return) + 1
                     analysis["relative_strength"] = max(0, min(2, relative_performance))
                 
                 # 지지/저항 레벨
-                recent_high = asset_data['Close'].tail(50).max()
-                recent_low = asset_data['Close'].tail(50).min()
+                recent_high = features["high_50"]
+                recent_low = features["low_50"]
                 analysis["support_level"] = recent_low
                 analysis["resistance_level"] = recent_high
                 
                 # 트렌드 점수
-                ma_short = asset_data['Close'].tail(10).mean()
-                ma_long = asset_data['Close'].tail(30).mean()
+                ma_short = features["ma_10"]
+                ma_long = features["ma_30"]
                 if current_price > ma_short > ma_long:
                     analysis["trend_score"] = 0.8
                 elif current_price < ma_short < ma_long:
@@ -630,12 +904,8 @@ class DCAPlus:
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """RSI 계산"""
         try:
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return rsi.fillna(50)
+            values = prices.to_numpy(dtype=np.float64, copy=False)
+            return pd.Series(_rsi_kernel(values, period), index=prices.index)
         except:
             return pd.Series([50] * len(prices), index=prices.index)
     
@@ -4,7 +4,8 @@ Custom Exception Classes for KAIROS-1 System
 체계적인 에러 처리를 위한 커스텀 예외 클래스들
 """
 
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
 
@@ -36,6 +37,54 @@ class KairosException(Exception):
         }
 
 
+class LazyKairosException(KairosException):
+    """
+    메시지/상세 정보를 조회 시점에 생성하는 예외
+    
+    대량 검증처럼 예외가 많이 발생하지만 대부분 메시지가 쓰이지 않는 경로용.
+    포맷 문자열과 인자만 보관하고, details는 detail_keys와 인자를 순서대로 묶어 만든다.
+    """
+    
+    __slots__ = ('_fmt', '_fmt_args', '_detail_keys', '_created_at', '_message', '_details')
+    
+    def __init__(
+        self,
+        fmt: str,
+        *args: Any,
+        error_code: Optional[str] = None,
+        detail_keys: Tuple[str, ...] = (),
+        recoverable: bool = True
+    ):
+        Exception.__init__(self, fmt, *args)
+        self._fmt = fmt
+        self._fmt_args = args
+        self._detail_keys = detail_keys
+        self._created_at = time.time()
+        self._message: Optional[str] = None
+        self._details: Optional[Dict[str, Any]] = None
+        self.error_code = error_code or self.__class__.__name__
+        self.recoverable = recoverable
+    
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = self._fmt.format(*self._fmt_args)
+        return self._message
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        if self._details is None:
+            self._details = dict(zip(self._detail_keys, self._fmt_args))
+        return self._details
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self._created_at)
+    
+    def __str__(self) -> str:
+        return self.message
+
+
 # Trading Exceptions
 class TradingException(KairosException):
     """거래 관련 기본 예외"""
@@ -201,6 +250,21 @@ class APIServerException(APIException):
         )
 
 
+class APIInvalidResponseException(APIException):
+    """API 응답 본문 파싱 실패 예외 (점검/프록시 HTML 페이지 등)"""
+    
+    def __init__(self, service: str, response: Optional[str] = None):
+        super().__init__(
+            f"API 응답 파싱 실패: {service}",
+            error_code="API_INVALID_RESPONSE",
+            details={
+                'service': service,
+                'response': response
+            },
+            recoverable=True  # 일시적인 점검 페이지일 수 있으므로 재시도 가능
+        )
+
+
 # Risk Management Exceptions
 class RiskException(KairosException):
     """리스크 관리 관련 기본 예외"""
@@ -397,6 +461,18 @@ class FileSystemException(SystemException):
         )
 
 
+class CircuitOpenException(SystemException):
+    """서킷 브레이커 차단 상태 예외"""
+    
+    def __init__(self, breaker_name: str):
+        super().__init__(
+            f"서킷 브레이커 [{breaker_name}]: 차단 상태",
+            error_code="CIRCUIT_OPEN",
+            details={'breaker': breaker_name},
+            recoverable=True
+        )
+
+
 class NetworkException(SystemException):
     """네트워크 오류 예외"""
     
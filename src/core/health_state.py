@@ -0,0 +1,193 @@
+"""
+Shared Health State for KAIROS-1 System
+
+멀티 워커(프로세스) 환경에서 서비스 헬스체크 결과를 메모리 매핑 파일로 공유
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, Any, Optional, Tuple
+from loguru import logger
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows
+    FCNTL_AVAILABLE = False
+
+
+# 슬롯 헤더: 레코드 길이(uint32)
+_HEADER = struct.Struct("<I")
+
+
+class SharedHealthState:
+    """
+    공유 헬스 상태 파일
+    
+    고정 크기 슬롯 배열을 mmap으로 매핑하고, (pid, 서비스 이름)마다 하나의 슬롯에
+    마지막 상태를 JSON 레코드로 기록한다. 어느 워커에서든 전체 슬롯을 읽어
+    서비스별 최신 레코드를 얻을 수 있으므로 워커마다 헬스체크를 다시 수행할 필요가 없다.
+    쓰기는 fcntl.flock 배타 잠금, 읽기는 공유 잠금으로 보호한다 (fcntl 미지원 시 잠금 생략).
+    같은 프로세스 안의 스레드 간에는 별도의 스레드 잠금으로 직렬화한다.
+    
+    pid는 기록/조회 시점에 확인하므로 생성 후 fork된 프로세스에서도 자신의 레코드를 구분하며,
+    fork 후 처음 사용할 때 파일을 다시 열어 부모 프로세스와 잠금을 공유하지 않는다.
+    """
+    
+    def __init__(self, path: str, slot_count: int = 256, slot_size: int = 2048):
+        self.path = path
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self._open()
+    
+    def _open(self):
+        """파일을 열고 매핑 (현재 프로세스 소유)"""
+        size = self.slot_count * self.slot_size
+        self._owner_pid = os.getpid()
+        self._thread_lock = threading.Lock()
+        self._slots: Dict[str, int] = {}  # 서비스 이름 -> 이 프로세스가 사용하는 슬롯
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._mmap = mmap.mmap(self._fd, size)
+    
+    def _current_pid(self) -> int:
+        """현재 프로세스 pid (fork된 경우 파일을 다시 열어 슬롯/잠금을 분리)"""
+        pid = os.getpid()
+        if pid != self._owner_pid and not self._mmap.closed:
+            # 부모에게서 물려받은 매핑/fd는 부모가 정리하므로 닫지 않고 새로 연다
+            self._open()
+        return pid
+    
+    def write(self, name: str, status: Dict[str, Any], updated_at: Optional[float] = None):
+        """서비스 상태 기록 (updated_at: 벽시계 epoch 초)"""
+        pid = self._current_pid()
+        record = {
+            'pid': pid,
+            'name': name,
+            'updated_at': updated_at if updated_at is not None else time.time(),
+            'status': status,
+        }
+        payload = json.dumps(record, default=str).encode()
+        if len(payload) > self.slot_size - _HEADER.size:
+            # 슬롯보다 큰 경우 메트릭을 제외하고 기록
+            record['status'] = {k: v for k, v in status.items() if k != 'metrics'}
+            payload = json.dumps(record, default=str).encode()
+            if len(payload) > self.slot_size - _HEADER.size:
+                logger.debug(f"헬스 상태 레코드가 슬롯 크기를 초과하여 생략: {name}")
+                return
+        
+        with self._locked(exclusive=True):
+            slot = self._slots.get(name)
+            if slot is None:
+                slot = self._find_slot(pid, name)
+                if slot is None:
+                    logger.warning(f"공유 헬스 상태 슬롯 부족: {name}")
+                    return
+                self._slots[name] = slot
+            
+            offset = slot * self.slot_size
+            self._mmap[offset:offset + _HEADER.size + len(payload)] = _HEADER.pack(len(payload)) + payload
+    
+    def read_all(self, exclude_own: bool = False) -> Dict[str, Tuple[float, Dict[str, Any]]]:
+        """
+        서비스 이름 -> (updated_at, 상태) - 살아 있는 워커의 레코드 중 최신 것
+        
+        종료된 프로세스가 남긴 레코드는 슬롯이 재사용되기 전까지 파일에 남아 있으므로 제외한다.
+        
+        Args:
+            exclude_own: True면 현재 프로세스가 기록한 레코드 제외
+        """
+        pid = self._current_pid()
+        merged: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        alive: Dict[int, bool] = {pid: True}
+        with self._locked(exclusive=False):
+            for slot in range(self.slot_count):
+                record = self._read_slot(slot)
+                if record is None or (exclude_own and record['pid'] == pid):
+                    continue
+                record_pid = record['pid']
+                if record_pid not in alive:
+                    alive[record_pid] = self._pid_alive(record_pid)
+                if not alive[record_pid]:
+                    continue
+                current = merged.get(record['name'])
+                if current is None or record['updated_at'] > current[0]:
+                    merged[record['name']] = (record['updated_at'], record['status'])
+        return merged
+    
+    def close(self):
+        """매핑 해제 (다른 스레드의 기록이 끝난 뒤 닫음)"""
+        with self._thread_lock:
+            if not self._mmap.closed:
+                self._mmap.close()
+                os.close(self._fd)
+    
+    def _find_slot(self, pid: int, name: str) -> Optional[int]:
+        """(pid, 이름) 해시 위치부터 선형 탐사로 빈 슬롯 또는 종료된 프로세스의 슬롯 탐색"""
+        start = zlib.crc32(f"{pid}:{name}".encode()) % self.slot_count
+        for i in range(self.slot_count):
+            slot = (start + i) % self.slot_count
+            record = self._read_slot(slot)
+            if record is None or (record['pid'] == pid and record['name'] == name):
+                return slot
+            if not self._pid_alive(record['pid']):
+                return slot
+        return None
+    
+    def _read_slot(self, slot: int) -> Optional[Dict[str, Any]]:
+        offset = slot * self.slot_size
+        (length,) = _HEADER.unpack_from(self._mmap, offset)
+        if length == 0 or length > self.slot_size - _HEADER.size:
+            return None
+        start = offset + _HEADER.size
+        try:
+            return json.loads(self._mmap[start:start + length])
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _pid_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+    
+    def _locked(self, exclusive: bool):
+        return _FileLock(self._fd, exclusive, self._thread_lock)
+
+
+class _FileLock:
+    """스레드 잠금 + flock 컨텍스트 매니저 (fcntl 미지원 플랫폼에서는 스레드 잠금만 사용)"""
+    
+    __slots__ = ('_fd', '_exclusive', '_thread_lock')
+    
+    def __init__(self, fd: int, exclusive: bool, thread_lock: threading.Lock):
+        self._fd = fd
+        self._exclusive = exclusive
+        self._thread_lock = thread_lock
+    
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if FCNTL_AVAILABLE:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX if self._exclusive else fcntl.LOCK_SH)
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            self._thread_lock.release()
@@ -6,6 +6,7 @@ Resilience Patterns for KAIROS-1 System
 
 import time
 import random
+import asyncio
 import functools
 from typing import Callable, Optional, Type, Tuple, Any, Dict, List
 from datetime import datetime, timedelta
@@ -14,7 +15,7 @@ from dataclasses import dataclass, field
 from loguru import logger
 from threading import Lock
 
-from .exceptions import KairosException, APIException, APIRateLimitException
+from .exceptions import KairosException, APIException, APIRateLimitException, CircuitOpenException
 
 
 class CircuitState(Enum):
@@ -47,17 +48,18 @@ class CircuitBreaker:
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time: Optional[datetime] = None
+        self._last_open_at: Optional[float] = None  # OPEN 전환 시각 (monotonic)
         self.lock = Lock()
         
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """서킷 브레이커를 통한 함수 호출"""
         with self.lock:
             if self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
+                if self.should_attempt_reset():
                     self.state = CircuitState.HALF_OPEN
                     logger.info(f"서킷 브레이커 [{self.name}]: HALF_OPEN 상태로 전환")
                 else:
-                    raise Exception(f"서킷 브레이커 [{self.name}]: 차단 상태")
+                    raise CircuitOpenException(self.name)
         
         try:
             result = func(*args, **kwargs)
@@ -67,13 +69,34 @@ class CircuitBreaker:
             self._on_failure(e)
             raise
     
-    def _should_attempt_reset(self) -> bool:
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """서킷 브레이커를 통한 코루틴 함수 호출 (이벤트 루프에서 직접 await)"""
+        with self.lock:
+            if self.state == CircuitState.OPEN:
+                if self.should_attempt_reset():
+                    self.state = CircuitState.HALF_OPEN
+                    logger.info(f"서킷 브레이커 [{self.name}]: HALF_OPEN 상태로 전환")
+                else:
+                    raise CircuitOpenException(self.name)
+        
+        try:
+            result = await func(*args, **kwargs)
+            self._on_success()
+            return result
+        except Exception as e:
+            self._on_failure(e)
+            raise
+    
+    def should_attempt_reset(self) -> bool:
         """OPEN 상태에서 재시도 가능 여부 확인"""
-        if self.last_failure_time is None:
+        if self._last_open_at is None:
             return True
         
-        time_since_failure = (datetime.now() - self.last_failure_time).total_seconds()
-        return time_since_failure >= self.config.timeout
+        return time.monotonic() - self._last_open_at >= self.config.timeout
+    
+    def is_open(self) -> bool:
+        """호출이 즉시 차단되는 상태인지 확인 (재시도 루프의 fail-fast 용)"""
+        return self.state == CircuitState.OPEN and not self.should_attempt_reset()
     
     def _on_success(self):
         """성공 시 처리"""
@@ -100,9 +123,11 @@ class CircuitBreaker:
             
             if self.state == CircuitState.HALF_OPEN:
                 self.state = CircuitState.OPEN
+                self._last_open_at = time.monotonic()
                 logger.warning(f"서킷 브레이커 [{self.name}]: OPEN 상태로 전환 (HALF_OPEN 실패)")
             elif self.failure_count >= self.config.failure_threshold:
                 self.state = CircuitState.OPEN
+                self._last_open_at = time.monotonic()
                 logger.warning(f"서킷 브레이커 [{self.name}]: OPEN 상태로 전환 (임계값 초과)")
     
     def reset(self):
@@ -112,6 +137,7 @@ class CircuitBreaker:
             self.failure_count = 0
             self.success_count = 0
             self.last_failure_time = None
+            self._last_open_at = None
             logger.info(f"서킷 브레이커 [{self.name}]: 수동 리셋")
     
     def get_state(self) -> Dict[str, Any]:
@@ -160,47 +186,96 @@ class RetryManager:
     
     def retry(self, func: Callable, *args, **kwargs) -> Any:
         """재시도 로직을 적용한 함수 실행"""
+        return self._retry(None, func, args, kwargs)
+    
+    def retry_with_breaker(self, circuit_breaker: CircuitBreaker, func: Callable, *args, **kwargs) -> Any:
+        """서킷 브레이커를 매 시도마다 거치는 재시도 (차단 시 대기 없이 즉시 중단)"""
+        return self._retry(circuit_breaker, func, args, kwargs)
+    
+    async def retry_async(self, func: Callable, *args, **kwargs) -> Any:
+        """재시도 로직을 적용한 코루틴 함수 실행 (백오프는 asyncio.sleep)"""
+        return await self._retry_async(None, func, args, kwargs)
+    
+    async def retry_with_breaker_async(self, circuit_breaker: CircuitBreaker, func: Callable, *args, **kwargs) -> Any:
+        """retry_with_breaker의 코루틴 버전"""
+        return await self._retry_async(circuit_breaker, func, args, kwargs)
+    
+    def _retry(self, circuit_breaker: Optional[CircuitBreaker], func: Callable, args: tuple, kwargs: dict) -> Any:
         last_exception = None
         
         for attempt in range(1, self.config.max_attempts + 1):
             try:
-                logger.debug(f"시도 {attempt}/{self.config.max_attempts}: {func.__name__}")
+                logger.debug(f"시도 {attempt}/{self.config.max_attempts}: {getattr(func, '__name__', func)}")
+                if circuit_breaker is not None:
+                    return circuit_breaker.call(func, *args, **kwargs)
                 return func(*args, **kwargs)
                 
             except Exception as e:
                 last_exception = e
-                
-                # 재시도 불가능한 예외 확인
-                if isinstance(e, self.config.non_retryable_exceptions):
-                    logger.error(f"재시도 불가능한 예외 발생: {e}")
-                    raise
-                
-                # 재시도 가능한 예외 확인
-                if not isinstance(e, self.config.retryable_exceptions):
-                    logger.error(f"예상치 못한 예외 발생: {e}")
-                    raise
-                
-                # 마지막 시도인 경우
-                if attempt == self.config.max_attempts:
-                    logger.error(f"최대 재시도 횟수 초과: {e}")
-                    raise
-                
-                # 백오프 지연 계산
-                delay = self._calculate_delay(attempt)
-                
-                # Rate limit 예외 처리
-                if isinstance(e, APIRateLimitException):
-                    if e.details.get('retry_after'):
-                        delay = max(delay, e.details['retry_after'])
-                
-                logger.warning(f"재시도 예정 (시도 {attempt}/{self.config.max_attempts}): "
-                             f"{delay:.2f}초 후 - 이유: {e}")
-                
+                delay = self._delay_after_failure(e, attempt, circuit_breaker)
                 time.sleep(delay)
         
         if last_exception:
             raise last_exception
     
+    async def _retry_async(self, circuit_breaker: Optional[CircuitBreaker], func: Callable, args: tuple, kwargs: dict) -> Any:
+        last_exception = None
+        
+        for attempt in range(1, self.config.max_attempts + 1):
+            try:
+                logger.debug(f"시도 {attempt}/{self.config.max_attempts}: {getattr(func, '__name__', func)}")
+                if circuit_breaker is not None:
+                    return await circuit_breaker.call_async(func, *args, **kwargs)
+                return await func(*args, **kwargs)
+                
+            except Exception as e:
+                last_exception = e
+                delay = self._delay_after_failure(e, attempt, circuit_breaker)
+                await asyncio.sleep(delay)
+        
+        if last_exception:
+            raise last_exception
+    
+    def _delay_after_failure(
+        self, e: Exception, attempt: int, circuit_breaker: Optional[CircuitBreaker] = None
+    ) -> float:
+        """실패한 시도에 대한 재시도 지연 계산 (재시도 불가 시 현재 예외 재발생)"""
+        # 서킷 차단은 재시도 대상이 아님
+        if isinstance(e, CircuitOpenException):
+            raise e
+        
+        # 재시도 불가능한 예외 확인
+        if isinstance(e, self.config.non_retryable_exceptions):
+            logger.error(f"재시도 불가능한 예외 발생: {e}")
+            raise e
+        
+        # 재시도 가능한 예외 확인
+        if not isinstance(e, self.config.retryable_exceptions):
+            logger.error(f"예상치 못한 예외 발생: {e}")
+            raise e
+        
+        # 마지막 시도인 경우
+        if attempt == self.config.max_attempts:
+            logger.error(f"최대 재시도 횟수 초과: {e}")
+            raise e
+        
+        # 백오프 지연 계산
+        delay = self._calculate_delay(attempt)
+        
+        # Rate limit 예외 처리
+        if isinstance(e, APIRateLimitException):
+            if e.details.get('retry_after'):
+                delay = max(delay, e.details['retry_after'])
+        
+        # 이번 실패로 서킷이 열렸다면 백오프 대기 없이 즉시 중단
+        if circuit_breaker is not None and circuit_breaker.is_open():
+            logger.warning(f"서킷 브레이커 [{circuit_breaker.name}] 차단 - 재시도 중단: {e}")
+            raise CircuitOpenException(circuit_breaker.name) from e
+        
+        logger.warning(f"재시도 예정 (시도 {attempt}/{self.config.max_attempts}): "
+                     f"{delay:.2f}초 후 - 이유: {e}")
+        return delay
+    
     def _calculate_delay(self, attempt: int) -> float:
         """백오프 지연 시간 계산"""
         if self.config.backoff_strategy == BackoffStrategy.FIXED:
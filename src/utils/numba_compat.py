@@ -0,0 +1,21 @@
+"""
+Numba compatibility helper
+
+numba는 선택 의존성이다. 설치되어 있으면 njit로 컴파일하고,
+없으면 같은 데코레이터 형태로 원본 파이썬 함수를 그대로 사용한다.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """numba 미설치 시 원본 파이썬 함수를 그대로 사용"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
@@ -158,13 +158,13 @@ async def test_async_http_client_structure():
             {"currency": "BTC"},
             {"Authorization": "Bearer test_token"}
         )
-        assert isinstance(cache_key, str) and len(cache_key) == 32, "캐시 키 생성 실패"
+        assert isinstance(cache_key, tuple) and isinstance(hash(cache_key), int), "캐시 키 생성 실패"
         print("✅ 캐시 키 생성 테스트 성공")
         
         # Rate limit 설정 확인
         assert client.rate_limit_calls == 10, "Rate limit 호출 수 설정 오류"
         assert client.rate_limit_window == 60, "Rate limit 윈도우 설정 오류"
-        assert client.rate_limit_requests == [], "Rate limit 요청 리스트 초기화 오류"
+        assert client.rate_limit == 10, "Rate limit 호환 속성 설정 오류"
         print("✅ Rate limit 설정 확인 성공")
         
         # 통계 확인
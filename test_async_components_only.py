@@ -103,8 +103,8 @@ async def test_request_batcher_only():
         # 구성 요소 확인
         assert batcher.batch_size == 2, "배치 크기 설정 오류"
         assert batcher.batch_timeout == 0.5, "배치 타임아웃 설정 오류"
-        assert batcher.pending_requests == [], "펜딩 요청 리스트 초기화 오류"
-        assert batcher._batch_task is None, "배치 태스크 초기화 오류"
+        assert batcher.pending_count == 0, "펜딩 요청 초기화 오류"
+        assert batcher._consumer_task is None, "소비자 태스크 초기화 오류"
         print("✅ RequestBatcher 구성 요소 확인 성공")
         
         print("🎉 RequestBatcher 단독 테스트 통과!")
@@ -160,7 +160,7 @@ async def test_http_client_init_only():
             {"currency": "BTC"},
             {"Authorization": "Bearer test_token"}
         )
-        assert isinstance(cache_key, str) and len(cache_key) == 32, "캐시 키 생성 실패"
+        assert isinstance(cache_key, tuple) and isinstance(hash(cache_key), int), "캐시 키 생성 실패"
         print("✅ 캐시 키 생성 테스트 성공")
         
         # 통계 확인
@@ -183,35 +183,6 @@ async def test_http_client_init_only():
         traceback.print_exc()
         return False
 
-async def test_cache_entry():
-    """CacheEntry 테스트"""
-    print("\n📝 CacheEntry 테스트 시작...")
-    
-    try:
-        from src.core.async_client import CacheEntry
-        from datetime import datetime
-        
-        # CacheEntry 생성
-        entry = CacheEntry(
-            data="test_data",
-            timestamp=datetime.now(),
-            ttl=60
-        )
-        print("✅ CacheEntry 생성 성공")
-        
-        # 만료 여부 확인 (생성한지 얼마 안되므로 만료되지 않음)
-        assert not entry.is_expired(), "새로 생성된 엔트리가 만료됨"
-        print("✅ CacheEntry 만료 확인 성공")
-        
-        print("🎉 CacheEntry 테스트 통과!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ CacheEntry 테스트 실패: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
 async def main():
     """메인 테스트 함수"""
     print("=" * 60)
@@ -221,7 +192,6 @@ async def main():
     results = []
     
     # 각 테스트 실행 (aiohttp 세션 생성 제외)
-    results.append(await test_cache_entry())
     results.append(await test_async_cache_only())
     results.append(await test_connection_pool_init_only())
     results.append(await test_request_batcher_only())
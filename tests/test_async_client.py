@@ -12,7 +12,7 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
 import json
 
-from src.core.async_client import AsyncHTTPClient, AsyncCache
+from src.core.async_client import AsyncHTTPClient, AsyncCache, ConnectionPool, RequestBatcher, HTTPX_AVAILABLE
 from src.core.exceptions import *
 
 
@@ -109,8 +109,7 @@ class TestAsyncHTTPClient:
             # Mock response 객체 - context manager로 사용
             mock_response = MagicMock()
             mock_response.status = 200
-            mock_response.json = AsyncMock(return_value={'success': True})
-            mock_response.text = AsyncMock(return_value='{"success": true}')
+            mock_response.read = AsyncMock(return_value=b'{"success": true}')
             
             # async context manager 구현
             async def async_enter(self):
@@ -151,6 +150,62 @@ class TestAsyncHTTPClient:
         # 속도 제한으로 인해 최소 0.5초는 걸려야 함 (3개 요청, 초당 2개 허용)
         assert duration >= 0.5
     
+    @pytest.mark.asyncio
+    async def test_get_fast_shares_cache_with_get(self, client):
+        """빠른 경로 GET 테스트 (일반 GET과 캐시 공유)"""
+        with patch.object(client, '_make_request', new_callable=AsyncMock,
+                          return_value={'price': 50000}) as mock_request:
+            response1 = await client.get_fast('/ticker', params={'symbol': 'BTC'})
+            response2 = await client.get('/ticker', params={'symbol': 'BTC'})
+            
+            assert response1 == response2 == {'price': 50000}
+            mock_request.assert_called_once()  # 빠른 경로도 _make_request 오버라이드를 거침
+            assert mock_request.call_args[0][0] == 'GET'
+            assert client.cache_hits == 1
+    
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx[http2] 미설치")
+    async def test_http2_transport(self):
+        """HTTP/2 전송 옵션 테스트"""
+        import httpx
+        
+        def handler(request):
+            if request.url.path == '/missing':
+                return httpx.Response(404, text='Not Found')
+            if request.url.path == '/maintenance':
+                return httpx.Response(200, text='<html>Under maintenance</html>')
+            return httpx.Response(200, json={'path': request.url.path})
+        
+        client = AsyncHTTPClient(base_url="https://api.test.com", http_version="2")
+        client.connection_pool.http2_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        
+        try:
+            response = await client.get('/ticker')
+            assert response == {'path': '/ticker'}
+            
+            with pytest.raises(APIClientException):
+                await client.get('/missing')
+            
+            with pytest.raises(APIInvalidResponseException):
+                await client.get('/maintenance')
+        finally:
+            await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiting_queues_concurrent_waiters(self, client):
+        """토큰 부족 시 동시 대기자들이 순서대로 분산되는지 테스트"""
+        client.rate_limit = 1
+        client.rate_window = 0.1
+        
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        await asyncio.gather(*[client._check_rate_limit() for _ in range(4)])
+        
+        # 첫 요청은 즉시, 나머지 3개는 0.1초 간격
+        assert loop.time() - start_time >= 0.3
+    
     @pytest.mark.asyncio
     async def test_session_management(self):
         """세션 관리 테스트"""
@@ -170,7 +225,7 @@ class TestAsyncHTTPClient:
         with patch.object(client.session, 'request') as mock_request:
             mock_response = AsyncMock()
             mock_response.status = 400
-            mock_response.text = AsyncMock(return_value='Bad Request')
+            mock_response.read = AsyncMock(return_value=b'Bad Request')
             mock_response.__aenter__ = AsyncMock(return_value=mock_response)
             mock_response.__aexit__ = AsyncMock(return_value=None)
             mock_request.return_value = mock_response
@@ -182,13 +237,33 @@ class TestAsyncHTTPClient:
         with patch.object(client.session, 'request') as mock_request:
             mock_response = AsyncMock()
             mock_response.status = 500
-            mock_response.text = AsyncMock(return_value='Internal Server Error')
+            mock_response.read = AsyncMock(return_value=b'Internal Server Error')
             mock_response.__aenter__ = AsyncMock(return_value=mock_response)
             mock_response.__aexit__ = AsyncMock(return_value=None)
             mock_request.return_value = mock_response
             
             with pytest.raises(APIServerException):
                 await client.get('/server-error')
+    
+    @pytest.mark.asyncio
+    async def test_html_body_raises_api_exception(self, client):
+        """JSON이 아닌 200 응답(점검 HTML 페이지)은 재시도 후 APIException 계열로 변환"""
+        html = b'<html><body>Under maintenance</body></html>'
+        
+        with patch.object(client.session, 'request') as mock_request:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.read = AsyncMock(return_value=html)
+            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_response.__aexit__ = AsyncMock(return_value=None)
+            mock_request.return_value = mock_response
+            
+            with pytest.raises(APIException) as exc_info:
+                await client.get('/maintenance')
+        
+        assert isinstance(exc_info.value, APIInvalidResponseException)
+        assert exc_info.value.details['response'] == html.decode()
+        assert mock_request.call_count == 3  # 네트워크 오류와 같이 재시도
 
 
 @pytest.mark.async_test
@@ -233,6 +308,20 @@ class TestAsyncCache:
         expired_value = await cache.get('expire_key')
         assert expired_value is None
     
+    @pytest.mark.asyncio
+    async def test_clear_expired(self, cache):
+        """만료 항목 일괄 정리 테스트 (갱신된 키는 유지)"""
+        await cache.set('short', 'value', ttl=0)
+        await cache.set('refreshed', 'old', ttl=0)
+        await cache.set('refreshed', 'new', ttl=60)
+        await cache.set('long', 'value', ttl=60)
+        
+        await cache.clear_expired()
+        
+        assert cache.get_stats()['size'] == 2
+        assert await cache.get('refreshed') == 'new'
+        assert await cache.get('long') == 'value'
+    
     @pytest.mark.asyncio
     async def test_cache_hit_miss_stats(self, cache):
         """캐시 히트/미스 통계 테스트"""
@@ -270,6 +359,48 @@ class TestAsyncCache:
         
         small_cache.clear_cache()
     
+    @pytest.mark.asyncio
+    async def test_cache_eviction_keeps_read_keys(self):
+        """삭제 순서 테스트 (조회된 키는 유지)"""
+        small_cache = AsyncCache(max_memory_items=2)
+        
+        await small_cache.set('key_a', 'value_a')
+        await small_cache.set('key_b', 'value_b')
+        
+        # key_a 조회로 최근 사용 처리 -> key_b가 삭제 대상
+        assert await small_cache.get('key_a') == 'value_a'
+        await small_cache.set('key_c', 'value_c')
+        
+        assert await small_cache.get('key_b') is None
+        assert await small_cache.get('key_a') == 'value_a'
+        assert await small_cache.get('key_c') == 'value_c'
+    
+    @pytest.mark.asyncio
+    async def test_cache_scan_resistance(self):
+        """스캔 내성 테스트 (일회성 키가 자주 쓰는 키를 밀어내지 않음)"""
+        small_cache = AsyncCache(max_memory_items=6)
+        
+        await small_cache.set('frequent', 'value')
+        assert await small_cache.get('frequent') == 'value'
+        
+        for i in range(50):
+            await small_cache.set(f'scan_{i}', i)
+        
+        assert await small_cache.get('frequent') == 'value'
+        assert small_cache.get_stats()['size'] <= 6
+    
+    @pytest.mark.asyncio
+    async def test_cache_overwrite_does_not_grow_segments(self):
+        """동일 키 반복 갱신 시 세그먼트 큐가 무한히 커지지 않음"""
+        small_cache = AsyncCache(max_memory_items=10)
+        
+        for i in range(1000):
+            await small_cache.set('ticker', i)
+        
+        assert await small_cache.get('ticker') == 999
+        assert small_cache.get_stats()['size'] == 1
+        assert sum(len(queue) for queue in small_cache._segments) <= 20
+    
     @pytest.mark.asyncio
     async def test_cache_delete(self, cache):
         """캐시 삭제 테스트"""
@@ -326,6 +457,70 @@ class TestAsyncCache:
         assert stats['hits'] >= 50   # 모든 조회가 성공했어야 함
 
 
+@pytest.mark.async_test
+class TestConnectionPool:
+    """ConnectionPool 기능 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_connector_recycled_after_age_limit(self):
+        """커넥터 최대 사용 시간 초과 시 교체 테스트"""
+        pool = ConnectionPool(connector_age_limit=0)
+        
+        try:
+            first_session = await pool.get_session()
+            first_connector = pool.connector
+            await asyncio.sleep(0.01)
+            
+            second_session = await pool.get_session()
+            
+            assert second_session is not first_session
+            assert pool.connector is not first_connector
+            assert first_session in pool._retired_sessions
+        finally:
+            await pool.close()
+        
+        assert first_session.closed
+        assert second_session.closed
+
+
+@pytest.mark.async_test
+class TestRequestBatcher:
+    """RequestBatcher 기능 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_pipelined_batches(self):
+        """동시 요청이 배치 단위로 처리되고 결과가 각 호출자에게 전달됨"""
+        batcher = RequestBatcher(batch_size=2)
+        in_flight = 0
+        max_in_flight = 0
+        
+        def make_request(value):
+            async def request():
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                if value == 3:
+                    raise ValueError("failed request")
+                return value
+            return request
+        
+        try:
+            results = await asyncio.gather(
+                *[batcher.add_request(make_request(i)) for i in range(5)],
+                return_exceptions=True
+            )
+        finally:
+            await batcher.close()
+        
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], ValueError)
+        assert results[4] == 4
+        assert max_in_flight == 2
+        assert batcher.pending_count == 0
+
+
 @pytest.mark.async_test
 class TestAsyncClientIntegration:
     """AsyncHTTPClient와 AsyncCache 통합 테스트"""
@@ -0,0 +1,671 @@
+"""
+Base Service Tests
+
+기본 서비스 / 서비스 레지스트리 핵심 기능 테스트
+"""
+
+import pytest
+import asyncio
+import functools
+import os
+import subprocess
+import sys
+import threading
+from unittest.mock import AsyncMock
+import time
+from datetime import datetime
+
+from src.core.base_service import (
+    BaseService, HTTPService, DatabaseService, ServiceConfig, ServiceRegistry,
+    CacheableMixin, DataValidationMixin
+)
+from src.core.health_state import FCNTL_AVAILABLE, SharedHealthState
+from src.core.resilience import RetryConfig, CircuitBreakerConfig
+from src.core.exceptions import *
+
+
+class DummyService(BaseService):
+    """테스트용 서비스"""
+
+    def __init__(self, name: str = "dummy", events: list = None, **config_kwargs):
+        config_kwargs.setdefault('health_check_interval', 0)
+        config_kwargs.setdefault('retry_config', RetryConfig(max_attempts=3, initial_delay=0.01, jitter=False))
+        super().__init__(ServiceConfig(name=name, **config_kwargs))
+        self.events = events if events is not None else []
+        self.started = False
+        self.healthy = True
+
+    async def start(self):
+        self.events.append(("start", self.config.name))
+        self.started = True
+
+    async def stop(self):
+        self.events.append(("stop", self.config.name))
+        self.started = False
+
+    async def health_check(self) -> bool:
+        return self.healthy
+
+
+class TestExecuteWithResilience:
+    """execute_with_resilience 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_coroutine_runs_on_event_loop(self):
+        """코루틴 함수는 스레드 홉 없이 이벤트 루프에서 실행"""
+        service = DummyService()
+        main_thread = threading.get_ident()
+
+        async def work(value):
+            return value, threading.get_ident()
+
+        result, thread_id = await service.execute_with_resilience(work, 42)
+
+        assert result == 42
+        assert thread_id == main_thread
+
+    @pytest.mark.asyncio
+    async def test_coroutine_retried(self):
+        """코루틴 함수 실패 시 재시도"""
+        service = DummyService()
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ValueError("일시 오류")
+            return "ok"
+
+        assert await service.execute_with_resilience(flaky) == "ok"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_function_runs_in_executor(self):
+        """동기 함수는 공유 스레드 풀에서 실행"""
+        service = DummyService()
+        main_thread = threading.get_ident()
+
+        result = await service.execute_with_resilience(lambda: threading.get_ident())
+
+        assert result != main_thread
+
+    @pytest.mark.asyncio
+    async def test_async_callables_detected(self):
+        """partial/async __call__ 객체도 이벤트 루프에서 실행, 코루틴 반환 lambda도 완료"""
+        service = DummyService()
+        main_thread = threading.get_ident()
+
+        async def work(value):
+            return value, threading.get_ident()
+
+        class AsyncCallable:
+            async def __call__(self, value):
+                return value, threading.get_ident()
+
+        assert await service.execute_with_resilience(functools.partial(work, 1)) == (1, main_thread)
+        assert await service.execute_with_resilience(AsyncCallable(), 2) == (2, main_thread)
+
+        result, _ = await service.execute_with_resilience(lambda: work(3))
+        assert result == 3
+
+    @pytest.mark.asyncio
+    async def test_awaitable_from_sync_callable_retried(self):
+        """코루틴을 반환하는 동기 함수도 awaitable 실패가 재시도/서킷에 반영"""
+        service = DummyService(
+            retry_config=RetryConfig(max_attempts=3, initial_delay=0.0, jitter=False),
+            circuit_breaker_config=CircuitBreakerConfig(failure_threshold=3, timeout=60)
+        )
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ValueError("일시 오류")
+            return "ok"
+
+        assert await service.execute_with_resilience(lambda: flaky()) == "ok"
+        assert len(calls) == 3
+
+        async def always_fail():
+            raise ValueError("실패")
+
+        with pytest.raises((ValueError, CircuitOpenException)):
+            await service.execute_with_resilience(lambda: always_fail())
+        with pytest.raises(CircuitOpenException):
+            await service.execute_with_resilience(lambda: always_fail())
+
+    @pytest.mark.asyncio
+    async def test_failure_recorded(self):
+        """최종 실패 시 에러 카운트 기록"""
+        service = DummyService()
+
+        async def always_fail():
+            raise ValueError("실패")
+
+        with pytest.raises(ValueError):
+            await service.execute_with_resilience(always_fail)
+
+        assert service.status.error_count == 1
+        assert isinstance(service.status.last_error, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_retry_sleeps(self):
+        """서킷이 열리면 남은 재시도 대기 없이 즉시 중단"""
+        service = DummyService(
+            retry_config=RetryConfig(max_attempts=5, initial_delay=10.0, jitter=False),
+            circuit_breaker_config=CircuitBreakerConfig(failure_threshold=1, timeout=60)
+        )
+        calls = []
+
+        async def always_fail():
+            calls.append(1)
+            raise ValueError("실패")
+
+        with pytest.raises(CircuitOpenException):
+            await asyncio.wait_for(service.execute_with_resilience(always_fail), timeout=1.0)
+        assert len(calls) == 1
+
+        # 차단 상태에서는 함수가 호출되지 않음
+        with pytest.raises(CircuitOpenException):
+            await service.execute_with_resilience(always_fail)
+        assert len(calls) == 1
+
+
+class TestServiceStatus:
+    """서비스 상태 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_status_uses_recorded_iso_strings(self):
+        """시각 기록 시 ISO 문자열이 함께 갱신됨"""
+        service = DummyService()
+        status = service.get_status()
+        assert status['started_at'] is None
+        assert status['last_health_check'] is None
+
+        await service.initialize()
+        service.status.metrics['requests'] = 1
+        status = service.get_status()
+        assert status['started_at'] == service.status.started_at.isoformat()
+        assert status['is_healthy'] is True
+        assert status['metrics'] == {'requests': 1}
+
+        view = service.get_status(readonly_metrics=True)['metrics']
+        with pytest.raises(TypeError):
+            view['requests'] = 2
+
+
+    @pytest.mark.asyncio
+    async def test_hung_health_check_times_out(self):
+        """응답 없는 헬스체크는 주기 내 타임아웃되어 비정상으로 기록"""
+        class HangingService(DummyService):
+            async def health_check(self):
+                await asyncio.sleep(10)
+                return True
+
+        service = HangingService(health_check_interval=0.05)
+        service.status.is_healthy = True
+        now_mono = time.monotonic()
+
+        await service.run_health_check(now_mono)
+
+        assert service.status.is_healthy is False
+        assert service.status.error_count == 1
+        assert service.status._last_health_check_mono == now_mono
+
+    def test_status_objects_are_slotted(self):
+        """상태/설정 객체는 __dict__ 없이 슬롯만 사용"""
+        service = DummyService()
+        assert not hasattr(service.status, '__dict__')
+        assert not hasattr(service.config, '__dict__')
+
+    def test_health_check_time_converted_lazily(self):
+        """monotonic으로 기록한 헬스체크 시각을 조회 시 벽시계로 변환"""
+        service = DummyService()
+        service.status.mark_health_check(time.monotonic() - 5)
+
+        last_check = service.get_status()['last_health_check']
+        assert last_check is not None
+        age = (datetime.now() - datetime.fromisoformat(last_check)).total_seconds()
+        assert 4 < age < 6
+
+
+class TestHTTPService:
+    """HTTPService 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_start_warms_connection_pool(self):
+        """시작 시 백그라운드로 연결 풀 예열, 종료 시 예열 태스크 정리"""
+        service = HTTPService(ServiceConfig(name="http", health_check_interval=0), "https://api.test.com")
+        assert service.client.connection_pool.keepalive_expiry == HTTPService.KEEPALIVE_TIMEOUT
+        service.client.warm_up = AsyncMock(return_value=True)
+
+        await service.initialize()
+        await asyncio.sleep(0)
+        service.client.warm_up.assert_awaited_once()
+
+        await service.shutdown()
+        assert service._warm_pool_task is None
+
+
+    @pytest.mark.asyncio
+    async def test_make_request_dispatch(self):
+        """HTTP 메서드별 클라이언트 함수로 전달, 미지원 메서드는 오류"""
+        service = HTTPService(ServiceConfig(name="http", health_check_interval=0), "https://api.test.com")
+        service._method_dispatch['GET'] = AsyncMock(return_value={'ok': True})
+
+        assert await service.make_request('get', '/ticker', params={'a': 1}) == {'ok': True}
+        service._method_dispatch['GET'].assert_awaited_once_with('/ticker', params={'a': 1})
+
+        with pytest.raises(NotImplementedError):
+            await service.make_request('TRACE', '/ticker')
+        await service.client.close()
+
+
+class DummyDatabaseService(DatabaseService):
+    """테스트용 DB 서비스"""
+
+    def __init__(self):
+        super().__init__(ServiceConfig(name="db", health_check_interval=60), "sqlite://")
+        self.queries = []
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        pass
+
+    async def execute_query(self, query, params=None):
+        self.queries.append(query)
+        return []
+
+
+class TestDatabaseService:
+    """DatabaseService 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_health_check_skips_ping_after_recent_query(self):
+        """최근 쿼리 성공 시 SELECT 1 생략"""
+        service = DummyDatabaseService()
+
+        # 실제 쿼리가 없으면 연속된 헬스체크마다 확인 쿼리 실행
+        assert await service.health_check() is True
+        assert await service.health_check() is True
+        assert service.queries == ["SELECT 1", "SELECT 1"]
+
+        # 서브클래스가 구현한 execute_query가 성공하면 확인 쿼리 생략
+        await service.execute_query("SELECT * FROM orders")
+        assert await service.health_check() is True
+        assert service.queries == ["SELECT 1", "SELECT 1", "SELECT * FROM orders"]
+
+        service._last_success_ts -= service.config.health_check_interval
+        assert await service.health_check() is True
+        assert service.queries[-1] == "SELECT 1"
+
+    @pytest.mark.asyncio
+    async def test_failed_query_not_recorded(self):
+        """실패한 쿼리는 성공 시각을 기록하지 않음"""
+        class FailingDatabaseService(DummyDatabaseService):
+            async def execute_query(self, query, params=None):
+                await super().execute_query(query, params)
+                raise ConnectionError("down")
+
+        service = FailingDatabaseService()
+        with pytest.raises(ConnectionError):
+            await service.execute_query("SELECT * FROM orders")
+        assert service._last_success_ts is None
+        assert await service.health_check() is False
+
+
+class TestCacheableMixin:
+    """CacheableMixin 테스트"""
+
+    def test_ttl_expiry(self):
+        """TTL이 지난 항목은 조회 시 제거"""
+        cache = CacheableMixin()
+        cache.set_cache("k", 1)
+        assert cache.get_from_cache("k") == 1
+
+        stored_at, value = cache._cache["k"]
+        cache._cache["k"] = (stored_at - 10, value)
+        assert cache.get_from_cache("k", ttl=5) is None
+        assert cache.get_cache_stats()['cache_size'] == 0
+
+    def test_lru_bound(self):
+        """최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache = CacheableMixin(max_cache_size=2)
+        cache.set_cache("a", 1)
+        cache.set_cache("b", 2)
+        cache.get_from_cache("a")
+        cache.set_cache("c", 3)
+
+        assert cache.get_from_cache("b") is None
+        assert cache.get_from_cache("a") == 1
+        assert cache.get_from_cache("c") == 3
+        assert cache.get_cache_stats()['cache_size'] == 2
+
+
+class TestServiceRegistry:
+    """ServiceRegistry 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_startup_order_follows_priority(self):
+        """우선순위 오름차순, 같은 우선순위는 등록 순서로 시작"""
+        registry = ServiceRegistry()
+        events = []
+
+        for name, priority in [("c", 2), ("a", 0), ("b", 1), ("a2", 0)]:
+            registry.register(DummyService(name, events), startup_priority=priority)
+
+        await registry.start_all()
+        assert [name for _, name in events] == ["a", "a2", "b", "c"]
+
+        registry.unregister("b")
+        registry.unregister("a")
+        assert [name for _, _, name in registry._sorted] == ["a2", "c"]
+        assert set(registry._entries) == {"a2", "c"}
+
+    @pytest.mark.asyncio
+    async def test_same_priority_tier_starts_concurrently(self):
+        """같은 우선순위 서비스는 동시에 시작되고, 종료는 역순 티어로 진행"""
+        registry = ServiceRegistry()
+        events = []
+
+        class SlowService(DummyService):
+            async def start(self):
+                await asyncio.sleep(0.1)
+                await super().start()
+
+        for i in range(5):
+            registry.register(SlowService(f"slow{i}", events), startup_priority=0)
+        registry.register(DummyService("late", events), startup_priority=1)
+
+        loop = asyncio.get_running_loop()
+        begin = loop.time()
+        await registry.start_all()
+        assert loop.time() - begin < 0.4
+        assert events[-1] == ("start", "late")
+
+        events.clear()
+        await registry.stop_all()
+        assert events[0] == ("stop", "late")
+
+    @pytest.mark.asyncio
+    async def test_start_failure_does_not_block_tier(self):
+        """한 서비스 시작 실패가 같은 티어의 다른 서비스를 막지 않음"""
+        registry = ServiceRegistry()
+        events = []
+
+        class BrokenService(DummyService):
+            async def start(self):
+                raise RuntimeError("시작 실패")
+
+        registry.register(BrokenService("broken", events))
+        registry.register(DummyService("ok", events))
+
+        await registry.start_all()
+        assert events == [("start", "ok")]
+
+    @pytest.mark.asyncio
+    async def test_get_all_status_cached_within_ttl(self):
+        """TTL 내 반복 조회는 캐시된 결과 반환, 등록 변경 시 무효화"""
+        registry = ServiceRegistry()
+        registry.register(DummyService("a"))
+
+        first = registry.get_all_status()
+        assert registry.get_all_status() is first
+        assert registry.get_all_status(ttl=0) is not first
+
+        registry.register(DummyService("b"))
+        assert set(registry.get_all_status()) == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_single_health_scheduler(self):
+        """start_all로 시작한 서비스는 서비스별 태스크 없이 레지스트리 스케줄러에서 헬스체크"""
+        registry = ServiceRegistry()
+        services = [DummyService(f"svc{i}", health_check_interval=0.05) for i in range(3)]
+        for service in services:
+            registry.register(service)
+
+        await registry.start_all()
+        assert all(service._health_check_task is None for service in services)
+
+        services[1].healthy = False
+        await asyncio.sleep(0.12)
+        assert registry.get_unhealthy_services() == ["svc1"]
+        assert all(service.status.last_health_check is not None for service in services)
+
+        await registry.stop_all()
+        assert registry._health_scheduler_task is None
+
+    @pytest.mark.asyncio
+    async def test_slow_health_check_does_not_delay_others(self):
+        """응답 없는 헬스체크가 다른 서비스의 헬스체크 주기를 늦추지 않음"""
+        checks = []
+
+        class CountingService(DummyService):
+            async def health_check(self):
+                checks.append(self.config.name)
+                return True
+
+        class HangingService(DummyService):
+            async def health_check(self):
+                await asyncio.sleep(10)
+
+        registry = ServiceRegistry()
+        registry.register(HangingService("slow", health_check_interval=0.1))
+        registry.register(CountingService("fast", health_check_interval=0.02))
+        await registry.start_all()
+
+        await asyncio.sleep(0.5)
+        await registry.stop_all()
+
+        # 느린 헬스체크(최대 0.09초)를 기다렸다면 0.1초마다 한 번 정도에 그침
+        assert checks.count("fast") >= 12
+        assert registry._health_tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_service_registered_after_start_all_is_checked(self):
+        """start_all 이후 등록/시작한 서비스도 스케줄러에서 헬스체크"""
+        registry = ServiceRegistry()
+        registry.register(DummyService("early", health_check_interval=0.05))
+        await registry.start_all()
+
+        late = DummyService("late", health_check_interval=0.02)
+        registry.register(late)
+        await late.initialize()
+        assert late._health_check_task is None
+
+        late.healthy = False
+        await asyncio.sleep(0.1)
+        assert late.status.last_health_check is not None
+        assert registry.get_unhealthy_services() == ["late"]
+
+        await registry.stop_all()
+
+    @pytest.mark.asyncio
+    async def test_health_sets_follow_transitions(self):
+        """헬스 상태 전환이 레지스트리 집합에 즉시 반영"""
+        registry = ServiceRegistry()
+        service = DummyService("svc")
+        registry.register(service)
+        assert registry.get_unhealthy_services() == ["svc"]
+
+        await registry.start_all()
+        assert registry.get_healthy_services() == ["svc"]
+        assert registry.healthy_count == 1
+
+        service.status.is_healthy = False
+        assert registry.get_healthy_services() == []
+        assert registry.get_unhealthy_services() == ["svc"]
+
+        registry.unregister("svc")
+        service.status.is_healthy = True
+        assert registry.get_healthy_services() == []
+        assert registry.get_unhealthy_services() == []
+
+
+class TestDataValidationMixin:
+    """DataValidationMixin 테스트"""
+
+    def test_required_fields(self):
+        """누락 및 None 필드를 required_fields 순서대로 보고"""
+        validator = DataValidationMixin()
+        validator.validate_required_fields({'a': 1, 'b': 0}, ['a', 'b'])
+
+        with pytest.raises(KairosException) as exc_info:
+            validator.validate_required_fields({'b': None, 'c': 1}, ['c', 'b', 'a'])
+
+        assert exc_info.value.error_code == "MISSING_REQUIRED_FIELDS"
+        assert exc_info.value.details['missing_fields'] == ['b', 'a']
+
+    def test_numeric_validators(self):
+        """범위/백분율/양수 검증 실패 시 오류 코드와 상세 정보"""
+        validator = DataValidationMixin()
+        validator.validate_numeric_range(5, "qty", 0, 10)
+        validator.validate_percentage(0.5, "weight")
+        validator.validate_positive_number(1, "price")
+
+        with pytest.raises(KairosException) as exc_info:
+            validator.validate_numeric_range(-1, "qty", min_val=0)
+        assert exc_info.value.error_code == "VALUE_TOO_SMALL"
+        assert exc_info.value.details == {'field': "qty", 'value': -1, 'min': 0}
+        assert str(exc_info.value) == "qty 값이 최솟값보다 작습니다: -1 < 0"
+        assert exc_info.value.to_dict()['message'] == str(exc_info.value)
+
+        with pytest.raises(KairosException) as exc_info:
+            validator.validate_percentage(1.5, "weight")
+        assert exc_info.value.error_code == "VALUE_TOO_LARGE"
+
+        with pytest.raises(KairosException) as exc_info:
+            validator.validate_positive_number(0, "price")
+        assert exc_info.value.error_code == "INVALID_POSITIVE_NUMBER"
+
+    def test_compiled_validator(self):
+        """컴파일된 검증 함수가 validate_* 메서드와 같은 예외를 발생"""
+        validator = DataValidationMixin()
+        schema = {'price': (0, None), 'weight': (0.0, 1.0), 'symbol': None}
+        validate = validator.compile_validator(schema)
+        assert validator.compile_validator(dict(schema)) is validate
+
+        validate({'price': 100, 'weight': 0.3, 'symbol': 'BTC'})
+
+        with pytest.raises(KairosException) as exc_info:
+            validate({'price': 100, 'weight': None})
+        assert exc_info.value.details['missing_fields'] == ['weight', 'symbol']
+
+        with pytest.raises(KairosException) as exc_info:
+            validate({'price': -1, 'weight': 0.3, 'symbol': 'BTC'})
+        assert exc_info.value.error_code == "VALUE_TOO_SMALL"
+
+        with pytest.raises(KairosException) as exc_info:
+            validate({'price': 1, 'weight': 1.3, 'symbol': 'BTC'})
+        assert exc_info.value.details == {'field': 'weight', 'value': 1.3, 'max': 1.0}
+
+        with pytest.raises(TypeError):
+            validator.compile_validator({'price': ("0", None)})
+
+
+class TestSharedHealthState:
+    """SharedHealthState 테스트"""
+
+    def test_latest_record_wins(self, tmp_path):
+        """같은 서비스의 여러 레코드 중 최신 레코드 반환"""
+        path = str(tmp_path / "health.state")
+        writer = SharedHealthState(path, slot_count=8, slot_size=512)
+        other = SharedHealthState(path, slot_count=8, slot_size=512)
+        other._current_pid = os.getppid  # 살아 있는 다른 워커 흉내
+
+        writer.write("svc", {'is_healthy': True}, updated_at=100.0)
+        other.write("svc", {'is_healthy': False}, updated_at=200.0)
+        writer.write("svc", {'is_healthy': True}, updated_at=150.0)
+
+        reader = SharedHealthState(path, slot_count=8, slot_size=512)
+        assert reader.read_all() == {"svc": (200.0, {'is_healthy': False})}
+        assert writer.read_all(exclude_own=True) == {"svc": (200.0, {'is_healthy': False})}
+
+        for state in (writer, other, reader):
+            state.close()
+
+    @pytest.mark.asyncio
+    async def test_registry_merges_other_worker_status(self, tmp_path):
+        """다른 워커가 기록한 서비스 상태가 get_all_status에 반영"""
+        path = str(tmp_path / "health.state")
+        registry = ServiceRegistry(shared_state_path=path)
+        registry.register(DummyService("local"))
+        await registry.start_all()
+
+        other = SharedHealthState(path)
+        other._current_pid = os.getppid
+        other.write("remote", {'name': "remote", 'is_healthy': True})
+
+        # 조회는 파일을 직접 읽지 않고 스냅샷만 사용
+        assert set(registry.get_all_status(ttl=0)) == {"local"}
+        await registry._refresh_shared_status()
+
+        statuses = registry.get_all_status(ttl=0)
+        assert set(statuses) == {"local", "remote"}
+        assert statuses["local"]['is_healthy'] is True
+
+        shared_state = registry._shared_state
+        await registry.stop_all()
+        assert shared_state._mmap.closed
+        assert registry._shared_state is None
+        assert registry._shared_refresh_task is None
+        other.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not FCNTL_AVAILABLE, reason="fcntl 잠금 미지원 플랫폼")
+    async def test_locked_state_file_does_not_block_status(self, tmp_path):
+        """다른 워커가 파일 잠금을 잡고 있어도 상태 조회와 이벤트 루프가 멈추지 않음"""
+        import fcntl
+
+        path = str(tmp_path / "health.state")
+        registry = ServiceRegistry(shared_state_path=path)
+        registry.register(DummyService("local"))
+        await registry.start_all()
+
+        fd = os.open(path, os.O_RDWR)
+        fcntl.flock(fd, fcntl.LOCK_EX)  # 기록 중인 다른 워커 흉내
+        try:
+            assert set(registry.get_all_status(ttl=0)) == {"local"}
+            refresh = asyncio.create_task(registry._refresh_shared_status())
+            await asyncio.sleep(0.05)  # 갱신은 스레드에서 대기, 루프는 계속 진행
+            assert not refresh.done()
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+        await refresh
+        await registry.stop_all()
+
+    def test_dead_worker_records_ignored(self, tmp_path):
+        """종료된 프로세스가 남긴 레코드는 조회에서 제외"""
+        path = str(tmp_path / "health.state")
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+
+        crashed = SharedHealthState(path, slot_count=8, slot_size=512)
+        crashed._current_pid = lambda: dead.pid
+        crashed.write("svc", {'is_healthy': True}, updated_at=100.0)
+
+        reader = SharedHealthState(path, slot_count=8, slot_size=512)
+        assert reader.read_all() == {}
+
+        for state in (crashed, reader):
+            state.close()
+
+    def test_pid_read_at_write_time(self, tmp_path, monkeypatch):
+        """생성 후 fork된 프로세스는 자신의 pid로 새 슬롯에 기록"""
+        path = str(tmp_path / "health.state")
+        state = SharedHealthState(path, slot_count=8, slot_size=512)
+        state.write("svc", {'is_healthy': True}, updated_at=100.0)
+
+        parent_pid = os.getpid()
+        child_pid = os.getppid()  # 살아 있는 pid로 fork된 자식 흉내
+        monkeypatch.setattr("src.core.health_state.os.getpid", lambda: child_pid)
+        state.write("svc", {'is_healthy': False}, updated_at=200.0)
+
+        records = [state._read_slot(slot) for slot in range(state.slot_count)]
+        assert sorted(r['pid'] for r in records if r) == sorted([parent_pid, child_pid])
+        assert state.read_all(exclude_own=True) == {"svc": (100.0, {'is_healthy': True})}
+        state.close()
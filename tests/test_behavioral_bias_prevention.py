@@ -0,0 +1,493 @@
+"""
+Behavioral Bias Prevention Tests
+
+심리적 편향 감지 / 방지 조치 핵심 기능 테스트
+"""
+
+import dataclasses
+import itertools
+import pytest
+import pandas as pd
+from datetime import datetime
+
+from src.core.behavioral_bias_prevention import (
+    BIAS_HISTORY_MAX, NUMBA_AVAILABLE, BehavioralBiasPrevention, BiasDetection, BiasType, BiasLevel,
+    PreventionAction
+)
+
+
+# FOMO + 군중 심리가 함께 감지되는 급등장 매수 결정
+FOMO_DECISION = {
+    "order_side": "buy",
+    "order_amount": 1_000_000,
+    "decision_time_seconds": 60,
+    "has_independent_analysis": False,
+}
+FOMO_MARKET = {
+    "price_change_24h": 0.25,
+    "volume_surge": 4.0,
+    "social_sentiment": 0.9,
+}
+FOMO_HISTORY = {"avg_order_amount": 100_000}
+
+# 공황 매도 결정
+PANIC_DECISION = {
+    "order_side": "sell",
+    "order_amount": 500_000,
+    "decision_time_seconds": 60,
+    "unrealized_pnl_pct": -0.3,
+}
+PANIC_MARKET = {
+    "price_change_1h": -0.15,
+    "fear_greed_index": 10,
+}
+
+
+@pytest.fixture
+def prevention():
+    return BehavioralBiasPrevention()
+
+
+class TestDetectBias:
+    """편향 감지 테스트"""
+
+    def test_detects_fomo_and_herding(self, prevention):
+        biases = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)
+        by_type = {b.bias_type: b for b in biases}
+
+        assert by_type[BiasType.FOMO].level == BiasLevel.CRITICAL
+        assert by_type[BiasType.FOMO].risk_score == 100
+        assert by_type[BiasType.HERDING].level == BiasLevel.HIGH
+        assert BiasType.PANIC_SELLING not in by_type
+
+    def test_evidence_built_from_score_bits(self, prevention):
+        biases = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)
+        fomo = next(b for b in biases if b.bias_type == BiasType.FOMO)
+
+        assert fomo.evidence == [
+            "24시간 25.0% 급등",
+            "거래량 4.0배 급증",
+            "평소 10.0배 주문 크기",
+            "성급한 의사결정 (60초)",
+            "소셜 미디어 극도 긍정 분위기",
+        ]
+
+    def test_overconfidence(self, prevention):
+        decision = {"order_side": "buy", "order_amount": 300_000, "has_stop_loss": False}
+        history = {"consecutive_wins": 6, "avg_position_size": 100_000}
+        biases = prevention.detect_bias(decision, {}, history)
+        over = next(b for b in biases if b.bias_type == BiasType.OVERCONFIDENCE)
+
+        assert over.risk_score == 65
+        assert over.level == BiasLevel.HIGH
+        assert over.evidence == ["연속 6회 수익", "평소 3.0배 포지션 크기", "손절매 설정 없음"]
+
+    def test_zero_reference_amount_skips_ratio_rule(self, prevention):
+        biases = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, {"avg_order_amount": 0})
+        fomo = next(b for b in biases if b.bias_type == BiasType.FOMO)
+
+        assert fomo.risk_score == 75
+        assert not any("주문 크기" in e for e in fomo.evidence)
+
+    def test_invalid_input_returns_empty(self, prevention):
+        market = dict(FOMO_MARKET, volume_surge="not-a-number")
+        assert prevention.detect_bias(FOMO_DECISION, market, FOMO_HISTORY) == []
+
+    def test_detections_share_single_timestamp(self, prevention):
+        biases = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)
+
+        assert len(biases) >= 2
+        assert len({b.detected_at for b in biases}) == 1
+
+    def test_no_bias_for_calm_decision(self, prevention):
+        biases = prevention.detect_bias(
+            {"order_side": "buy", "order_amount": 100_000}, {}, {}
+        )
+        assert biases == []
+
+    def test_loss_aversion_position_scan(self, prevention):
+        history = {
+            "current_positions": [
+                {"asset": "BTC", "unrealized_pnl_pct": -0.35, "holding_days": 90},
+                {"asset": "ETH", "unrealized_pnl_pct": -0.25, "holding_days": 40},
+                {"asset": "XRP", "unrealized_pnl_pct": 0.1, "holding_days": 100},
+            ]
+        }
+        biases = prevention.detect_bias({"order_side": "hold"}, {}, history)
+        loss = next(b for b in biases if b.bias_type == BiasType.LOSS_AVERSION)
+
+        # BTC: 30 + 20, ETH: 30
+        assert loss.risk_score == 80
+        assert loss.level == BiasLevel.HIGH
+        assert loss.evidence == ["BTC 90일간 35.0% 손실 보유", "ETH 40일간 25.0% 손실 보유"]
+
+
+class TestPreventionMeasures:
+    """방지 조치 테스트"""
+
+    def test_critical_panic_blocks_and_cools(self, prevention):
+        biases = prevention.detect_bias(PANIC_DECISION, PANIC_MARKET, {})
+        result = prevention.apply_prevention_measures(biases, PANIC_DECISION)
+
+        assert result["modified_decision"]["blocked"] is True
+        assert result["cooling_period_applied"] is True
+        assert PANIC_DECISION.get("blocked") is None
+
+        in_cooling, cooling_end = prevention.is_in_cooling_period(BiasType.PANIC_SELLING)
+        assert in_cooling
+        assert cooling_end > datetime.now()
+
+    def test_critical_fomo_reduces_amount(self, prevention):
+        biases = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)
+        result = prevention.apply_prevention_measures(biases, FOMO_DECISION)
+
+        assert result["requires_confirmation"] is True
+        assert result["modified_decision"]["order_amount"] == pytest.approx(400_000)
+        assert result["modified_decision"]["delay_minutes"] == 60
+
+    def test_events_recorded(self, prevention):
+        biases = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)
+        prevention.apply_prevention_measures(biases, FOMO_DECISION)
+
+        stats = prevention.get_bias_statistics()
+        assert stats["total_events"] == len(biases)
+        assert stats["bias_type_distribution"]["fomo"] == 1
+
+    def test_recent_window_excludes_old_events(self, prevention):
+        from datetime import timedelta
+
+        biases = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)
+        old = [dataclasses.replace(b, detected_at=datetime.now() - timedelta(days=10)) for b in biases]
+        prevention.apply_prevention_measures(old, FOMO_DECISION)
+        prevention.apply_prevention_measures(biases, FOMO_DECISION)
+
+        stats = prevention.get_bias_statistics()
+        assert stats["total_events"] == 2 * len(biases)
+        assert stats["recent_7d_events"] == len(biases)
+
+    def test_empty_statistics(self, prevention):
+        assert prevention.get_bias_statistics() == {"total_events": 0}
+
+    def test_default_history_bound(self, prevention):
+        assert prevention.bias_history.maxlen == BIAS_HISTORY_MAX
+
+    def test_history_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(BehavioralBiasPrevention, "MAX_HISTORY", 3)
+        bounded = BehavioralBiasPrevention()
+        biases = bounded.detect_bias(PANIC_DECISION, PANIC_MARKET, {})
+
+        for _ in range(5):
+            bounded.apply_prevention_measures(biases, PANIC_DECISION)
+
+        history = bounded.to_list()
+        assert isinstance(history, list)
+        assert len(history) == 3
+
+        stats = bounded.get_bias_statistics()
+        assert stats["total_events"] == 3
+        assert stats["recent_7d_events"] == 3
+        assert sum(stats["bias_type_distribution"].values()) == 3
+        assert sum(stats["severity_distribution"].values()) == 3
+
+    def test_prevention_measures_batch_matches_single(self, prevention):
+        biases = [
+            BiasDetection(bias_type, level, 0.5, [], 50, datetime.now())
+            for bias_type in BiasType for level in BiasLevel
+        ]
+
+        assert prevention._get_prevention_measures_batch(biases) == [
+            prevention._get_prevention_measures(bias) for bias in biases
+        ]
+
+    def test_prevention_measure_table(self, prevention):
+        def measures(bias_type, level):
+            bias = BiasDetection(bias_type, level, 0.5, [], 50, datetime.now())
+            return prevention._get_prevention_measures(bias)
+
+        assert measures(BiasType.PANIC_SELLING, BiasLevel.CRITICAL) == (
+            PreventionAction.BLOCK_ORDER, PreventionAction.COOLING_PERIOD
+        )
+        assert measures(BiasType.FOMO, BiasLevel.MEDIUM) == (PreventionAction.WARN_USER,)
+        assert PreventionAction.COOLING_PERIOD in measures(BiasType.OVERCONFIDENCE, BiasLevel.LOW)
+        assert measures(BiasType.HERDING, BiasLevel.HIGH) == (
+            PreventionAction.WARN_USER, PreventionAction.REQUIRE_CONFIRMATION
+        )
+
+    def test_events_record_prevented_actions(self, prevention):
+        biases = prevention.detect_bias(PANIC_DECISION, PANIC_MARKET, {})
+        prevention.apply_prevention_measures(biases, PANIC_DECISION)
+
+        event = prevention.to_list()[-1]
+        assert event.prevented_actions == [PreventionAction.BLOCK_ORDER, PreventionAction.COOLING_PERIOD]
+        assert prevention.get_bias_statistics()["prevention_rate"] == 1.0
+
+    def test_events_share_read_only_snapshot(self, prevention):
+        decision = dict(FOMO_DECISION)
+        biases = prevention.detect_bias(decision, FOMO_MARKET, FOMO_HISTORY)
+        prevention.apply_prevention_measures(biases, decision)
+        decision["order_amount"] = 0
+
+        events = prevention.to_list()
+        assert len(events) >= 2
+        assert all(e.original_decision is events[0].original_decision for e in events)
+        assert events[0].original_decision["order_amount"] == 1_000_000
+        with pytest.raises(TypeError):
+            events[0].original_decision["order_amount"] = 1
+
+    def test_event_ids_unique(self, prevention):
+        biases = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)
+        prevention.apply_prevention_measures(biases, FOMO_DECISION)
+        prevention.apply_prevention_measures(biases, FOMO_DECISION)
+
+        event_ids = [e.event_id for e in prevention.to_list()]
+        assert len(set(event_ids)) == len(event_ids)
+        assert all(eid.startswith(e.bias_type.value + "_") for eid, e in zip(event_ids, prevention.to_list()))
+
+
+class TestDetectionThresholds:
+    """감지 임계값 배열 테스트"""
+
+    @pytest.mark.parametrize("score, level", [
+        (29.9, None), (30, BiasLevel.MEDIUM), (50, BiasLevel.HIGH),
+        (74.9, BiasLevel.HIGH), (75, BiasLevel.CRITICAL),
+    ])
+    def test_level_ladder_boundaries(self, score, level):
+        from src.core.behavioral_bias_prevention import _classify_level
+
+        assert _classify_level(BiasType.PANIC_SELLING, score) == level
+
+    def test_thresholds_read_only(self):
+        from src.core.behavioral_bias_prevention import DETECTION_THRESHOLDS
+
+        assert len(DETECTION_THRESHOLDS) == len(BiasType)
+        with pytest.raises(ValueError):
+            DETECTION_THRESHOLDS['volume_surge'][0] = 0.0
+
+    def test_instance_shares_module_thresholds(self, prevention):
+        from src.core.behavioral_bias_prevention import DETECTION_THRESHOLDS
+
+        assert prevention.detection_thresholds is DETECTION_THRESHOLDS
+
+    def test_herding_row_and_rule_weights(self):
+        from src.core.behavioral_bias_prevention import (
+            DETECTION_THRESHOLDS, RULE_WEIGHTS, _BIAS_INDEX
+        )
+
+        herding = DETECTION_THRESHOLDS[_BIAS_INDEX[BiasType.HERDING]]
+        assert (herding['sentiment'], herding['sentiment_low']) == (0.8, 0.2)
+        assert herding['news_minutes'] == 60
+        assert RULE_WEIGHTS[_BIAS_INDEX[BiasType.FOMO]].tolist() == [30, 20, 25, 15, 10]
+        with pytest.raises(ValueError):
+            RULE_WEIGHTS[0, 0] = 0.0
+
+
+class TestDetectBiasBatch:
+    """일괄 편향 감지 테스트"""
+
+    def test_batch_matches_single_detection(self, prevention):
+        calm = {"order_side": "buy", "order_amount": 100_000}
+        decisions = pd.DataFrame([FOMO_DECISION, PANIC_DECISION, calm])
+        market = pd.DataFrame([FOMO_MARKET, PANIC_MARKET, {}])
+        history = pd.DataFrame([FOMO_HISTORY, {}, {}])
+
+        result = prevention.detect_bias_batch(decisions, market, history)
+
+        for row, (decision, context, user) in enumerate(zip(
+            [FOMO_DECISION, PANIC_DECISION, calm],
+            [FOMO_MARKET, PANIC_MARKET, {}],
+            [FOMO_HISTORY, {}, {}],
+        )):
+            expected = {
+                (b.bias_type, b.level, b.risk_score)
+                for b in prevention.detect_bias(decision, context, user)
+            }
+            rows = result.loc[[row]] if row in result.index else result.iloc[0:0]
+            assert set(zip(rows.bias_type, rows.level, rows.risk_score)) == expected
+
+    def test_batch_herding_matches_single_at_thresholds(self, prevention):
+        cases = [
+            ({"order_side": "sell", "has_independent_analysis": False},
+             {"social_sentiment": 0.19, "influencer_sentiment": 0.2, "volume_surge": 3.0}),
+            ({"order_side": "sell", "time_since_news_minutes": 59, "has_independent_analysis": False},
+             {"news_impact_score": -0.71, "influencer_sentiment": 0.1}),
+            ({"order_side": "buy", "time_since_news_minutes": 60},
+             {"social_sentiment": 0.81, "news_impact_score": 0.9, "volume_surge": 3.1}),
+        ]
+        decisions = pd.DataFrame([decision for decision, _ in cases])
+        market = pd.DataFrame([context for _, context in cases])
+
+        result = prevention.detect_bias_batch(decisions, market)
+        herding = result[result.bias_type == BiasType.HERDING]
+
+        for row, (decision, context) in enumerate(cases):
+            expected = [
+                b.risk_score for b in prevention.detect_bias(decision, context, {})
+                if b.bias_type == BiasType.HERDING
+            ]
+            assert herding.risk_score[herding.index == row].tolist() == expected
+
+    def test_batch_without_detections(self, prevention):
+        decisions = pd.DataFrame([{"order_side": "buy", "order_amount": 100_000}])
+        result = prevention.detect_bias_batch(decisions, pd.DataFrame(index=decisions.index))
+
+        assert result.empty
+        assert list(result.columns) == ["bias_type", "level", "risk_score"]
+
+
+class TestDataclasses:
+    """결과 데이터 클래스 테스트"""
+
+    def test_detection_is_frozen_and_slotted(self, prevention):
+        bias = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)[0]
+        assert not hasattr(bias, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            bias.risk_score = 0
+
+    def test_evidence_head_cached(self, prevention):
+        bias = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)[0]
+
+        head = bias.evidence_head
+        assert head == " | ".join(bias.evidence[:2])
+        assert bias.evidence_head is head
+        assert prevention._generate_warning_message(bias).endswith(f"근거: {head}")
+
+    def test_repeated_warning_message_is_shared(self, prevention):
+        first = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)[0]
+        second = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)[0]
+
+        assert first is not second
+        assert prevention._generate_warning_message(first) is prevention._generate_warning_message(second)
+
+    def test_warning_message_cached_on_detection(self, prevention):
+        bias = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)[0]
+
+        message = bias.warning_message
+        assert message.endswith(f"근거: {bias.evidence_head}")
+        assert bias.warning_message is message
+        assert prevention._generate_warning_message(bias) is message
+        assert dataclasses.replace(bias) == bias
+
+    def test_event_outcome_can_be_recorded(self, prevention):
+        biases = prevention.detect_bias(PANIC_DECISION, PANIC_MARKET, {})
+        prevention.apply_prevention_measures(biases, PANIC_DECISION)
+
+        for event in prevention.to_list():
+            assert not hasattr(event, "__dict__")
+            prevention.record_user_override(event)
+            event.outcome_data = {"pnl": 0.1}
+        assert prevention.get_bias_statistics()["user_override_rate"] == 1.0
+        assert prevention.user_overrides[BiasType.PANIC_SELLING] == 1
+
+
+class TestCoolingPeriods:
+    """쿨링 기간 테스트"""
+
+    def test_cooling_uses_monotonic_enum_keys(self, prevention, monkeypatch):
+        import time as time_module
+
+        clock = [1000.0]
+        monkeypatch.setattr(time_module, "monotonic", lambda: clock[0])
+
+        biases = prevention.detect_bias(PANIC_DECISION, PANIC_MARKET, {})
+        prevention.apply_prevention_measures(biases, PANIC_DECISION)
+
+        assert prevention.cooling_periods[BiasType.PANIC_SELLING] == 1000.0 + 24 * 3600
+        assert prevention.is_cooling(BiasType.PANIC_SELLING)
+        assert not prevention.is_cooling(BiasType.FOMO)
+        assert prevention.get_bias_statistics()["active_cooling_periods"] == 1
+
+        clock[0] += 24 * 3600 + 1
+        assert not prevention.is_cooling(BiasType.PANIC_SELLING)
+        assert prevention.is_in_cooling_period(BiasType.PANIC_SELLING) == (False, None)
+        assert BiasType.PANIC_SELLING not in prevention.cooling_periods
+
+    def test_apply_uses_given_clock(self, prevention):
+        biases = prevention.detect_bias(PANIC_DECISION, PANIC_MARKET, {})
+        prevention.apply_prevention_measures(biases, PANIC_DECISION, now_mono=0.0)
+
+        assert prevention.cooling_periods[BiasType.PANIC_SELLING] == 24 * 3600
+
+    def test_detection_skipped_while_cooling(self, prevention):
+        biases = prevention.detect_bias(PANIC_DECISION, PANIC_MARKET, {})
+        assert any(b.bias_type == BiasType.PANIC_SELLING for b in biases)
+
+        prevention.apply_prevention_measures(biases, PANIC_DECISION)
+        again = prevention.detect_bias(PANIC_DECISION, PANIC_MARKET, {})
+
+        assert not any(b.bias_type == BiasType.PANIC_SELLING for b in again)
+
+
+class TestPreventionRules:
+    """방지 규칙 테스트"""
+
+    def test_rules_shared_across_instances(self):
+        first = BehavioralBiasPrevention()
+        second = BehavioralBiasPrevention()
+
+        assert first.prevention_rules is second.prevention_rules
+        assert len(first.prevention_rules) == 6
+
+    def test_rule_activation_is_per_instance(self):
+        first = BehavioralBiasPrevention()
+        second = BehavioralBiasPrevention()
+
+        first.set_rule_active("fomo_price_surge", False)
+
+        assert "fomo_price_surge" not in first.active_rule_ids
+        assert "fomo_price_surge" in second.active_rule_ids
+
+    def test_renewed_cooling_replaces_previous_expiry(self, prevention, monkeypatch):
+        import time as time_module
+
+        clock = [0.0]
+        monkeypatch.setattr(time_module, "monotonic", lambda: clock[0])
+
+        prevention._set_cooling(BiasType.FOMO, 10.0)
+        prevention._set_cooling(BiasType.FOMO, 100.0)
+        prevention._set_cooling(BiasType.HERDING, 20.0)
+
+        assert prevention._cooling_expiries == [20.0, 100.0]
+
+        clock[0] = 50.0
+        assert prevention._active_cooling_count(50.0) == 1
+        assert prevention.is_in_cooling_period(BiasType.FOMO)[0]
+        assert not prevention.is_in_cooling_period(BiasType.HERDING)[0]
+        assert prevention.cooling_periods == {BiasType.FOMO: 100.0}
+        assert prevention._cooling_expiries == [100.0]
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba 미설치")
+class TestNumbaKernels:
+    """njit으로 컴파일한 점수 커널이 파이썬 구현과 같은 결과를 내는지 테스트"""
+
+    def test_fomo_kernel_matches_python(self):
+        from src.core.behavioral_bias_prevention import _FOMO_T, _FOMO_W, _fomo_score
+
+        for args in itertools.product(
+            (0.0, 0.15, 0.3), (1.0, 2.5), (0.0, 500_000.0), (0.0, 100_000.0), (60.0, 600.0), (0.5, 0.9)
+        ):
+            assert _fomo_score(_FOMO_T, _FOMO_W, *args) == _fomo_score.py_func(_FOMO_T, _FOMO_W, *args)
+
+    def test_panic_kernel_matches_python(self):
+        from src.core.behavioral_bias_prevention import _PANIC_T, _PANIC_W, _panic_score
+
+        for args in itertools.product(
+            (-0.2, -0.1, 0.0), (10.0, 50.0), (60.0, 600.0), (-0.3, 0.0), (0.0, 1e9)
+        ):
+            assert _panic_score(_PANIC_T, _PANIC_W, *args) == _panic_score.py_func(_PANIC_T, _PANIC_W, *args)
+
+    def test_overconfidence_kernel_matches_python(self):
+        from src.core.behavioral_bias_prevention import (
+            _OVERCONFIDENCE_T, _OVERCONFIDENCE_W, _overconfidence_score
+        )
+
+        for args in itertools.product(
+            (0.0, 5.0), (0.0, 100_000.0), (300_000.0,), (2.0, 10.0), (0.0, 1.0), (0.1, 0.6), (True, False)
+        ):
+            assert _overconfidence_score(_OVERCONFIDENCE_T, _OVERCONFIDENCE_W, *args) == (
+                _overconfidence_score.py_func(_OVERCONFIDENCE_T, _OVERCONFIDENCE_W, *args)
+            )
+
+    def test_detect_bias_uses_compiled_kernels(self, prevention):
+        biases = prevention.detect_bias(FOMO_DECISION, FOMO_MARKET, FOMO_HISTORY)
+        assert {b.bias_type for b in biases} >= {BiasType.FOMO, BiasType.HERDING}
@@ -0,0 +1,302 @@
+"""
+DCA+ Strategy Tests
+
+DCA+ 시장 분석 / 매수 금액 계산 핵심 기능 테스트
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime
+
+from src.core.dca_plus_strategy import (
+    NUMBA_AVAILABLE, AccumulationSignal, DCAPlus, FearGreedLevel, _ACCUMULATION_BOUNDS, _ACCUMULATION_SIGNALS,
+    _RSI_SCORES, _VOLUME_SCORES, _annualized_volatility, _batch_asset_features, _bucket_at_least,
+    _bucket_at_most, _frame_features, _return_sum, _rsi_kernel, _volatility_multiplier
+)
+
+
+def _pandas_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
+    """rolling mean 기반 기준 RSI"""
+    delta = prices.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rs = gain / loss
+    return (100 - (100 / (1 + rs))).fillna(50)
+
+
+def _price_frame(n: int, seed: int = 0, volatility: float = 0.03) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, volatility, n)))
+    volume = rng.uniform(100, 1000, n)
+    return pd.DataFrame(
+        {"Close": close, "Volume": volume},
+        index=pd.date_range("2020-01-01", periods=n)
+    )
+
+
+@pytest.fixture
+def dca():
+    return DCAPlus()
+
+
+class TestRSI:
+    """RSI 계산"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_rolling_mean_rsi(self, dca, seed):
+        prices = _price_frame(100, seed)["Close"]
+
+        rsi = dca._calculate_rsi(prices)
+
+        assert rsi.index.equals(prices.index)
+        np.testing.assert_allclose(rsi.to_numpy(), _pandas_rsi(prices).to_numpy(), rtol=1e-9)
+
+    def test_flat_and_one_sided_windows(self, dca):
+        prices = pd.Series([100.0] * 20 + [101.0 + i for i in range(20)] + [100.0] * 20)
+
+        rsi = dca._calculate_rsi(prices)
+
+        assert (rsi.iloc[:20] == 50).all()  # 변화 없음
+        assert rsi.iloc[35] == 100  # 상승만 있는 구간
+        assert rsi.iloc[-1] == 50  # 다시 변화 없음
+        np.testing.assert_allclose(rsi.to_numpy(), _pandas_rsi(prices).to_numpy())
+
+    def test_short_series_is_neutral(self, dca):
+        prices = pd.Series([100.0, 101.0, 99.0])
+        assert dca._calculate_rsi(prices).tolist() == [50.0, 50.0, 50.0]
+
+
+class TestVolatility:
+    """연환산 변동성"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_pct_change_std(self, seed):
+        close = _price_frame(30, seed)["Close"]
+        close.iloc[[3, 4, 17]] = np.nan
+
+        expected = close.pct_change().dropna().std() * np.sqrt(365)
+
+        assert _annualized_volatility(close.to_numpy()) == pytest.approx(expected, rel=1e-9)
+
+    @pytest.mark.parametrize("gaps", [[], [2], [0, 1, 10]])
+    def test_return_sum_matches_pct_change_sum(self, gaps):
+        close = _price_frame(30, seed=3)["Close"]
+        close.iloc[gaps] = np.nan
+
+        expected = close.pct_change().sum()
+
+        assert _return_sum(close.to_numpy()) == pytest.approx(expected, rel=1e-12)
+
+    def test_needs_two_returns(self):
+        assert np.isnan(_annualized_volatility(np.array([100.0, 101.0])))
+        assert np.isnan(_annualized_volatility(np.array([], dtype=np.float64)))
+
+
+class TestFeatures:
+    """이동평균/고저점/거래량 요약"""
+
+    @pytest.mark.parametrize("with_gaps", [False, True])
+    def test_matches_pandas_tail_aggregates(self, with_gaps):
+        data = _price_frame(250, seed=7)
+        if with_gaps:
+            data.iloc[[-1, -5, -12, -60], 0] = np.nan
+
+        features = _frame_features(data)
+        close, volume = data["Close"], data["Volume"]
+
+        for n in (10, 20, 30, 50, 200):
+            assert features[f"ma_{n}"] == pytest.approx(close.tail(n).mean())
+        assert features["high_50"] == close.tail(50).max()
+        assert features["low_50"] == close.tail(50).min()
+        assert features["volume_10"] == pytest.approx(volume.tail(10).mean())
+        assert features["volume_50"] == pytest.approx(volume.tail(50).mean())
+
+    def test_batch_matches_per_asset_features(self):
+        frames = {
+            "BTC": _price_frame(300, seed=1),
+            "ETH": _price_frame(60, seed=2),
+            "SOL": _price_frame(25, seed=3),  # 50개 미만
+            "XRP": _price_frame(80, seed=4),
+        }
+        frames["XRP"].iloc[-3, 0] = np.nan  # NaN 포함
+
+        batch = _batch_asset_features({asset: data["Close"].to_numpy() for asset, data in frames.items()})
+
+        assert set(batch) == set(frames)
+        for asset, data in frames.items():
+            single = _frame_features(data)
+            for key in ("price", "ma_10", "ma_30", "high_50", "low_50"):
+                np.testing.assert_allclose(batch[asset][key], single[key], rtol=1e-12)
+
+    def test_volume_is_optional(self):
+        features = _frame_features(_price_frame(60)[["Close"]])
+        assert "volume_10" not in features
+
+
+class TestDCASignal:
+    """단일 자산 DCA 신호"""
+
+    @pytest.mark.parametrize("index_value, level, multiplier", [
+        (0, FearGreedLevel.EXTREME_FEAR, 3.0),
+        (25, FearGreedLevel.EXTREME_FEAR, 3.0),
+        (25.5, FearGreedLevel.FEAR, 2.0),
+        (40, FearGreedLevel.FEAR, 2.0),
+        (55, FearGreedLevel.NEUTRAL, 1.0),
+        (75, FearGreedLevel.GREED, 0.7),
+        (76, FearGreedLevel.EXTREME_GREED, 0.3),
+        (float("nan"), FearGreedLevel.EXTREME_GREED, 0.3),
+    ])
+    def test_fear_greed_boundaries(self, dca, index_value, level, multiplier):
+        signal = dca.calculate_dca_signal("BTC", 100_000, {"fear_greed_index": index_value})
+
+        assert signal.market_conditions["fear_greed_level"] == level.value
+        assert signal.market_conditions["fear_greed_multiplier"] == multiplier
+
+    def test_volatility_multiplier_bands(self):
+        volatility = np.array([0.0, 0.05, 0.051, 0.08, 0.081, np.nan])
+
+        np.testing.assert_array_equal(
+            _volatility_multiplier(volatility), [1.0, 1.0, 1.2, 1.2, 1.5, 1.0]
+        )
+        assert float(_volatility_multiplier(0.1)) == 1.5
+
+    @pytest.mark.parametrize("trend, multiplier", [("down", 1.3), ("up", 0.8), ("neutral", 1.0)])
+    def test_trend_multiplier(self, dca, trend, multiplier):
+        signal = dca.calculate_dca_signal("BTC", 100_000, {"trend_direction": trend})
+        assert signal.market_conditions["trend_multiplier"] == multiplier
+
+    def test_invalid_input_falls_back_to_base_amount(self, dca):
+        signal = dca.calculate_dca_signal("BTC", 100_000, {"fear_greed_index": None})
+
+        assert signal.recommended_amount == 100_000
+        assert signal.market_adjustment_factor == 1.0
+
+
+class TestMarketAnalysisCache:
+    """시장 상황 분석 캐시"""
+
+    def test_reused_for_same_frame(self, dca, monkeypatch):
+        market_data = {"BTC": _price_frame(120), "ETH": _price_frame(120, seed=1)}
+        calls = []
+        original = dca._analyze_market_conditions
+
+        def counting(data, date):
+            calls.append(date)
+            return original(data, date)
+
+        monkeypatch.setattr(dca, "_analyze_market_conditions", counting)
+
+        events = dca.generate_monthly_schedule(dca.default_schedule, datetime(2024, 3, 4), market_data)
+
+        assert len(calls) == 1
+        assert events
+        assert events[0].market_conditions is not events[-1].market_conditions
+
+    def test_recomputed_when_frame_changes(self, dca, monkeypatch):
+        btc = _price_frame(120)
+        calls = []
+        original = dca._analyze_market_conditions
+
+        def counting(data, date):
+            calls.append(date)
+            return original(data, date)
+
+        monkeypatch.setattr(dca, "_analyze_market_conditions", counting)
+
+        date = datetime(2024, 3, 4)
+        dca._get_market_analysis({"BTC": btc}, date)
+        dca._get_market_analysis({"BTC": btc.iloc[:-1]}, date)
+        btc.iloc[-1, 0] *= 2
+        dca._get_market_analysis({"BTC": btc}, date)
+
+        assert len(calls) == 3
+
+    def test_recomputed_when_volume_or_earlier_rows_change(self, dca, monkeypatch):
+        btc = _price_frame(120)
+        calls = []
+        original = dca._analyze_market_conditions
+
+        def counting(data, date):
+            calls.append(date)
+            return original(data, date)
+
+        monkeypatch.setattr(dca, "_analyze_market_conditions", counting)
+
+        date = datetime(2024, 3, 4)
+        dca._get_market_analysis({"BTC": btc}, date)
+        btc.iloc[-1, 1] *= 10  # 마지막 거래량만 수정
+        dca._get_market_analysis({"BTC": btc}, date)
+        btc.iloc[-40, 0] *= 0.5  # 앞쪽 종가 수정
+        dca._get_market_analysis({"BTC": btc}, date)
+        dca._get_market_analysis({"BTC": btc}, date)
+
+        assert len(calls) == 3
+
+
+class TestAccumulationScore:
+    """축적 구간 점수"""
+
+    def test_weekly_ma_deviation_scores_deep_drawdown(self, dca):
+        close = np.full(1400, 100.0)
+        close[-1] = 60.0  # 200주 평균 대비 -40%
+        data = pd.DataFrame({"Close": close})
+
+        with_drawdown = dca._calculate_accumulation_score(data)
+        data.iloc[-1, 0] = 100.0
+
+        assert with_drawdown > dca._calculate_accumulation_score(data)
+
+    @pytest.mark.parametrize("score, signal", [
+        (0.0, AccumulationSignal.NONE),
+        (0.19, AccumulationSignal.NONE),
+        (0.2, AccumulationSignal.WEAK),
+        (0.4, AccumulationSignal.MODERATE),
+        (0.6, AccumulationSignal.STRONG),
+        (0.8, AccumulationSignal.EXTREME),
+        (1.0, AccumulationSignal.EXTREME),
+    ])
+    def test_signal_thresholds(self, score, signal):
+        assert _ACCUMULATION_SIGNALS[_bucket_at_least(score, _ACCUMULATION_BOUNDS)] is signal
+
+    def test_ladder_buckets_handle_nan_like_if_chains(self):
+        nan = float("nan")
+        assert _bucket_at_most(35, (35, 45)) == 0
+        assert _bucket_at_most(35.1, (35, 45)) == 1
+        assert _bucket_at_most(nan, (35, 45)) == 2
+        assert _bucket_at_least(1.2, (1.2, 1.5)) == 1
+        assert _bucket_at_least(nan, (1.2, 1.5)) == 0
+
+    def test_tuned_threshold_keeps_if_chain_precedence(self):
+        # 과매도 기준을 45 위로 올려도 기준 이하 RSI는 첫 구간 (if rsi <= 기준 ... elif rsi <= 45)
+        assert _RSI_SCORES[_bucket_at_most(47, (50, 45))] == 0.9
+        assert _RSI_SCORES[_bucket_at_most(51, (50, 45))] == 0.1
+        # 급증 기준을 1.2 아래로 내리면 급증 조건이 먼저 (if ratio >= 기준 ... elif ratio >= 1.2)
+        assert _VOLUME_SCORES[_bucket_at_least(1.1, (1.2, 1.0))] == 0.8
+        assert _VOLUME_SCORES[_bucket_at_least(0.9, (1.2, 1.0))] == 0.2
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba 미설치")
+class TestNumbaKernels:
+    """njit으로 컴파일한 커널이 파이썬 구현과 같은 결과를 내는지 테스트"""
+
+    @pytest.mark.parametrize("seed", range(3))
+    @pytest.mark.parametrize("period", [3, 14])
+    def test_rsi_kernel_matches_python(self, seed, period):
+        close = _price_frame(120, seed)["Close"].to_numpy(copy=True)
+        close[[5, 6, 40]] = close[[4, 4, 39]]  # 변화 없는 구간 포함
+
+        np.testing.assert_allclose(
+            _rsi_kernel(close, period), _rsi_kernel.py_func(close, period), rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            _rsi_kernel(close[-100:], period), _rsi_kernel.py_func(close[-100:], period), rtol=1e-12
+        )
+
+    @pytest.mark.parametrize("gaps", [[], [2], [0, 1, 10]])
+    def test_volatility_kernel_matches_python(self, gaps):
+        close = _price_frame(40, seed=5)["Close"].to_numpy(copy=True)
+        close[gaps] = np.nan
+
+        assert _annualized_volatility(close) == pytest.approx(_annualized_volatility.py_func(close), rel=1e-12)
+        assert np.isnan(_annualized_volatility(close[:2]))